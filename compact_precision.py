@@ -0,0 +1,184 @@
+"""float32 compact-precision support for batch solves and result storage.
+
+Batch entry points (`MentorshipSolver.solve_batch`,
+`MentorshipSolver.grid_experiments`, `PhononomicsSolver.solve_batch`), the
+shared-memory backend and `sweep_results.save_results` accept
+``dtype="float32"``. The solver kernels still iterate in float64; only the
+floating-point result columns are rounded to single precision, so stored,
+cached and shared columns take half the space at no extra compute cost.
+
+``dtype="float32-emulated"`` additionally rounds coherence to single
+precision after every operator, so the cycle evolves exactly as a float32
+implementation would. It is meant for fidelity checks only: every operator
+pays a pack/unpack round trip, which makes it slower than float64.
+`validate_float32` and `validate_phononomics_float32` run a reference grid in
+float64 and in this mode and report how far the emulated results deviate.
+"""
+
+from __future__ import annotations
+
+import struct
+import warnings
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+FLOAT64 = "float64"
+FLOAT32 = "float32"
+FLOAT32_EMULATED = "float32-emulated"
+DTYPES = (FLOAT64, FLOAT32, FLOAT32_EMULATED)
+
+_FLOAT32 = struct.Struct("f")
+
+
+class PrecisionWarning(UserWarning):
+    """Warned when float32 results flip a threshold decision."""
+
+
+def to_float32(value: float) -> float:
+    """Round a Python float to the nearest float32 value."""
+
+    return _FLOAT32.unpack(_FLOAT32.pack(value))[0]
+
+
+def check_dtype(dtype: str) -> str:
+    """Validate a dtype name.
+
+    Raises:
+        ValueError: If `dtype` is not one of `DTYPES`.
+    """
+
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}; received {dtype!r}")
+    return dtype
+
+
+def rounding(dtype: str) -> Optional[Callable[[float], float]]:
+    """Return the per-operator rounding function for `dtype`.
+
+    Only `FLOAT32_EMULATED` rounds inside the kernel; other dtypes get None.
+    """
+
+    return to_float32 if check_dtype(dtype) == FLOAT32_EMULATED else None
+
+
+def output_rounding(dtype: str) -> Optional[Callable[[float], float]]:
+    """Return the rounding applied to result columns of `dtype` (None for float64)."""
+
+    return None if check_dtype(dtype) == FLOAT64 else to_float32
+
+
+def float_typecode(dtype: str) -> str:
+    """`array` typecode used to store floating-point columns of `dtype`."""
+
+    return "d" if check_dtype(dtype) == FLOAT64 else "f"
+
+
+@dataclass
+class PrecisionReport:
+    """Deviation of float32 results from float64 over a reference grid.
+
+    Attributes:
+        lanes: Number of reference lanes compared.
+        max_coherence_deviation: Largest absolute `final_coherence` difference.
+        max_iteration_deviation: Largest absolute `iterations` difference
+            (0 for solvers without an iteration count).
+        flips: Number of lanes whose boolean decision differs, per flag.
+        flipped_lanes: Indices of lanes with any flipped decision.
+    """
+
+    lanes: int
+    max_coherence_deviation: float
+    max_iteration_deviation: int
+    flips: Dict[str, int]
+    flipped_lanes: List[int]
+
+    @property
+    def decisions_stable(self) -> bool:
+        return not self.flipped_lanes
+
+
+def compare_precision(
+    reference: Dict[str, Sequence[Any]],
+    compact: Dict[str, Sequence[Any]],
+    flags: Sequence[str],
+    warn: bool = True,
+) -> PrecisionReport:
+    """Compare float64 and float32 batch columns lane by lane."""
+
+    lanes = len(reference["final_coherence"])
+    coherence = max(
+        (abs(a - b) for a, b in zip(reference["final_coherence"], compact["final_coherence"])),
+        default=0.0,
+    )
+    iterations = max(
+        (abs(a - b) for a, b in zip(reference.get("iterations", ()), compact.get("iterations", ()))),
+        default=0,
+    )
+    flips = {}
+    flipped = set()
+    for flag in flags:
+        changed = [lane for lane in range(lanes) if bool(reference[flag][lane]) != bool(compact[flag][lane])]
+        flips[flag] = len(changed)
+        flipped.update(changed)
+
+    report = PrecisionReport(
+        lanes=lanes,
+        max_coherence_deviation=coherence,
+        max_iteration_deviation=iterations,
+        flips=flips,
+        flipped_lanes=sorted(flipped),
+    )
+    if warn and flipped:
+        summary = ", ".join(f"{flag}: {count}" for flag, count in flips.items() if count)
+        warnings.warn(
+            f"float32 flipped threshold decisions on {len(flipped)} lane(s) ({summary})",
+            PrecisionWarning,
+            stacklevel=3,
+        )
+    return report
+
+
+def validate_float32(
+    solver: Any,
+    depths: Sequence[int] = range(0, 8),
+    ethics_levels: Sequence[float] = tuple(i / 10 for i in range(11)),
+    initial_coherence: Sequence[float] = (0.1, 0.4, 0.7),
+    warn: bool = True,
+) -> PrecisionReport:
+    """Compare a `MentorshipSolver` in emulated float32 against float64 on a grid.
+
+    Reports deviations in ``final_coherence`` and ``iterations`` and flips in
+    the ``converged`` and ``audit_valid`` flags, warning with
+    `PrecisionWarning` if any flag flips.
+    """
+
+    lanes = [(c, d, e) for c in initial_coherence for d in depths for e in ethics_levels]
+    columns = ([c for c, _, _ in lanes], [d for _, d, _ in lanes], [e for _, _, e in lanes])
+    return compare_precision(
+        solver.solve_batch(*columns),
+        solver.solve_batch(*columns, dtype=FLOAT32_EMULATED),
+        flags=("converged", "audit_valid"),
+        warn=warn,
+    )
+
+
+def validate_phononomics_float32(
+    solver: Any,
+    ethics_levels: Sequence[float] = tuple(i / 20 for i in range(21)),
+    depths: Sequence[int] = range(0, 13),
+    scenario: str = "precision_validation",
+    warn: bool = True,
+) -> PrecisionReport:
+    """Compare a `PhononomicsSolver` in emulated float32 against float64 on a grid.
+
+    Reports the ``final_coherence`` deviation and ``converged`` flips.
+    """
+
+    lanes = [(e, d) for e in ethics_levels for d in depths]
+    columns = ([e for e, _ in lanes], [d for _, d in lanes])
+    return compare_precision(
+        solver.solve_batch(scenario, *columns),
+        solver.solve_batch(scenario, *columns, dtype=FLOAT32_EMULATED),
+        flags=("converged",),
+        warn=warn,
+    )
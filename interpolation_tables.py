@@ -0,0 +1,385 @@
+"""Interpolation tables for fast approximate `MentorshipSolver` queries.
+
+For a fixed solver configuration and depth, `build_table` samples the solve
+response surface over (initial coherence, ethics level) on an adaptive
+rectilinear grid: each axis starts uniform and gains midpoints wherever
+bilinear interpolation misses the exact solve by more than the tolerance.
+``final_coherence``, ``audit_score`` and ``iterations`` are stored in compact
+arrays and `InterpolationTable.query` answers by bilinear interpolation in a
+few microseconds, roughly ten times faster than iterating the operators.
+
+The error bound is checked at build time: the build finishes only once the
+midpoint of every grid cell, solved exactly, agrees with the interpolated
+value to within the tolerance, and the largest deviations seen are kept in
+`InterpolationTable.error_bound`. Cells whose corners or midpoint disagree on
+``converged`` or ``audit_valid`` straddle a decision boundary; queries landing
+in them, or outside the table, fall back to an exact solve.
+
+Example::
+
+    table = build_table(create_default_solver(), depth=3)
+    table.save("depth3.table")
+    table = load_table("depth3.table", create_default_solver())
+    answer = table.query(coherence=0.42, ethics_level=0.61)
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import json
+import math
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from mentorship_solver import MentorshipSolver, bundle_fingerprint
+
+MAGIC = b"TRMTBL\x01\n"
+_HEADER_SIZE = struct.Struct("<I")
+
+CONVERGED = 1
+AUDIT_VALID = 2
+
+QUERY_FIELDS = ("final_coherence", "iterations", "audit_score", "converged", "audit_valid", "exact")
+
+
+class TableBuildError(ValueError):
+    """Raised when a table cannot meet its tolerance within the point budget."""
+
+
+@dataclass
+class InterpolationTable:
+    """Solve results sampled on a rectilinear (coherence, ethics) grid.
+
+    Node arrays are stored coherence-major: node ``(i, j)`` is at index
+    ``i * len(ethics_axis) + j``; cell ``(i, j)`` is at
+    ``i * (len(ethics_axis) - 1) + j``.
+
+    Attributes:
+        solver: Solver used for exact fallbacks.
+        depth: Depth every entry was solved at.
+        coherence_axis: Sorted initial coherence grid points.
+        ethics_axis: Sorted ethics level grid points.
+        final_coherence: Final coherence at every node.
+        audit_score: Audit score at every node.
+        iterations: Iterations at every node.
+        flags: ``CONVERGED | AUDIT_VALID`` bits at every node.
+        boundary_cells: 1 for cells straddling a decision boundary.
+        tolerance: Absolute ``final_coherence`` and relative ``audit_score``
+            tolerance the table was built to.
+        iteration_tolerance: Allowed ``iterations`` deviation.
+        error_bound: Largest deviation observed at the cell midpoints, per
+            field (relative for ``audit_score``).
+        exact_queries: Number of queries answered by an exact solve.
+    """
+
+    solver: MentorshipSolver = field(compare=False)
+    depth: int
+    coherence_axis: array.array
+    ethics_axis: array.array
+    final_coherence: array.array
+    audit_score: array.array
+    iterations: array.array
+    flags: array.array
+    boundary_cells: array.array
+    tolerance: float
+    iteration_tolerance: int
+    error_bound: Dict[str, float]
+    exact_queries: int = field(default=0, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.final_coherence)
+
+    def query(self, coherence: float, ethics_level: float) -> Dict[str, Any]:
+        """Approximate ``solver.solve`` at one point.
+
+        Returns:
+            Dictionary of `QUERY_FIELDS`; ``exact`` tells whether the answer
+            came from an exact solve rather than interpolation.
+        """
+
+        cs, es = self.coherence_axis, self.ethics_axis
+        if not (cs[0] <= coherence <= cs[-1] and es[0] <= ethics_level <= es[-1]):
+            return self._exact(coherence, ethics_level)
+
+        columns = len(es)
+        i = min(bisect.bisect_right(cs, coherence), len(cs) - 1) - 1
+        j = min(bisect.bisect_right(es, ethics_level), columns - 1) - 1
+        if self.boundary_cells[i * (columns - 1) + j]:
+            return self._exact(coherence, ethics_level)
+
+        tc = (coherence - cs[i]) / (cs[i + 1] - cs[i])
+        te = (ethics_level - es[j]) / (es[j + 1] - es[j])
+        w00, w01, w10, w11 = (1 - tc) * (1 - te), (1 - tc) * te, tc * (1 - te), tc * te
+        low = i * columns + j
+        high = low + columns
+
+        final, score, iterations = self.final_coherence, self.audit_score, self.iterations
+        flags = self.flags[low]
+        return {
+            "final_coherence": w00 * final[low] + w01 * final[low + 1] + w10 * final[high] + w11 * final[high + 1],
+            "iterations": round(
+                w00 * iterations[low] + w01 * iterations[low + 1]
+                + w10 * iterations[high] + w11 * iterations[high + 1]
+            ),
+            "audit_score": w00 * score[low] + w01 * score[low + 1] + w10 * score[high] + w11 * score[high + 1],
+            "converged": bool(flags & CONVERGED),
+            "audit_valid": bool(flags & AUDIT_VALID),
+            "exact": False,
+        }
+
+    def query_many(self, coherence: Sequence[float], ethics_level: Sequence[float]) -> Dict[str, List[Any]]:
+        """Approximate many points, returning one column per `QUERY_FIELDS` entry."""
+
+        if len(coherence) != len(ethics_level):
+            raise ValueError(f"query columns must share one length; got {len(coherence)} and {len(ethics_level)}")
+        columns: Dict[str, List[Any]] = {name: [] for name in QUERY_FIELDS}
+        for c, e in zip(coherence, ethics_level):
+            answer = self.query(c, e)
+            for name in QUERY_FIELDS:
+                columns[name].append(answer[name])
+        return columns
+
+    def _exact(self, coherence: float, ethics_level: float) -> Dict[str, Any]:
+        self.exact_queries += 1
+        state, iterations = self.solver.solve({"coherence": coherence}, self.depth, ethics_level)
+        return {
+            "final_coherence": state["coherence"],
+            "iterations": iterations,
+            "audit_score": state.get("audit_score", math.nan),
+            "converged": state["converged"],
+            "audit_valid": state.get("audit_valid", False),
+            "exact": True,
+        }
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the table to a binary file readable by `load_table`."""
+
+        arrays = [(name, getattr(self, name)) for name in _ARRAYS]
+        header = json.dumps({
+            "depth": self.depth,
+            "converge_threshold": self.solver.converge_threshold,
+            "max_iterations": self.solver.max_iterations,
+            "bundle": bundle_fingerprint(self.solver.operators),
+            "tolerance": self.tolerance,
+            "iteration_tolerance": self.iteration_tolerance,
+            "error_bound": self.error_bound,
+            "byteorder": sys.byteorder,
+            "arrays": [[name, values.typecode, len(values)] for name, values in arrays],
+        }).encode("utf-8")
+
+        with open(path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(_HEADER_SIZE.pack(len(header)))
+            handle.write(header)
+            for _, values in arrays:
+                handle.write(values.tobytes())
+
+
+_ARRAYS = (
+    "coherence_axis",
+    "ethics_axis",
+    "final_coherence",
+    "audit_score",
+    "iterations",
+    "flags",
+    "boundary_cells",
+)
+
+
+def load_table(path: Union[str, os.PathLike], solver: MentorshipSolver) -> InterpolationTable:
+    """Read a table written by `InterpolationTable.save`.
+
+    Args:
+        path: Table file.
+        solver: Solver for exact fallbacks; it must match the configuration
+            the table was built with.
+
+    Raises:
+        ValueError: If the file is not a table file or `solver` does not match.
+    """
+
+    with open(path, "rb") as handle:
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not an interpolation table file")
+        (size,) = _HEADER_SIZE.unpack(handle.read(_HEADER_SIZE.size))
+        header = json.loads(handle.read(size).decode("utf-8"))
+        arrays = {}
+        for name, code, length in header["arrays"]:
+            values = array.array(code)
+            values.frombytes(handle.read(values.itemsize * length))
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            arrays[name] = values
+
+    expected = (
+        json.loads(json.dumps(bundle_fingerprint(solver.operators))),
+        solver.converge_threshold,
+        solver.max_iterations,
+    )
+    if (header["bundle"], header["converge_threshold"], header["max_iterations"]) != expected:
+        raise ValueError("solver configuration does not match the one the table was built with")
+
+    return InterpolationTable(
+        solver=solver,
+        depth=header["depth"],
+        tolerance=header["tolerance"],
+        iteration_tolerance=header["iteration_tolerance"],
+        error_bound=header["error_bound"],
+        **arrays,
+    )
+
+
+def _deviation(name: str, interpolated: float, exact: float) -> float:
+    if name == "iterations":
+        return abs(round(interpolated) - exact)
+    if name == "audit_score":
+        return abs(interpolated - exact) / max(abs(exact), 1e-12)
+    return abs(interpolated - exact)
+
+
+_Sample = Tuple[float, float, int, int]
+_FIELDS = ("final_coherence", "audit_score", "iterations")
+
+
+def build_table(
+    solver: MentorshipSolver,
+    depth: int,
+    coherence_range: Tuple[float, float] = (0.0, 1.0),
+    ethics_range: Tuple[float, float] = (0.0, 1.0),
+    tolerance: float = 2e-3,
+    iteration_tolerance: int = 1,
+    initial_points: int = 5,
+    max_points: int = 1024,
+) -> InterpolationTable:
+    """Sample ``solver`` on an adaptive grid until interpolation is accurate.
+
+    Each round solves the midpoint of every cell exactly. Where interpolation
+    misses by more than the tolerance, the edge midpoints decide which axis
+    varies faster, and that axis gains the cell's midpoint. Exact samples go
+    through ``solver.solve_batch``, so a solver with a result cache reuses
+    earlier builds.
+
+    Args:
+        solver: Solver configuration to tabulate.
+        depth: Depth to tabulate (positive; depth-0 solves are immediate).
+        coherence_range: Initial coherence interval covered by the table.
+        ethics_range: Ethics level interval covered by the table.
+        tolerance: Maximum absolute ``final_coherence`` error and relative
+            ``audit_score`` error. Convergence stops at a step below
+            ``converge_threshold``, so values jump by up to that much where
+            the iteration count changes; keep the tolerance above it.
+        iteration_tolerance: Maximum ``iterations`` error after rounding.
+        initial_points: Points per axis before refinement.
+        max_points: Maximum points per axis.
+
+    Raises:
+        ValueError: If the arguments are invalid.
+        TableBuildError: If the tolerance is not met within `max_points`.
+    """
+
+    if depth < 1:
+        raise ValueError(f"depth must be positive; received {depth}")
+    if not (0.0 <= ethics_range[0] < ethics_range[1] <= 1.0):
+        raise ValueError(f"ethics_range must be an increasing interval within [0.0, 1.0]; received {ethics_range}")
+    if not coherence_range[0] < coherence_range[1]:
+        raise ValueError(f"coherence_range must be an increasing interval; received {coherence_range}")
+    if initial_points < 2:
+        raise ValueError(f"initial_points must be at least 2; received {initial_points}")
+
+    samples: Dict[Tuple[float, float], _Sample] = {}
+
+    def sample(points: Sequence[Tuple[float, float]]) -> None:
+        missing = list(dict.fromkeys(point for point in points if point not in samples))
+        if not missing:
+            return
+        batch = solver.solve_batch(
+            [c for c, _ in missing], [depth] * len(missing), [e for _, e in missing]
+        )
+        for lane, point in enumerate(missing):
+            flags = (CONVERGED if batch["converged"][lane] else 0) | (AUDIT_VALID if batch["audit_valid"][lane] else 0)
+            samples[point] = (
+                batch["final_coherence"][lane], batch["audit_score"][lane], batch["iterations"][lane], flags
+            )
+
+    def miss(corners: Sequence[_Sample], exact: _Sample) -> float:
+        """Worst deviation of the corners' mean from `exact`, in tolerance units."""
+
+        worst = 0.0
+        for index, name in enumerate(_FIELDS):
+            limit = iteration_tolerance if name == "iterations" else tolerance
+            interpolated = sum(corner[index] for corner in corners) / len(corners)
+            worst = max(worst, _deviation(name, interpolated, exact[index]) / max(limit, 1e-300))
+        return worst
+
+    def linspace(low: float, high: float) -> List[float]:
+        return [low + (high - low) * k / (initial_points - 1) for k in range(initial_points)]
+
+    cs = linspace(*coherence_range)
+    es = linspace(*ethics_range)
+    while True:
+        midpoints = {
+            (i, j): ((cs[i] + cs[i + 1]) / 2, (es[j] + es[j + 1]) / 2)
+            for i in range(len(cs) - 1)
+            for j in range(len(es) - 1)
+        }
+        sample([(c, e) for c in cs for e in es] + list(midpoints.values()))
+
+        bound = {name: 0.0 for name in _FIELDS}
+        failing = []
+        for (i, j), middle in midpoints.items():
+            corners = [samples[cs[i + a], es[j + b]] for a in (0, 1) for b in (0, 1)]
+            exact = samples[middle]
+            for index, name in enumerate(_FIELDS):
+                interpolated = sum(corner[index] for corner in corners) / 4
+                bound[name] = max(bound[name], _deviation(name, interpolated, exact[index]))
+            if miss(corners, exact) > 1.0:
+                failing.append((i, j))
+        if not failing:
+            break
+
+        sample(
+            [((cs[i] + cs[i + 1]) / 2, es[j]) for i, j in failing]
+            + [(cs[i], (es[j] + es[j + 1]) / 2) for i, j in failing]
+        )
+        new_cs, new_es = set(), set()
+        for i, j in failing:
+            c_mid, e_mid = midpoints[i, j]
+            along_c = miss([samples[cs[i], es[j]], samples[cs[i + 1], es[j]]], samples[c_mid, es[j]])
+            along_e = miss([samples[cs[i], es[j]], samples[cs[i], es[j + 1]]], samples[cs[i], e_mid])
+            if along_c >= along_e / 2:
+                new_cs.add(c_mid)
+            if along_e >= along_c / 2:
+                new_es.add(e_mid)
+        if len(cs) + len(new_cs) > max_points or len(es) + len(new_es) > max_points:
+            raise TableBuildError(
+                f"tolerance {tolerance} not met within {max_points} points per axis "
+                f"(largest deviations: {bound})"
+            )
+        cs = sorted(set(cs) | new_cs)
+        es = sorted(set(es) | new_es)
+
+    nodes = [samples[c, e] for c in cs for e in es]
+    boundary = array.array("b", bytes((len(cs) - 1) * (len(es) - 1)))
+    for (i, j), middle in midpoints.items():
+        corners = [samples[cs[i + a], es[j + b]] for a in (0, 1) for b in (0, 1)]
+        if len({corner[3] for corner in corners} | {samples[middle][3]}) > 1:
+            boundary[i * (len(es) - 1) + j] = 1
+
+    return InterpolationTable(
+        solver=solver,
+        depth=depth,
+        coherence_axis=array.array("d", cs),
+        ethics_axis=array.array("d", es),
+        final_coherence=array.array("d", (node[0] for node in nodes)),
+        audit_score=array.array("d", (node[1] for node in nodes)),
+        iterations=array.array("i", (node[2] for node in nodes)),
+        flags=array.array("b", (node[3] for node in nodes)),
+        boundary_cells=boundary,
+        tolerance=tolerance,
+        iteration_tolerance=iteration_tolerance,
+        error_bound=bound,
+    )
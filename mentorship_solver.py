@@ -5,13 +5,28 @@ This module implements a mentorship solver with configurable operator strategies
 based on the Terminomics coherence architecture.
 """
 
-from typing import Protocol, Dict, Any, Tuple, Optional
-from dataclasses import dataclass, field
+from typing import (
+    Protocol, Dict, Any, Tuple, Optional, List, Mapping, Sequence,
+    ClassVar, FrozenSet, Iterable, Callable
+)
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+import heapq
 import math
+import time
+
+from compact_precision import FLOAT64, check_dtype, output_rounding, rounding
 
 
 class OperatorStrategy(Protocol):
-    """Protocol defining the interface for operator strategies."""
+    """
+    Protocol defining the interface for operator strategies.
+    
+    Strategies may additionally declare the state fields they read and write
+    as ``reads`` and ``writes`` class attributes. The solver uses these
+    declarations to run observation-only strategies once on the final state
+    instead of on every iteration; strategies without declarations always
+    run on every iteration.
+    """
     
     def apply(self, state: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -31,6 +46,9 @@ class OperatorStrategy(Protocol):
 class ResonateStrategy:
     """Strategy for resonance operations - harmonizing patterns across domains."""
     
+    reads: ClassVar[FrozenSet[str]] = frozenset({'coherence'})
+    writes: ClassVar[FrozenSet[str]] = frozenset({'coherence', 'resonance_applied'})
+    
     resonance_factor: float = 0.8
     
     def apply(self, state: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,27 +71,37 @@ class ResonateStrategy:
 class MeasureStrategy:
     """Strategy for measurement operations - quantifying system properties."""
     
+    reads: ClassVar[FrozenSet[str]] = frozenset({'coherence'})
+    writes: ClassVar[FrozenSet[str]] = frozenset({'measured_coherence', 'measurement_applied'})
+    
     precision: float = 0.95
     
     def apply(self, state: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Apply measurement to quantify state properties."""
-        coherence = state.get('coherence', 0.5)
-        ethics_level = context.get('ethics_level', 0.5)
-        
-        # Measurement accuracy depends on precision and ethics
-        measured_value = coherence * self.precision * (0.5 + 0.5 * ethics_level)
+        measured_value = self.evaluate(
+            state.get('coherence', 0.5),
+            context.get('ethics_level', 0.5)
+        )
         
         return {
             **state,
             'measured_coherence': measured_value,
             'measurement_applied': True
         }
+    
+    def evaluate(self, coherence: float, ethics_level: float) -> float:
+        """Return the measured coherence for a coherence and ethics level."""
+        # Measurement accuracy depends on precision and ethics
+        return coherence * self.precision * (0.5 + 0.5 * ethics_level)
 
 
 @dataclass
 class AdaptStrategy:
     """Strategy for adaptation operations - evolving system structure."""
     
+    reads: ClassVar[FrozenSet[str]] = frozenset({'coherence'})
+    writes: ClassVar[FrozenSet[str]] = frozenset({'coherence', 'adaptation_applied'})
+    
     adaptation_rate: float = 0.6
     
     def apply(self, state: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -99,23 +127,31 @@ class AdaptStrategy:
 class AuditStrategy:
     """Strategy for audit operations - validating system integrity."""
     
+    reads: ClassVar[FrozenSet[str]] = frozenset({'coherence'})
+    writes: ClassVar[FrozenSet[str]] = frozenset({'audit_valid', 'audit_score', 'audit_applied'})
+    
     audit_threshold: float = 0.7
     
     def apply(self, state: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Apply audit to validate system integrity."""
-        coherence = state.get('coherence', 0.5)
-        ethics_level = context.get('ethics_level', 0.5)
-        
-        # Audit validates if coherence meets threshold adjusted by ethics
-        effective_threshold = self.audit_threshold * ethics_level
-        is_valid = coherence >= effective_threshold
+        is_valid, score = self.evaluate(
+            state.get('coherence', 0.5),
+            context.get('ethics_level', 0.5)
+        )
         
         return {
             **state,
             'audit_valid': is_valid,
-            'audit_score': coherence / max(0.01, effective_threshold),
+            'audit_score': score,
             'audit_applied': True
         }
+    
+    def evaluate(self, coherence: float, ethics_level: float) -> Tuple[bool, float]:
+        """Return ``(audit_valid, audit_score)`` for a coherence and ethics level."""
+        # Audit validates if coherence meets threshold adjusted by ethics
+        effective_threshold = self.audit_threshold * ethics_level
+        is_valid = coherence >= effective_threshold
+        return is_valid, coherence / max(0.01, effective_threshold)
 
 
 @dataclass
@@ -128,19 +164,341 @@ class OperatorBundle:
     audit: AuditStrategy = field(default_factory=AuditStrategy)
 
 
+BUNDLE_SLOTS = ('resonate', 'measure', 'adapt', 'audit')
+
+
+LOOP_CARRIED_FIELDS = frozenset({'coherence'})
+
+
+def declared_dependencies(
+    strategy: Any
+) -> Optional[Tuple[FrozenSet[str], FrozenSet[str]]]:
+    """
+    Return a strategy's declared ``(reads, writes)`` state fields.
+    
+    Declarations describe an ``apply`` method, so they are only trusted when
+    they are made by the class that defines ``apply`` or by a subclass of it.
+    A subclass that overrides ``apply`` without redeclaring both fields
+    counts as undeclared rather than inheriting its base class's promises.
+    
+    Args:
+        strategy: Operator strategy instance
+        
+    Returns:
+        Tuple of (reads, writes), or None if the strategy does not declare both
+    """
+    mro = type(strategy).__mro__
+    
+    def declaring_class(name: str) -> int:
+        return next((index for index, cls in enumerate(mro) if name in vars(cls)), len(mro))
+    
+    applies = declaring_class('apply')
+    if declaring_class('reads') > applies or declaring_class('writes') > applies:
+        return None
+    reads = getattr(strategy, 'reads', None)
+    writes = getattr(strategy, 'writes', None)
+    if reads is None or writes is None:
+        return None
+    return frozenset(reads), frozenset(writes)
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Order in which a solver applies its strategies.
+    
+    Attributes:
+        loop: Strategies applied on every iteration, in bundle order
+        deferred: Observation-only strategies applied once to the final state
+            (and at any requested checkpoints), in bundle order
+    """
+    
+    loop: Tuple[Any, ...]
+    deferred: Tuple[Any, ...]
+
+
+def build_execution_plan(operators: OperatorBundle) -> ExecutionPlan:
+    """
+    Split a bundle into per-iteration and observation-only strategies.
+    
+    A strategy is observation-only when it declares its dependencies,
+    nothing it writes is read by the convergence check or by any other
+    strategy, or written by any other strategy, and no strategy after it in
+    bundle order writes a field it reads. The last condition keeps bundle
+    order: a deferred strategy sees the final state, which must equal what it
+    would have seen at its own position in the last iteration (so the
+    default ``MeasureStrategy``, which reads coherence before
+    ``AdaptStrategy`` updates it, stays in the loop). If any strategy lacks
+    declarations, its reads are unknown and every strategy stays in the loop.
+    
+    Args:
+        operators: Operator bundle to plan
+        
+    Returns:
+        ExecutionPlan for the bundle
+    """
+    strategies = [getattr(operators, slot) for slot in BUNDLE_SLOTS]
+    dependencies = [declared_dependencies(strategy) for strategy in strategies]
+    if any(declared is None for declared in dependencies):
+        return ExecutionPlan(loop=tuple(strategies), deferred=())
+    
+    loop, deferred = [], []
+    for index, strategy in enumerate(strategies):
+        reads, writes = dependencies[index]
+        observed = set(LOOP_CARRIED_FIELDS)
+        for other, (other_reads, other_writes) in enumerate(dependencies):
+            if other != index:
+                observed |= other_reads | other_writes
+        overwritten = set()
+        for _, later_writes in dependencies[index + 1:]:
+            overwritten |= later_writes
+        (loop if writes & observed or reads & overwritten else deferred).append(strategy)
+    return ExecutionPlan(loop=tuple(loop), deferred=tuple(deferred))
+
+
+BATCH_COLUMNS = (
+    'final_coherence',
+    'iterations',
+    'converged',
+    'audit_valid',
+    'audit_score',
+    'measured_coherence'
+)
+
+
+def apply_bundle_overrides(
+    operators: OperatorBundle,
+    overrides: Mapping[str, Any]
+) -> OperatorBundle:
+    """
+    Return a copy of a bundle with strategy parameters replaced.
+    
+    Args:
+        operators: Bundle to copy
+        overrides: Mapping of ``'<slot>.<parameter>'`` names to new values,
+            e.g. ``{'resonate.resonance_factor': 0.9}``
+        
+    Returns:
+        New OperatorBundle with the overridden strategies
+        
+    Raises:
+        ValueError: If a name does not address a known slot
+    """
+    changes: Dict[str, Dict[str, Any]] = {}
+    for name, value in overrides.items():
+        slot, _, parameter = name.partition('.')
+        if slot not in BUNDLE_SLOTS or not parameter:
+            raise ValueError(f"unknown strategy parameter: {name}")
+        changes.setdefault(slot, {})[parameter] = value
+    
+    return replace(operators, **{
+        slot: replace(getattr(operators, slot), **params)
+        for slot, params in changes.items()
+    })
+
+
+def _strategy_params(strategy: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Return the sorted (name, value) parameters of a strategy instance."""
+    if is_dataclass(strategy):
+        items = [(f.name, getattr(strategy, f.name)) for f in fields(strategy)]
+    else:
+        items = list(getattr(strategy, '__dict__', {}).items())
+    return tuple(sorted(items))
+
+
+def bundle_fingerprint(operators: OperatorBundle) -> Tuple:
+    """
+    Compute a hashable fingerprint of an operator bundle.
+    
+    The fingerprint records, for each slot, the strategy class and its
+    parameters, so two bundles share a fingerprint exactly when they would
+    drive the solver identically.
+    
+    Args:
+        operators: Operator bundle to fingerprint
+        
+    Returns:
+        Nested tuple of (slot, strategy class name, parameters)
+    """
+    return tuple(
+        (slot, type(strategy).__name__, _strategy_params(strategy))
+        for slot, strategy in ((s, getattr(operators, s)) for s in BUNDLE_SLOTS)
+    )
+
+
+def _fingerprint_shape(fingerprint: Tuple) -> Tuple:
+    """Strip parameter values from a fingerprint, keeping its structure."""
+    return tuple(
+        (slot, name, tuple(key for key, _ in params))
+        for slot, name, params in fingerprint
+    )
+
+
+def _fingerprint_distance(a: Tuple, b: Tuple) -> float:
+    """
+    Largest absolute parameter difference between two same-shaped fingerprints.
+    
+    Non-numeric parameters must match exactly; otherwise the distance is
+    infinite.
+    """
+    distance = 0.0
+    for (_, _, params_a), (_, _, params_b) in zip(a, b):
+        for (_, value_a), (_, value_b) in zip(params_a, params_b):
+            if isinstance(value_a, (int, float)) and isinstance(value_b, (int, float)):
+                distance = max(distance, abs(value_a - value_b))
+            elif value_a != value_b:
+                return math.inf
+    return distance
+
+
+@dataclass
+class FixedPointRecord:
+    """A converged fixed point remembered by a ContinuationStore."""
+    
+    coherence: float
+    baseline_iterations: int
+
+
+class ContinuationStore:
+    """
+    Store of converged fixed points used to warm-start continuation solves.
+    
+    Fixed points are keyed by bundle fingerprint and then by
+    ``(depth, ethics_level)``. When a bundle's parameters are nudged, lookups
+    fall back to the nearest stored bundle of the same shape, measured as the
+    largest absolute difference between strategy parameters.
+    """
+    
+    def __init__(self, max_distance: Optional[float] = None):
+        """
+        Initialize an empty store.
+        
+        Args:
+            max_distance: Largest parameter distance accepted when seeding from
+                a different bundle (unbounded if None)
+        """
+        self.max_distance = max_distance
+        self.iterations_saved = 0
+        self._points: Dict[Tuple, Dict[Tuple[int, float], FixedPointRecord]] = {}
+    
+    def __len__(self) -> int:
+        return sum(len(points) for points in self._points.values())
+    
+    def record(
+        self,
+        fingerprint: Tuple,
+        depth: int,
+        ethics_level: float,
+        coherence: float,
+        baseline_iterations: int
+    ) -> None:
+        """
+        Remember a converged fixed point.
+        
+        Args:
+            fingerprint: Fingerprint of the bundle that produced the point
+            depth: Depth of the solve
+            ethics_level: Ethics level of the solve
+            coherence: Converged coherence
+            baseline_iterations: Iterations a cold start needed to reach it
+        """
+        self._points.setdefault(fingerprint, {})[(depth, ethics_level)] = FixedPointRecord(
+            coherence=coherence,
+            baseline_iterations=baseline_iterations
+        )
+    
+    def nearest(
+        self,
+        fingerprint: Tuple,
+        depth: int,
+        ethics_level: float
+    ) -> Optional[FixedPointRecord]:
+        """
+        Find the stored fixed point closest to the given bundle.
+        
+        Args:
+            fingerprint: Fingerprint of the bundle being solved
+            depth: Depth of the solve
+            ethics_level: Ethics level of the solve
+            
+        Returns:
+            The nearest FixedPointRecord, or None if no candidate qualifies
+        """
+        key = (depth, ethics_level)
+        exact = self._points.get(fingerprint, {}).get(key)
+        if exact is not None:
+            return exact
+        
+        shape = _fingerprint_shape(fingerprint)
+        best: Optional[FixedPointRecord] = None
+        best_distance = math.inf
+        for candidate, points in self._points.items():
+            record = points.get(key)
+            if record is None or _fingerprint_shape(candidate) != shape:
+                continue
+            distance = _fingerprint_distance(fingerprint, candidate)
+            if distance < best_distance:
+                best, best_distance = record, distance
+        
+        if self.max_distance is not None and best_distance > self.max_distance:
+            return None
+        return best
+
+
+@dataclass
+class RecursionLevel:
+    """
+    Cost of one level of a recursive solve.
+    
+    Attributes:
+        depth: Depth of the level's sub-solves
+        solves: Distinct sub-solves computed at this level by the call
+        references: Times a parent at the level above needed a sub-solve from
+            this level; references beyond ``solves`` were served from the memo
+        iterations: Operator iterations spent on this level's solves
+        unconverged: Solves at this level that hit ``max_iterations``
+    """
+    
+    depth: int
+    solves: int = 0
+    references: int = 0
+    iterations: int = 0
+    unconverged: int = 0
+
+
+@dataclass
+class _LaneProgress:
+    """Best-so-far state of a batch lane solved under a time budget."""
+    
+    solver: 'MentorshipSolver'
+    state: Dict[str, Any]
+    context: Dict[str, Any]
+    iterations: int = 0
+    residual: float = math.nan
+
+
 class MentorshipSolver:
     """
     MentorshipSolver v4.0 - Coherence-based solver with pluggable operators.
     
     This solver implements recursive mentorship patterns using configurable
     operator strategies for resonance, measurement, adaptation, and audit.
+    
+    Attributes:
+        deadline_check_interval: Iterations between clock checks when a solve
+            runs under a ``time_budget``
     """
     
+    deadline_check_interval: ClassVar[int] = 8
+    
     def __init__(
         self,
         operators: Optional[OperatorBundle] = None,
         converge_threshold: float = 0.001,
-        max_iterations: int = 100
+        max_iterations: int = 100,
+        continuation_store: Optional[ContinuationStore] = None,
+        metrics: Optional[Any] = None,
+        cache: Optional[Any] = None
     ):
         """
         Initialize the MentorshipSolver.
@@ -149,65 +507,997 @@ class MentorshipSolver:
             operators: Bundle of operator strategies (uses defaults if None)
             converge_threshold: Threshold for convergence detection
             max_iterations: Maximum number of iterations
+            continuation_store: Store of prior fixed points; when given, the
+                solver runs in continuation mode and warm-starts each solve
+                from the nearest stored fixed point
+            metrics: Optional ``solver_metrics.SolverMetrics`` recording the
+                latency and outcome of every solve and the size of every batch
+            cache: Optional ``result_cache.ResultCache``; batch solves serve
+                previously solved lanes from it and store new ones
         """
         self.operators = operators or OperatorBundle()
         self.converge_threshold = converge_threshold
         self.max_iterations = max_iterations
+        self.continuation_store = continuation_store
+        self.metrics = metrics
+        self.cache = cache
+        self._plan_key: Optional[Tuple[int, ...]] = None
+        self._plan: Optional[ExecutionPlan] = None
+    
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Return the execution plan for the current operator bundle.
+        
+        The plan is rebuilt whenever a strategy in the bundle is replaced.
+        """
+        key = tuple(id(getattr(self.operators, slot)) for slot in BUNDLE_SLOTS)
+        if key != self._plan_key:
+            self._plan = build_execution_plan(self.operators)
+            self._plan_key = key
+        return self._plan
     
     def solve(
         self,
         initial_state: Dict[str, Any],
         depth: int = 0,
-        ethics_level: float = 0.5
+        ethics_level: float = 0.5,
+        checkpoints: Optional[Iterable[int]] = None,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None
     ) -> Tuple[Dict[str, Any], int]:
         """
         Solve for coherent state using mentorship operators.
         
+        Observation-only strategies (see ``execution_plan``), by default
+        ``AuditStrategy``, run once on the final state
+        rather than on every iteration. Their outputs can also be captured at
+        chosen iterations with ``checkpoints``; the final state then carries a
+        ``checkpoints`` mapping of iteration number to observed fields.
+        
+        In continuation mode the final state also carries ``warm_started``
+        (whether the solve was seeded from a stored fixed point) and
+        ``iterations_saved`` (iterations avoided relative to the cold start
+        that originally produced the seed). Convergence is still judged by
+        ``converge_threshold`` on the seeded iteration.
+        
+        With a ``time_budget`` the solve is anytime: the clock is checked
+        every ``deadline_check_interval`` iterations, and once the budget is
+        spent the best-so-far state is returned with ``converged`` False. The
+        final state then also carries ``deadline_hit`` and ``residual``, the
+        last ``|Δcoherence|``.
+        
         Args:
             initial_state: Initial system state
             depth: Recursion depth (0 for base case)
             ethics_level: Ethical alignment parameter (0.0 to 1.0)
+            checkpoints: Optional iteration numbers at which to record the
+                observation-only strategies' outputs
+            dtype: ``'float64'``, ``'float32'`` or ``'float32-emulated'``;
+                only the emulated mode changes a solve, rounding coherence to
+                single precision after every operator (see
+                ``compact_precision``)
+            time_budget: Optional wall-clock budget in seconds
             
         Returns:
             Tuple of (final_state, iterations_taken)
             
         Raises:
-            ValueError: If ethics_level is out of bounds [0.0, 1.0]
+            ValueError: If ethics_level is out of bounds [0.0, 1.0], dtype is
+                unknown or time_budget is negative
         """
         if not (0.0 <= ethics_level <= 1.0):
             raise ValueError(f"ethics_level must be in [0.0, 1.0], got {ethics_level}")
+        if time_budget is not None and time_budget < 0:
+            raise ValueError(f"time_budget must be non-negative, got {time_budget}")
+        cast = rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None or time_budget is not None else 0.0
+        deadline = None if time_budget is None else started + time_budget
         
         state = initial_state.copy()
-        context = {'depth': depth, 'ethics_level': ethics_level}
+        context = {
+            'depth': depth,
+            'ethics_level': ethics_level if cast is None else cast(ethics_level)
+        }
         
         # Special case for depth=0: immediate return with identity
         if depth == 0:
             state['converged'] = True
             state['iterations'] = 0
-            return state, 0
+            iterations = 0
+            if deadline is not None:
+                state['deadline_hit'] = False
+                state['residual'] = 0.0
+        elif self.continuation_store is not None:
+            state, iterations = self._solve_continued(
+                state, context, frozenset(checkpoints or ()), cast, deadline
+            )
+        else:
+            state, iterations = self._iterate(
+                state, context, frozenset(checkpoints or ()), cast, deadline
+            )
+        
+        if self.metrics is not None:
+            self.metrics.record_solve(
+                'mentorship',
+                time.perf_counter() - started,
+                iterations,
+                state['converged'],
+                state.get('audit_valid', False)
+            )
+        return state, iterations
+    
+    def solve_recursive(
+        self,
+        initial_state: Dict[str, Any],
+        depth: int,
+        ethics_level: float = 0.5,
+        branching: int = 2,
+        ethics_spread: float = 0.0,
+        coherence_bucket: float = 1e-3,
+        memo: Optional[Dict[Tuple[int, float, int], Tuple[float, int, bool]]] = None,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Solve a recursive mentorship tree rooted at ``depth``.
         
-        # Iterative convergence process
-        for iteration in range(self.max_iterations):
+        In ``solve``, depth only damps the operators. Here a depth-d mentor
+        has ``branching`` mentees at depth d-1, each starting from the
+        mentor's initial coherence, and the mentor's iteration is seeded with
+        the mean of their converged coherences; depth-0 mentees are the base
+        case and keep their initial coherence. With a non-zero
+        ``ethics_spread``, mentee ethics levels step by ``ethics_spread``
+        around the mentor's (clamped to [0.0, 1.0]).
+        
+        Every sub-solve is memoized by ``(depth, ethics_level, coherence
+        bucket)``, so shared subtrees are solved once: a tree of uniform
+        ethics costs one solve per level rather than ``branching ** depth``.
+        Every mentor, the root included, iterates from the mean of its
+        mentees' results rather than from its own initial coherence, and the
+        depth-0 leaves start from the centre of the root coherence's bucket,
+        so the root's exact coherence only enters through that rounding
+        (``coherence_bucket=0`` seeds the leaves exactly; a depth-0 root is
+        returned as given). The tree is evaluated with an explicit stack, so
+        depth is not limited by Python's recursion limit.
+        
+        A ``time_budget`` bounds the whole tree (see ``solve``): sub-solves
+        cut off by it seed their mentors with their best-so-far coherence, and
+        a call in which any sub-solve was cut off leaves ``memo`` as it found
+        it.
+        
+        Args:
+            initial_state: Initial state of the root mentor
+            depth: Depth of the root
+            ethics_level: Ethics level of the root (0.0 to 1.0)
+            branching: Mentees per mentor
+            ethics_spread: Step between mentee ethics levels
+            coherence_bucket: Width of the coherence buckets keying the memo;
+                0 keys sub-solves by their exact initial coherence
+            memo: Optional memo table to reuse across calls; it must only be
+                shared between calls with the same solver configuration,
+                ``branching``, ``ethics_spread``, ``coherence_bucket`` and
+                ``dtype``
+            dtype: ``'float64'`` or ``'float32'`` (see ``solve``)
+            time_budget: Optional wall-clock budget in seconds for the tree
+            
+        Returns:
+            Tuple of (final_state, iterations) for the root. The final state
+            also carries ``levels``, a list of RecursionLevel costs from depth
+            0 to ``depth``, and ``tree_iterations``, the iterations of every
+            solve computed by this call. With a ``time_budget`` it carries
+            ``deadline_hit``, True if any solve in the tree was cut off, and
+            the root's ``residual``.
+            
+        Raises:
+            ValueError: If ethics_level is out of bounds [0.0, 1.0], depth is
+                negative, branching is below 1, coherence_bucket is negative,
+                time_budget is negative or dtype is unknown
+        """
+        if not (0.0 <= ethics_level <= 1.0):
+            raise ValueError(f"ethics_level must be in [0.0, 1.0], got {ethics_level}")
+        if depth < 0:
+            raise ValueError(f"depth must be non-negative, got {depth}")
+        if branching < 1:
+            raise ValueError(f"branching must be at least 1, got {branching}")
+        if coherence_bucket < 0:
+            raise ValueError(f"coherence_bucket must be non-negative, got {coherence_bucket}")
+        if time_budget is not None and time_budget < 0:
+            raise ValueError(f"time_budget must be non-negative, got {time_budget}")
+        cast = rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None or time_budget is not None else 0.0
+        deadline = None if time_budget is None else started + time_budget
+        memo = {} if memo is None else memo
+        # Memo keys added by this call, and whether a sub-solve was cut off
+        added: List[Tuple[int, float, int]] = []
+        cut = False
+        levels = [RecursionLevel(depth=level) for level in range(depth + 1)]
+        
+        coherence = initial_state.get('coherence', 0.5)
+        if coherence_bucket:
+            bucket = round(coherence / coherence_bucket)
+            start = bucket * coherence_bucket
+        else:
+            bucket = start = coherence
+        # Mentee ethics levels are offsets from the mentor's, in whole steps.
+        half = branching // 2
+        steps = [step for step in range(-half, half + 1) if step or branching % 2]
+        
+        def ethics_of(offset: int) -> float:
+            return min(1.0, max(0.0, ethics_level + offset * ethics_spread))
+        
+        def children(level: int, offset: int) -> List[Tuple[int, int]]:
+            if not ethics_spread:
+                return [(level - 1, offset)] * branching
+            return [(level - 1, offset + step) for step in steps]
+        
+        def seed(level: int, offset: int) -> float:
+            mentees = children(level, offset)
+            for child_level, child_offset in mentees:
+                levels[child_level].references += 1
+            total = sum(memo[(l, ethics_of(o), bucket)][0] for l, o in mentees)
+            return total / len(mentees)
+        
+        def iterate(coherence: float, level: int, offset: int) -> Tuple[Dict[str, Any], int]:
+            context = {'depth': level, 'ethics_level': ethics_of(offset)}
+            if cast is not None:
+                context['ethics_level'] = cast(context['ethics_level'])
+            state, iterations = self._iterate(
+                {**initial_state, 'coherence': coherence}, context, cast=cast, deadline=deadline
+            )
+            cost = levels[level]
+            cost.solves += 1
+            cost.iterations += iterations
+            cost.unconverged += not state['converged']
+            return state, iterations
+        
+        # Post-order walk over the distinct sub-solves below the root.
+        pending = list(dict.fromkeys(children(depth, 0))) if depth > 0 else []
+        while pending:
+            level, offset = pending[-1]
+            key = (level, ethics_of(offset), bucket)
+            if key in memo:
+                pending.pop()
+                continue
+            if level == 0:
+                memo[key] = (start if cast is None else cast(start), 0, True)
+                added.append(key)
+                levels[0].solves += 1
+                pending.pop()
+                continue
+            missing = [
+                child for child in dict.fromkeys(children(level, offset))
+                if (child[0], ethics_of(child[1]), bucket) not in memo
+            ]
+            if missing:
+                pending.extend(missing)
+                continue
+            state, iterations = iterate(seed(level, offset), level, offset)
+            memo[key] = (state['coherence'], iterations, state['converged'])
+            added.append(key)
+            cut = cut or state.get('deadline_hit', False)
+            pending.pop()
+        
+        if depth == 0:
+            state = {**initial_state, 'converged': True, 'iterations': 0}
+            iterations = 0
+            levels[0].solves += 1
+            if deadline is not None:
+                state['deadline_hit'] = False
+                state['residual'] = 0.0
+        else:
+            state, iterations = iterate(seed(depth, 0), depth, 0)
+        if cut:
+            # Every sub-solve above a cut one was seeded from partial results.
+            state['deadline_hit'] = True
+            for key in added:
+                del memo[key]
+        state['levels'] = levels
+        state['tree_iterations'] = sum(cost.iterations for cost in levels)
+        
+        if self.metrics is not None:
+            self.metrics.record_solve(
+                'mentorship',
+                time.perf_counter() - started,
+                iterations,
+                state['converged'],
+                state.get('audit_valid', False)
+            )
+        return state, iterations
+    
+    def solve_multi(
+        self,
+        initial_state: Dict[str, Any],
+        thresholds: Sequence[float],
+        max_iterations: Optional[Sequence[int]] = None,
+        depth: int = 0,
+        ethics_level: float = 0.5,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None
+    ) -> Dict[Tuple[float, int], Tuple[Dict[str, Any], int]]:
+        """
+        Solve once for several convergence thresholds and iteration caps.
+        
+        The iterates do not depend on the threshold, so the operator cycle
+        runs once, up to the strictest threshold or the largest cap, and the
+        state is snapshotted at the first iteration where ``|Δcoherence|``
+        falls below each threshold and at each cap. Observation-only
+        strategies then run on each snapshot. The continuation store is not
+        consulted: every setting is solved cold.
+        
+        With a ``time_budget`` (see ``solve``), settings still running when
+        the budget is spent get the best-so-far state; every state then
+        carries ``deadline_hit`` and ``residual``.
+        
+        Args:
+            initial_state: Initial system state
+            thresholds: Convergence thresholds to report
+            max_iterations: Iteration caps to report (defaults to this
+                solver's ``max_iterations``)
+            depth: Recursion depth (0 for base case)
+            ethics_level: Ethical alignment parameter (0.0 to 1.0)
+            dtype: ``'float64'`` or ``'float32'`` (see ``solve``)
+            time_budget: Optional wall-clock budget in seconds
+            
+        Returns:
+            Mapping of ``(threshold, max_iterations)`` to the
+            ``(final_state, iterations)`` that ``solve`` returns on a solver
+            with those settings, for every threshold and cap
+            
+        Raises:
+            ValueError: If ethics_level is out of bounds [0.0, 1.0],
+                thresholds or caps are empty, a cap or time_budget is negative
+                or dtype is unknown
+        """
+        if not (0.0 <= ethics_level <= 1.0):
+            raise ValueError(f"ethics_level must be in [0.0, 1.0], got {ethics_level}")
+        thresholds = sorted(set(thresholds), reverse=True)
+        caps = sorted(set(max_iterations if max_iterations is not None else (self.max_iterations,)))
+        if not thresholds or not caps:
+            raise ValueError("solve_multi needs at least one threshold and one iteration cap")
+        if caps[0] < 0:
+            raise ValueError(f"iteration caps must be non-negative, got {caps[0]}")
+        if time_budget is not None and time_budget < 0:
+            raise ValueError(f"time_budget must be non-negative, got {time_budget}")
+        cast = rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None or time_budget is not None else 0.0
+        deadline = None if time_budget is None else started + time_budget
+        
+        state = initial_state.copy()
+        context = {
+            'depth': depth,
+            'ethics_level': ethics_level if cast is None else cast(ethics_level)
+        }
+        if depth == 0:
+            if deadline is not None:
+                state.update(deadline_hit=False, residual=0.0)
+            results = {
+                (threshold, cap): ({**state, 'converged': True, 'iterations': 0}, 0)
+                for threshold in thresholds for cap in caps
+            }
+            strictest = results[(thresholds[-1], caps[-1])]
+        else:
+            plan = self.execution_plan()
+            if cast is not None:
+                state['coherence'] = cast(state.get('coherence', 0.5))
+            # Iteration at which each threshold is first met, and the state
+            # and |Δcoherence| after each iteration that some setting stops at.
+            met: Dict[float, int] = {}
+            snapshots: Dict[int, Dict[str, Any]] = {0: state}
+            residuals: Dict[int, float] = {0: math.nan}
+            cap_set = set(caps)
+            unmet = list(thresholds)
+            # Last iteration run, if the deadline stopped the cycle early
+            cutoff = None
+            for iteration in range(1, caps[-1] + 1):
+                prev_coherence = state.get('coherence', 0.5)
+                for strategy in plan.loop:
+                    state = strategy.apply(state, context)
+                    if cast is not None:
+                        state['coherence'] = cast(state.get('coherence', 0.5))
+                delta = abs(state.get('coherence', 0.5) - prev_coherence)
+                
+                while unmet and delta < unmet[0]:
+                    met[unmet.pop(0)] = iteration
+                    snapshots[iteration] = state
+                    residuals[iteration] = delta
+                if iteration in cap_set:
+                    snapshots[iteration] = state
+                    residuals[iteration] = delta
+                if not unmet:
+                    break
+                if (
+                    deadline is not None
+                    and iteration % self.deadline_check_interval == 0
+                    and time.perf_counter() >= deadline
+                ):
+                    cutoff = iteration
+                    snapshots[iteration] = state
+                    residuals[iteration] = delta
+                    break
+            
+            results = {}
+            finals: Dict[Tuple[int, bool, bool], Tuple[Dict[str, Any], int]] = {}
+            for threshold in thresholds:
+                for cap in caps:
+                    stop = met.get(threshold, math.inf)
+                    converged = stop <= cap
+                    iterations = stop if converged else cap
+                    deadline_hit = cutoff is not None and iterations > cutoff
+                    if deadline_hit:
+                        iterations = cutoff
+                    final = finals.get((iterations, converged, deadline_hit))
+                    if final is None:
+                        final_state = snapshots[iterations]
+                        if iterations > 0:
+                            for strategy in plan.deferred:
+                                final_state = strategy.apply(final_state, context)
+                        final_state = {**final_state, 'converged': converged, 'iterations': iterations}
+                        if deadline is not None:
+                            final_state['deadline_hit'] = deadline_hit
+                            final_state['residual'] = residuals[iterations]
+                        final = finals[(iterations, converged, deadline_hit)] = (final_state, iterations)
+                    results[(threshold, cap)] = (dict(final[0]), final[1])
+            strictest = results[(thresholds[-1], caps[-1])]
+        
+        if self.metrics is not None:
+            final_state, iterations = strictest
+            self.metrics.record_solve(
+                'mentorship',
+                time.perf_counter() - started,
+                iterations,
+                final_state['converged'],
+                final_state.get('audit_valid', False)
+            )
+        return results
+    
+    def _solve_continued(
+        self,
+        state: Dict[str, Any],
+        context: Dict[str, Any],
+        checkpoints: FrozenSet[int],
+        cast: Optional[Callable[[float], float]],
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """Solve in continuation mode, seeding from and updating the store."""
+        store = self.continuation_store
+        depth, ethics_level = context['depth'], context['ethics_level']
+        fingerprint = bundle_fingerprint(self.operators)
+        seed = store.nearest(fingerprint, depth, ethics_level)
+        if seed is not None:
+            state['coherence'] = seed.coherence
+        
+        state, iterations = self._iterate(state, context, checkpoints, cast, deadline)
+        
+        if seed is None:
+            baseline = iterations
+            saved = 0
+        else:
+            baseline = seed.baseline_iterations
+            saved = max(0, baseline - iterations)
+            store.iterations_saved += saved
+        
+        if state['converged']:
+            store.record(fingerprint, depth, ethics_level, state.get('coherence', 0.5), baseline)
+        
+        state['warm_started'] = seed is not None
+        state['iterations_saved'] = saved
+        return state, iterations
+    
+    def _iterate(
+        self,
+        state: Dict[str, Any],
+        context: Dict[str, Any],
+        checkpoints: FrozenSet[int] = frozenset(),
+        cast: Optional[Callable[[float], float]] = None,
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Run the operator cycle from ``state`` until convergence.
+        
+        With a ``deadline`` (a ``time.perf_counter`` value), the clock is
+        checked every ``deadline_check_interval`` iterations and the
+        best-so-far state is returned once it has passed; the final state
+        then also carries ``deadline_hit`` and ``residual``.
+        """
+        plan = self.execution_plan()
+        if cast is not None:
+            state['coherence'] = cast(state.get('coherence', 0.5))
+        observations: Dict[int, Dict[str, Any]] = {}
+        iterations = 0
+        deadline_hit = False
+        
+        while True:
+            stop = self.max_iterations
+            if deadline is not None:
+                stop = min(stop, iterations + self.deadline_check_interval)
+            state, iterations, converged, residual = self._advance(
+                plan, state, context, iterations, stop, cast, checkpoints, observations
+            )
+            if converged or iterations >= self.max_iterations:
+                break
+            if time.perf_counter() >= deadline:
+                deadline_hit = True
+                break
+        
+        state = self._finish(plan, state, context, iterations, converged, observations)
+        if deadline is not None:
+            state['deadline_hit'] = deadline_hit
+            state['residual'] = residual
+        return state, iterations
+    
+    def _advance(
+        self,
+        plan: ExecutionPlan,
+        state: Dict[str, Any],
+        context: Dict[str, Any],
+        start: int,
+        stop: int,
+        cast: Optional[Callable[[float], float]] = None,
+        checkpoints: FrozenSet[int] = frozenset(),
+        observations: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Tuple[Dict[str, Any], int, bool, float]:
+        """
+        Run iterations ``start + 1`` to ``stop`` of the operator cycle.
+        
+        Returns:
+            Tuple of (state, iterations completed, converged, last
+            ``|Δcoherence|``); the residual is NaN if no iteration ran
+        """
+        residual = math.nan
+        for iteration in range(start, stop):
             prev_coherence = state.get('coherence', 0.5)
             
-            # Apply operator sequence: Resonate -> Measure -> Adapt -> Audit
-            state = self.operators.resonate.apply(state, context)
-            state = self.operators.measure.apply(state, context)
-            state = self.operators.adapt.apply(state, context)
-            state = self.operators.audit.apply(state, context)
+            # Apply the per-iteration operators in bundle order
+            # (Resonate -> Measure -> Adapt for the default bundle)
+            for strategy in plan.loop:
+                state = strategy.apply(state, context)
+                if cast is not None:
+                    state['coherence'] = cast(state.get('coherence', 0.5))
+            
+            if iteration + 1 in checkpoints and plan.deferred:
+                observations[iteration + 1] = self._observe(state, context, plan)
             
             curr_coherence = state.get('coherence', 0.5)
+            residual = abs(curr_coherence - prev_coherence)
             
             # Check for convergence
-            if abs(curr_coherence - prev_coherence) < self.converge_threshold:
-                state['converged'] = True
-                state['iterations'] = iteration + 1
-                return state, iteration + 1
+            if residual < self.converge_threshold:
+                return state, iteration + 1, True, residual
+        return state, max(start, stop), False, residual
+    
+    @staticmethod
+    def _finish(
+        plan: ExecutionPlan,
+        state: Dict[str, Any],
+        context: Dict[str, Any],
+        iterations: int,
+        converged: bool,
+        observations: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Apply the observation-only strategies and record the outcome."""
+        # Observation-only operators (Audit by default) see the final state
+        if iterations > 0:
+            for strategy in plan.deferred:
+                state = strategy.apply(state, context)
+        if observations:
+            state['checkpoints'] = observations
+        
+        state['converged'] = converged
+        state['iterations'] = iterations
+        return state
+    
+    @staticmethod
+    def _observe(
+        state: Dict[str, Any],
+        context: Dict[str, Any],
+        plan: ExecutionPlan
+    ) -> Dict[str, Any]:
+        """Apply deferred strategies to a snapshot and keep only their outputs."""
+        observed = state
+        written = set()
+        for strategy in plan.deferred:
+            observed = strategy.apply(observed, context)
+            written |= declared_dependencies(strategy)[1]
+        return {name: observed[name] for name in sorted(written) if name in observed}
+    
+    def with_overrides(self, overrides: Mapping[str, Any]) -> 'MentorshipSolver':
+        """
+        Return a solver with strategy or solver parameters replaced.
+        
+        Args:
+            overrides: Mapping of ``'<slot>.<parameter>'`` strategy names, or
+                ``'converge_threshold'`` / ``'max_iterations'``, to new values
+            
+        Returns:
+            This solver if there is nothing to override, otherwise a new
+            solver sharing this solver's continuation store, metrics and cache
+        """
+        if not overrides:
+            return self
+        
+        overrides = dict(overrides)
+        converge_threshold = overrides.pop('converge_threshold', self.converge_threshold)
+        max_iterations = int(overrides.pop('max_iterations', self.max_iterations))
+        return MentorshipSolver(
+            operators=apply_bundle_overrides(self.operators, overrides),
+            converge_threshold=converge_threshold,
+            max_iterations=max_iterations,
+            continuation_store=self.continuation_store,
+            metrics=self.metrics,
+            cache=self.cache
+        )
+    
+    def solve_batch(
+        self,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Optional[Mapping[str, Sequence[Any]]] = None,
+        backend: Optional[Any] = None,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Solve many lanes of (initial coherence, depth, ethics_level).
+        
+        With a ``time_budget`` the batch is anytime: lanes advance
+        ``deadline_check_interval`` iterations at a time, the lane predicted
+        to converge soonest going next, and lanes still running when the
+        budget is spent keep their best-so-far state (lanes never reached
+        keep their initial coherence). Such runs are in-process and bypass
+        the result cache, since their results depend on timing.
+        
+        Args:
+            coherence: Initial coherence of each lane
+            depth: Depth of each lane
+            ethics_level: Ethics level of each lane
+            params: Optional per-lane parameter columns, keyed by the names
+                accepted by ``with_overrides``
+            backend: Optional execution backend providing ``run_mentorship``
+                (e.g. ``SharedMemoryBackend``); lanes run in-process if None
+            dtype: ``'float64'``, ``'float32'`` or ``'float32-emulated'``
+                (see ``solve``); float32 output columns hold single-precision
+                values, while the lanes themselves are solved in float64
+            time_budget: Optional wall-clock budget in seconds for the batch
+            
+        Returns:
+            Dictionary of columns named in ``BATCH_COLUMNS``, one entry per
+            lane. In-process continuation runs also return ``warm_started``
+            and ``iterations_saved`` columns, and runs with a ``time_budget``
+            ``deadline_hit`` and ``residual`` columns. With a result cache,
+            lanes are looked up before solving and only the misses are
+            solved; continuation runs bypass the cache because their results
+            depend on the store's contents.
+            
+        Raises:
+            ValueError: If column lengths differ, any ethics_level is out of
+                bounds [0.0, 1.0], dtype is unknown, or time_budget is
+                negative or combined with a backend or continuation store
+        """
+        check_dtype(dtype)
+        params = dict(params or {})
+        for column in (depth, ethics_level, *params.values()):
+            if len(column) != len(coherence):
+                raise ValueError(
+                    f"batch columns must share one length; got {len(column)} and {len(coherence)}"
+                )
+        for ethics in ethics_level:
+            if not (0.0 <= ethics <= 1.0):
+                raise ValueError(f"ethics_level must be in [0.0, 1.0], got {ethics}")
+        
+        if time_budget is not None:
+            if time_budget < 0:
+                raise ValueError(f"time_budget must be non-negative, got {time_budget}")
+            if backend is not None or self.continuation_store is not None:
+                raise ValueError("time_budget cannot be combined with a backend or continuation store")
+            return self._solve_lanes_by_deadline(
+                coherence, depth, ethics_level, params, dtype, time.perf_counter() + time_budget
+            )
+        if self.cache is None or self.continuation_store is not None:
+            return self._solve_lanes(coherence, depth, ethics_level, params, backend, dtype)
+        
+        def solve_missing(uncached: 'MentorshipSolver', lanes: List[int]) -> Dict[str, List[Any]]:
+            return uncached._solve_lanes(
+                [coherence[lane] for lane in lanes],
+                [depth[lane] for lane in lanes],
+                [ethics_level[lane] for lane in lanes],
+                {name: [values[lane] for lane in lanes] for name, values in params.items()},
+                backend,
+                dtype
+            )
+        
+        keys = self.cache.mentorship_keys(self, coherence, depth, ethics_level, params, dtype)
+        return self.cache.serve_batch(self, 'mentorship', keys, BATCH_COLUMNS, solve_missing)
+    
+    def _solve_lanes(
+        self,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Mapping[str, Sequence[Any]],
+        backend: Optional[Any],
+        dtype: str
+    ) -> Dict[str, List[Any]]:
+        """Solve validated batch lanes in-process or on ``backend``."""
+        cast = output_rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        if backend is not None:
+            columns = backend.run_mentorship(self, coherence, depth, ethics_level, params, dtype)
+            if self.metrics is not None:
+                # Lanes solved in worker processes are recorded here instead.
+                self.metrics.record_outcomes(
+                    'mentorship',
+                    columns['converged'],
+                    iterations=columns['iterations'],
+                    audit_valid=columns['audit_valid']
+                )
+                self.metrics.record_batch(
+                    'mentorship', len(coherence), time.perf_counter() - started
+                )
+            return columns
+        
+        if cast is not None:
+            # Single-precision inputs are narrowed once, as backends store them.
+            coherence = [cast(value) for value in coherence]
+            ethics_level = [cast(value) for value in ethics_level]
+        columns: Dict[str, List[Any]] = {name: [] for name in BATCH_COLUMNS}
+        if self.continuation_store is not None:
+            columns['warm_started'] = []
+            columns['iterations_saved'] = []
+        
+        solvers: Dict[Tuple, MentorshipSolver] = {}
+        names = sorted(params)
+        for lane in range(len(coherence)):
+            key = tuple(params[name][lane] for name in names)
+            solver = solvers.get(key)
+            if solver is None:
+                solver = solvers[key] = self.with_overrides(dict(zip(names, key)))
+            
+            final_state, iterations = solver.solve(
+                {'coherence': coherence[lane]},
+                depth=depth[lane],
+                ethics_level=ethics_level[lane],
+                dtype=dtype
+            )
+            
+            self._append_lane(columns, final_state, iterations, cast)
+            if self.continuation_store is not None:
+                columns['warm_started'].append(final_state.get('warm_started', False))
+                columns['iterations_saved'].append(final_state.get('iterations_saved', 0))
+        
+        if self.metrics is not None:
+            self.metrics.record_batch('mentorship', len(coherence), time.perf_counter() - started)
+        return columns
+    
+    def _solve_lanes_by_deadline(
+        self,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str,
+        deadline: float
+    ) -> Dict[str, List[Any]]:
+        """Solve validated batch lanes in-process, closest to converging first."""
+        cast = rounding(dtype)
+        store = output_rounding(dtype)
+        if store is not None:
+            coherence = [store(value) for value in coherence]
+            ethics_level = [store(value) for value in ethics_level]
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        finals: List[Optional[Tuple[Dict[str, Any], int]]] = [None] * len(coherence)
+        progress: Dict[int, _LaneProgress] = {}
+        # (predicted iterations to finish, residual relative to the
+        # threshold, lane); lanes not yet advanced go first, in lane order.
+        queue: List[Tuple[float, float, int]] = []
+        
+        solvers: Dict[Tuple, MentorshipSolver] = {}
+        names = sorted(params)
+        for lane in range(len(coherence)):
+            if depth[lane] == 0:
+                state = {
+                    'coherence': coherence[lane],
+                    'converged': True,
+                    'iterations': 0,
+                    'deadline_hit': False,
+                    'residual': 0.0
+                }
+                finals[lane] = (state, 0)
+                continue
+            key = tuple(params[name][lane] for name in names)
+            solver = solvers.get(key)
+            if solver is None:
+                solver = solvers[key] = self.with_overrides(dict(zip(names, key)))
+            state = {'coherence': coherence[lane]}
+            context = {
+                'depth': depth[lane],
+                'ethics_level': ethics_level[lane]
+            }
+            progress[lane] = _LaneProgress(solver, state, context)
+            queue.append((0.0, 0.0, lane))
+        
+        # One clock check per slice of deadline_check_interval iterations.
+        while queue and time.perf_counter() < deadline:
+            *_, lane = heapq.heappop(queue)
+            lane_progress = progress[lane]
+            solver = lane_progress.solver
+            plan = solver.execution_plan()
+            start = lane_progress.iterations
+            previous = lane_progress.residual
+            stop = min(solver.max_iterations, start + self.deadline_check_interval)
+            (
+                lane_progress.state,
+                lane_progress.iterations,
+                converged,
+                lane_progress.residual
+            ) = solver._advance(plan, lane_progress.state, lane_progress.context, start, stop, cast)
+            if converged or lane_progress.iterations >= solver.max_iterations:
+                finals[lane] = self._finish_lane(lane_progress, converged, False)
+            else:
+                remaining = min(
+                    solver._predict_iterations(
+                        previous, lane_progress.residual, lane_progress.iterations - start
+                    ),
+                    solver.max_iterations - lane_progress.iterations
+                )
+                # Lanes without a predicted rate yet are ordered by how far
+                # their residual is from the threshold.
+                distance = (
+                    lane_progress.residual / solver.converge_threshold
+                    if solver.converge_threshold > 0 else math.inf
+                )
+                heapq.heappush(queue, (remaining, distance, lane))
+        for *_, lane in queue:
+            finals[lane] = self._finish_lane(progress[lane], False, True)
+        
+        columns: Dict[str, List[Any]] = {name: [] for name in BATCH_COLUMNS}
+        columns['deadline_hit'] = []
+        columns['residual'] = []
+        for final_state, iterations in finals:
+            self._append_lane(columns, final_state, iterations, store)
+            columns['deadline_hit'].append(final_state['deadline_hit'])
+            residual = final_state['residual']
+            columns['residual'].append(residual if store is None else store(residual))
+        
+        if self.metrics is not None:
+            self.metrics.record_outcomes(
+                'mentorship',
+                columns['converged'],
+                iterations=columns['iterations'],
+                audit_valid=columns['audit_valid']
+            )
+            self.metrics.record_batch('mentorship', len(coherence), time.perf_counter() - started)
+        return columns
+    
+    def _predict_iterations(self, previous: float, residual: float, iterations: int) -> float:
+        """
+        Predict the iterations left until ``|Δcoherence|`` converges.
+        
+        Assumes ``|Δcoherence|`` keeps shrinking geometrically at the rate
+        seen from ``previous`` to ``residual`` over ``iterations``.
+        
+        Returns:
+            The predicted iterations, or infinity if the residual is not
+            shrinking or there is no earlier residual to compare against
+        """
+        if self.converge_threshold <= 0 or not (0.0 < residual < previous):
+            return math.inf
+        rate = (residual / previous) ** (1.0 / iterations)
+        return max(0.0, math.log(self.converge_threshold / residual) / math.log(rate))
+    
+    @staticmethod
+    def _finish_lane(
+        progress: _LaneProgress,
+        converged: bool,
+        deadline_hit: bool
+    ) -> Tuple[Dict[str, Any], int]:
+        """Finalize a lane solved under a time budget."""
+        solver = progress.solver
+        state = solver._finish(
+            solver.execution_plan(), progress.state, progress.context, progress.iterations, converged
+        )
+        state['deadline_hit'] = deadline_hit
+        state['residual'] = progress.residual
+        return state, progress.iterations
+    
+    @staticmethod
+    def _append_lane(
+        columns: Dict[str, List[Any]],
+        final_state: Dict[str, Any],
+        iterations: int,
+        cast: Optional[Callable[[float], float]]
+    ) -> None:
+        """Append one solved lane to ``BATCH_COLUMNS`` result columns."""
+        final_coherence = final_state.get('coherence')
+        audit_score = final_state.get('audit_score', math.nan)
+        measured_coherence = final_state.get('measured_coherence', math.nan)
+        if cast is not None:
+            final_coherence = cast(final_coherence)
+            audit_score = cast(audit_score)
+            measured_coherence = cast(measured_coherence)
+        
+        columns['final_coherence'].append(final_coherence)
+        columns['iterations'].append(iterations)
+        columns['converged'].append(final_state.get('converged', False))
+        columns['audit_valid'].append(final_state.get('audit_valid', False))
+        columns['audit_score'].append(audit_score)
+        columns['measured_coherence'].append(measured_coherence)
+    
+    def solve_batch_multi(
+        self,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        thresholds: Sequence[float],
+        max_iterations: Optional[Sequence[int]] = None,
+        params: Optional[Mapping[str, Sequence[Any]]] = None,
+        dtype: str = FLOAT64
+    ) -> Dict[Tuple[float, int], Dict[str, List[Any]]]:
+        """
+        Solve many lanes for several thresholds and iteration caps at once.
+        
+        Each lane is iterated once with ``solve_multi``; lanes run in-process.
+        
+        Args:
+            coherence: Initial coherence of each lane
+            depth: Depth of each lane
+            ethics_level: Ethics level of each lane
+            thresholds: Convergence thresholds to report
+            max_iterations: Iteration caps to report (defaults to this
+                solver's ``max_iterations``)
+            params: Optional per-lane strategy parameter columns (see
+                ``solve_batch``); ``converge_threshold`` and
+                ``max_iterations`` columns are superseded by the arguments
+            dtype: ``'float64'`` or ``'float32'`` (see ``solve``)
+            
+        Returns:
+            Mapping of ``(threshold, max_iterations)`` to ``BATCH_COLUMNS``
+            columns equal to ``solve_batch`` on a solver with those settings
+            
+        Raises:
+            ValueError: If column lengths differ, any ethics_level is out of
+                bounds [0.0, 1.0], thresholds or caps are empty or dtype is
+                unknown
+        """
+        check_dtype(dtype)
+        cast = output_rounding(dtype)
+        params = dict(params or {})
+        for column in (depth, ethics_level, *params.values()):
+            if len(column) != len(coherence):
+                raise ValueError(
+                    f"batch columns must share one length; got {len(column)} and {len(coherence)}"
+                )
+        if cast is not None:
+            coherence = [cast(value) for value in coherence]
+            ethics_level = [cast(value) for value in ethics_level]
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        
+        results: Dict[Tuple[float, int], Dict[str, List[Any]]] = {}
+        solvers: Dict[Tuple, MentorshipSolver] = {}
+        names = sorted(params)
+        for lane in range(len(coherence)):
+            key = tuple(params[name][lane] for name in names)
+            solver = solvers.get(key)
+            if solver is None:
+                solver = solvers[key] = self.with_overrides(dict(zip(names, key)))
+            
+            outcomes = solver.solve_multi(
+                {'coherence': coherence[lane]},
+                thresholds,
+                max_iterations,
+                depth=depth[lane],
+                ethics_level=ethics_level[lane],
+                dtype=dtype
+            )
+            for setting, (final_state, iterations) in outcomes.items():
+                columns = results.get(setting)
+                if columns is None:
+                    columns = results[setting] = {name: [] for name in BATCH_COLUMNS}
+                self._append_lane(columns, final_state, iterations, cast)
         
-        # Max iterations reached without convergence
-        state['converged'] = False
-        state['iterations'] = self.max_iterations
-        return state, self.max_iterations
+        if self.metrics is not None:
+            self.metrics.record_batch('mentorship', len(coherence), time.perf_counter() - started)
+        return results
     
     def sample_07_run(self) -> Dict[str, Any]:
         """
@@ -240,7 +1530,10 @@ class MentorshipSolver:
     def grid_experiments(
         self,
         depth_range: range = range(0, 4),
-        ethics_range: Tuple[float, ...] = (0.2, 0.5, 0.8)
+        ethics_range: Tuple[float, ...] = (0.2, 0.5, 0.8),
+        backend: Optional[Any] = None,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None
     ) -> list:
         """
         Run grid search experiments across depth and ethics parameters.
@@ -248,36 +1541,96 @@ class MentorshipSolver:
         Args:
             depth_range: Range of depth values to test
             ethics_range: Tuple of ethics_level values to test
+            backend: Optional execution backend for the underlying batch
+                solve (see ``solve_batch``)
+            dtype: ``'float64'`` or ``'float32'`` (see ``solve``)
+            time_budget: Optional wall-clock budget in seconds for the whole
+                grid (see ``solve_batch``)
             
         Returns:
-            List of experiment result dictionaries
+            List of experiment result dictionaries. In continuation mode each
+            result also reports ``warm_started`` and ``iterations_saved``,
+            and with a ``time_budget`` ``deadline_hit`` and ``residual``.
         """
+        cells = [(depth, ethics) for depth in depth_range for ethics in ethics_range]
+        batch = self.solve_batch(
+            coherence=[0.4] * len(cells),
+            depth=[depth for depth, _ in cells],
+            ethics_level=[ethics for _, ethics in cells],
+            backend=backend,
+            dtype=dtype,
+            time_budget=time_budget
+        )
+        
         results = []
+        for lane, (depth, ethics) in enumerate(cells):
+            result = {
+                'depth': depth,
+                'ethics_level': ethics,
+                'initial_coherence': 0.4,
+                'final_coherence': batch['final_coherence'][lane],
+                'iterations': batch['iterations'][lane],
+                'converged': batch['converged'][lane],
+                'audit_valid': batch['audit_valid'][lane]
+            }
+            if 'warm_started' in batch:
+                result['warm_started'] = batch['warm_started'][lane]
+                result['iterations_saved'] = batch['iterations_saved'][lane]
+            if 'deadline_hit' in batch:
+                result['deadline_hit'] = batch['deadline_hit'][lane]
+                result['residual'] = batch['residual'][lane]
+            results.append(result)
         
-        for depth in depth_range:
-            for ethics in ethics_range:
-                initial_state = {
-                    'coherence': 0.4,
-                    'experiment': True
-                }
-                
-                final_state, iterations = self.solve(
-                    initial_state=initial_state,
-                    depth=depth,
-                    ethics_level=ethics
-                )
-                
-                results.append({
+        return results
+    
+    def grid_experiments_multi(
+        self,
+        thresholds: Sequence[float],
+        max_iterations: Optional[Sequence[int]] = None,
+        depth_range: range = range(0, 4),
+        ethics_range: Tuple[float, ...] = (0.2, 0.5, 0.8),
+        dtype: str = FLOAT64
+    ) -> Dict[Tuple[float, int], list]:
+        """
+        Run grid experiments for several thresholds and iteration caps at once.
+        
+        Args:
+            thresholds: Convergence thresholds to report
+            max_iterations: Iteration caps to report (defaults to this
+                solver's ``max_iterations``)
+            depth_range: Range of depth values to test
+            ethics_range: Tuple of ethics_level values to test
+            dtype: ``'float64'`` or ``'float32'`` (see ``solve``)
+            
+        Returns:
+            Mapping of ``(threshold, max_iterations)`` to the result list
+            ``grid_experiments`` returns on a solver with those settings
+        """
+        cells = [(depth, ethics) for depth in depth_range for ethics in ethics_range]
+        batches = self.solve_batch_multi(
+            coherence=[0.4] * len(cells),
+            depth=[depth for depth, _ in cells],
+            ethics_level=[ethics for _, ethics in cells],
+            thresholds=thresholds,
+            max_iterations=max_iterations,
+            dtype=dtype
+        )
+        
+        return {
+            setting: [
+                {
                     'depth': depth,
                     'ethics_level': ethics,
                     'initial_coherence': 0.4,
-                    'final_coherence': final_state.get('coherence'),
-                    'iterations': iterations,
-                    'converged': final_state.get('converged', False),
-                    'audit_valid': final_state.get('audit_valid', False)
-                })
-        
-        return results
+                    'final_coherence': batch['final_coherence'][lane],
+                    'iterations': batch['iterations'][lane],
+                    'converged': batch['converged'][lane],
+                    'audit_valid': batch['audit_valid'][lane]
+                }
+                for lane, (depth, ethics) in enumerate(cells)
+            ]
+            for setting, batch in batches.items()
+        }
 
 
 def create_default_solver(converge_threshold: float = 0.001) -> MentorshipSolver:
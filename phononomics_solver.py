@@ -8,8 +8,12 @@ ethics scenarios toward convergence.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+import heapq
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from compact_precision import FLOAT64, check_dtype, output_rounding, rounding
 
 
 @dataclass
@@ -33,16 +37,65 @@ class PhononomicsConfig:
     drift_floor: float = 0.5
 
 
+def _resonance(config: PhononomicsConfig, coherence: float) -> Tuple[float, float]:
+    align = max(0.0, config.resonance_alignment)
+    return coherence * align, align
+
+
+def _measurement(config: PhononomicsConfig, coherence: float) -> Tuple[float, float]:
+    overlap = max(0.0, config.measurement_overlap)
+    return coherence * overlap, overlap
+
+
+def _adaptation(config: PhononomicsConfig, coherence: float) -> Tuple[float, float]:
+    error = max(0.0, config.adaptation_error)
+    return min(1.0, coherence + error * 0.1), error
+
+
+def _auditing(config: PhononomicsConfig, coherence: float) -> Tuple[float, float]:
+    error = min(max(config.audit_error, 0.0), 1.0)
+    return coherence * (1.0 - error), error
+
+
+# Numeric coherence updates behind each operator, shared by the traced
+# operators and the trace-free batch kernel.
+_STEPS: Dict[str, Callable[[PhononomicsConfig, float], Tuple[float, float]]] = {
+    "ρ": _resonance,
+    "μ": _measurement,
+    "α": _adaptation,
+    "ψ": _auditing,
+}
+
+BATCH_COLUMNS = ("final_coherence", "sonic_score", "converged", "drift_exit")
+
+
 class PhononomicsSolver:
     """Prototype sonic solver integrating the Axionomic operators.
 
     The solver cycles through resonance (ρ), measurement (μ), adaptation (α),
     and auditing (ψ) to estimate the coherence of a sonic ethics scenario. It
     keeps a textual trace of each operation and returns a structured result.
+
+    An optional `solver_metrics.SolverMetrics` passed as ``metrics`` records
+    the latency and outcome of every solve, early exits at the drift floor,
+    and batch sizes. An optional `result_cache.ResultCache` passed as ``cache``
+    serves previously solved batch lanes.
+
+    Runs given a ``time_budget`` check the clock every
+    ``deadline_check_interval`` operator steps.
     """
 
-    def __init__(self, config: Optional[PhononomicsConfig] = None) -> None:
+    deadline_check_interval: ClassVar[int] = 64
+
+    def __init__(
+        self,
+        config: Optional[PhononomicsConfig] = None,
+        metrics: Optional[Any] = None,
+        cache: Optional[Any] = None,
+    ) -> None:
         self.config = config or PhononomicsConfig()
+        self.metrics = metrics
+        self.cache = cache
         self._operators: Dict[str, Callable[[str], str]] = {
             "ρ": self._resonate,
             "μ": self._measure,
@@ -53,43 +106,69 @@ class PhononomicsSolver:
         self._coherence: float = 1.0
         self._path: List[str] = []
 
-    def solve(self, scenario: str, ethics_level: float = 0.84, depth: int = 3) -> Dict[str, object]:
+    def solve(
+        self,
+        scenario: str,
+        ethics_level: float = 0.84,
+        depth: int = 3,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, object]:
         """Run the solver for the supplied scenario.
 
         Args:
             scenario: Name/description of the sonic ethics scenario.
             ethics_level: Initial coherence seed for the cycle (0.0–1.0).
             depth: Number of operator steps to execute (>=0).
+            time_budget: Optional wall-clock budget in seconds. Once it is
+                spent the cycle stops and the best-so-far result is returned
+                with ``converged`` False.
 
         Returns:
-            Dictionary describing the solver trace and final coherence.
+            Dictionary describing the solver trace and final coherence. With a
+            ``time_budget`` it also carries ``deadline_hit`` and ``residual``,
+            the shortfall of the coherence from ``convergence_threshold``.
 
         Raises:
-            ValueError: If `ethics_level` is outside [0.0, 1.0] or `depth` < 0.
+            ValueError: If `ethics_level` is outside [0.0, 1.0], `depth` < 0
+                or `time_budget` is negative.
         """
 
-        if not 0.0 <= ethics_level <= 1.0:
-            raise ValueError(f"ethics_level must be within [0.0, 1.0]; received {ethics_level}")
-        if depth < 0:
-            raise ValueError(f"depth must be non-negative; received {depth}")
+        self._validate(ethics_level, depth)
+        _check_time_budget(time_budget)
+        started = time.perf_counter() if self.metrics is not None or time_budget is not None else 0.0
+        deadline = None if time_budget is None else started + time_budget
 
         self._reset_state()
         self._coherence = ethics_level
         self._path.append(scenario)
 
         current = scenario
+        steps = 0
+        drifted = False
+        deadline_hit = False
         for step in range(depth):
+            if (
+                deadline is not None
+                and step
+                and step % self.deadline_check_interval == 0
+                and time.perf_counter() >= deadline
+            ):
+                deadline_hit = True
+                break
             operator_key = self._sequence[step % len(self._sequence)]
             operator = self._operators[operator_key]
             current = operator(current)
+            steps += 1
             if self._coherence < self.config.drift_floor:
+                drifted = True
                 break
 
-        converged = self._coherence >= self.config.convergence_threshold
+        final_coherence, sonic_score, converged = self._score(self._coherence)
+        converged = converged and not deadline_hit
         result = {
             "path": self._path.copy(),
-            "final_coherence": round(self._coherence, 3),
-            "sonic_score": round(self._coherence * 100, 1),
+            "final_coherence": final_coherence,
+            "sonic_score": sonic_score,
             "converged": converged,
             "recommendation": (
                 "Sonic decision strategy complete"
@@ -97,38 +176,309 @@ class PhononomicsSolver:
                 else "Additional sonic review required"
             ),
         }
+        if deadline is not None:
+            result["deadline_hit"] = deadline_hit
+            result["residual"] = self._residual(self._coherence)
 
         self._reset_state()
+        if self.metrics is not None:
+            self.metrics.record_solve(
+                "phononomics", time.perf_counter() - started, steps, converged, drift_exit=drifted
+            )
         return result
 
+    def solve_batch(
+        self,
+        scenario: str,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Optional[Mapping[str, Sequence[float]]] = None,
+        backend: Optional[Any] = None,
+        dtype: str = FLOAT64,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, List[object]]:
+        """Run the solver for many (ethics_level, depth) lanes of one scenario.
+
+        Batch runs skip the textual trace and return only the numeric outcome
+        of each lane, matching the corresponding fields of :meth:`solve`.
+
+        With a ``time_budget``, lanes advance ``deadline_check_interval`` steps
+        at a time, the lane with the fewest steps left going next, so the
+        budget completes as many lanes as possible; lanes still running when
+        it is spent keep their best-so-far coherence. Such runs are in-process
+        and bypass the result cache.
+
+        Args:
+            scenario: Name/description of the sonic ethics scenario.
+            ethics_levels: Initial coherence seed of each lane.
+            depths: Number of operator steps of each lane.
+            params: Optional per-lane `PhononomicsConfig` overrides, keyed by
+                field name.
+            backend: Optional execution backend providing `run_phononomics`
+                (e.g. `SharedMemoryBackend`); lanes run in-process if None.
+            dtype: ``"float64"``, ``"float32"`` or ``"float32-emulated"``.
+                float32 rounds only the result columns to single precision;
+                the emulated mode also rounds coherence after every operator
+                (see `compact_precision`).
+            time_budget: Optional wall-clock budget in seconds for the batch.
+
+        Returns:
+            Dictionary of columns named in `BATCH_COLUMNS`, one entry per lane.
+            ``drift_exit`` marks lanes that stopped early at the drift floor.
+            Runs with a ``time_budget`` also return ``deadline_hit`` and
+            ``residual`` columns (see :meth:`solve`). With a result cache,
+            only lanes missing from it are solved.
+
+        Raises:
+            ValueError: If column lengths differ, any lane is invalid, `dtype`
+                is unknown, or `time_budget` is negative or combined with a
+                backend.
+        """
+
+        check_dtype(dtype)
+        params = dict(params or {})
+        _check_lengths(len(ethics_levels), [depths, *params.values()])
+        for ethics_level, depth in zip(ethics_levels, depths):
+            self._validate(ethics_level, depth)
+
+        if time_budget is not None:
+            _check_time_budget(time_budget)
+            if backend is not None:
+                raise ValueError("time_budget cannot be combined with a backend")
+            return self._solve_lanes_by_deadline(
+                ethics_levels, depths, params, dtype, time.perf_counter() + time_budget
+            )
+
+        if self.cache is None:
+            return self._solve_lanes(scenario, ethics_levels, depths, params, backend, dtype)
+
+        def solve_missing(uncached: PhononomicsSolver, lanes: List[int]) -> Dict[str, List[object]]:
+            return uncached._solve_lanes(
+                scenario,
+                [ethics_levels[lane] for lane in lanes],
+                [depths[lane] for lane in lanes],
+                {name: [values[lane] for lane in lanes] for name, values in params.items()},
+                backend,
+                dtype,
+            )
+
+        keys = self.cache.phononomics_keys(self, ethics_levels, depths, params, dtype)
+        return self.cache.serve_batch(self, "phononomics", keys, BATCH_COLUMNS, solve_missing)
+
+    def _solve_lanes(
+        self,
+        scenario: str,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Mapping[str, Sequence[float]],
+        backend: Optional[Any],
+        dtype: str,
+    ) -> Dict[str, List[object]]:
+        """Solve validated batch lanes in-process or on `backend`."""
+
+        cast = rounding(dtype)
+        store = output_rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        if backend is not None:
+            columns = backend.run_phononomics(self, scenario, ethics_levels, depths, params, dtype)
+            if self.metrics is not None:
+                # Backends do not report operator steps, so only convergence
+                # outcomes, drift-floor exits and the batch itself are recorded.
+                self.metrics.record_outcomes(
+                    "phononomics", columns["converged"], drift_exits=sum(columns["drift_exit"])
+                )
+                self.metrics.record_batch("phononomics", len(ethics_levels), time.perf_counter() - started)
+            return columns
+
+        if store is not None:
+            # Single-precision inputs are narrowed once, as backends store them.
+            ethics_levels = [store(value) for value in ethics_levels]
+        columns: Dict[str, List[object]] = {name: [] for name in BATCH_COLUMNS}
+        steps_taken: List[int] = []
+        solvers: Dict[Tuple[float, ...], PhononomicsSolver] = {}
+        names = sorted(params)
+        for lane, (ethics_level, depth) in enumerate(zip(ethics_levels, depths)):
+            key = tuple(params[name][lane] for name in names)
+            solver = solvers.get(key)
+            if solver is None:
+                solver = solvers[key] = self.with_overrides(dict(zip(names, key)))
+            coherence, steps, drifted = solver._run_cycle(ethics_level, depth, cast)
+            steps_taken.append(steps)
+            final_coherence, sonic_score, converged = solver._score(coherence)
+            if store is not None:
+                final_coherence, sonic_score = store(final_coherence), store(sonic_score)
+            columns["final_coherence"].append(final_coherence)
+            columns["sonic_score"].append(sonic_score)
+            columns["converged"].append(converged)
+            columns["drift_exit"].append(drifted)
+
+        if self.metrics is not None:
+            # Lanes take microseconds, so they are recorded in one pass with
+            # the batch latency rather than timed one by one.
+            self.metrics.record_outcomes(
+                "phononomics",
+                columns["converged"],
+                iterations=steps_taken,
+                drift_exits=sum(columns["drift_exit"]),
+            )
+            self.metrics.record_batch("phononomics", len(ethics_levels), time.perf_counter() - started)
+        return columns
+
+    def _solve_lanes_by_deadline(
+        self,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Mapping[str, Sequence[float]],
+        dtype: str,
+        deadline: float,
+    ) -> Dict[str, List[object]]:
+        """Solve validated batch lanes in-process, fewest steps left first."""
+
+        cast = rounding(dtype)
+        store = output_rounding(dtype)
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        lane_solvers: List[PhononomicsSolver] = []
+        coherence = [ethics_level if store is None else store(ethics_level) for ethics_level in ethics_levels]
+        steps_taken = [0] * len(ethics_levels)
+        drifted = [False] * len(ethics_levels)
+        solvers: Dict[Tuple[float, ...], PhononomicsSolver] = {}
+        names = sorted(params)
+        for lane in range(len(ethics_levels)):
+            key = tuple(params[name][lane] for name in names)
+            solver = solvers.get(key)
+            if solver is None:
+                solver = solvers[key] = self.with_overrides(dict(zip(names, key)))
+            lane_solvers.append(solver)
+
+        # (steps left, lane); one clock check per slice of
+        # deadline_check_interval steps.
+        queue = [(depth, lane) for lane, depth in enumerate(depths) if depth > 0]
+        heapq.heapify(queue)
+        while queue and time.perf_counter() < deadline:
+            _, lane = heapq.heappop(queue)
+            depth = depths[lane]
+            stop = min(depth, steps_taken[lane] + self.deadline_check_interval)
+            coherence[lane], steps_taken[lane], drifted[lane] = lane_solvers[lane]._advance_cycle(
+                coherence[lane], steps_taken[lane], stop, cast
+            )
+            if not drifted[lane] and steps_taken[lane] < depth:
+                heapq.heappush(queue, (depth - steps_taken[lane], lane))
+        unfinished = {lane for _, lane in queue}
+
+        columns: Dict[str, List[object]] = {name: [] for name in BATCH_COLUMNS}
+        columns["deadline_hit"] = []
+        columns["residual"] = []
+        for lane, solver in enumerate(lane_solvers):
+            final_coherence, sonic_score, converged = solver._score(coherence[lane])
+            residual = solver._residual(coherence[lane])
+            if store is not None:
+                final_coherence, sonic_score = store(final_coherence), store(sonic_score)
+                residual = store(residual)
+            columns["final_coherence"].append(final_coherence)
+            columns["sonic_score"].append(sonic_score)
+            columns["converged"].append(converged and lane not in unfinished)
+            columns["drift_exit"].append(drifted[lane])
+            columns["deadline_hit"].append(lane in unfinished)
+            columns["residual"].append(residual)
+
+        if self.metrics is not None:
+            self.metrics.record_outcomes(
+                "phononomics",
+                columns["converged"],
+                iterations=steps_taken,
+                drift_exits=sum(drifted),
+            )
+            self.metrics.record_batch("phononomics", len(ethics_levels), time.perf_counter() - started)
+        return columns
+
+    def with_overrides(self, overrides: Mapping[str, float]) -> "PhononomicsSolver":
+        """Return a solver whose configuration has the given fields replaced."""
+
+        if not overrides:
+            return self
+        return PhononomicsSolver(replace(self.config, **overrides), metrics=self.metrics, cache=self.cache)
+
+    def _validate(self, ethics_level: float, depth: int) -> None:
+        if not 0.0 <= ethics_level <= 1.0:
+            raise ValueError(f"ethics_level must be within [0.0, 1.0]; received {ethics_level}")
+        if depth < 0:
+            raise ValueError(f"depth must be non-negative; received {depth}")
+
+    def _run_cycle(
+        self, ethics_level: float, depth: int, cast: Optional[Callable[[float], float]] = None
+    ) -> Tuple[float, int, bool]:
+        """Apply the operator cycle numerically, without building a trace.
+
+        Returns:
+            The final coherence, the number of operator steps taken and
+            whether the cycle stopped at the drift floor.
+        """
+
+        return self._advance_cycle(ethics_level if cast is None else cast(ethics_level), 0, depth, cast)
+
+    def _advance_cycle(
+        self, coherence: float, start: int, stop: int, cast: Optional[Callable[[float], float]] = None
+    ) -> Tuple[float, int, bool]:
+        """Apply operator steps ``start`` to ``stop - 1`` of the cycle to `coherence`.
+
+        Returns:
+            The coherence, the number of operator steps taken since the start
+            of the cycle and whether the cycle stopped at the drift floor.
+        """
+
+        for step in range(start, stop):
+            coherence, _ = _STEPS[self._sequence[step % len(self._sequence)]](self.config, coherence)
+            if cast is not None:
+                coherence = cast(coherence)
+            if coherence < self.config.drift_floor:
+                return coherence, step + 1, True
+        return coherence, max(start, stop), False
+
+    def _score(self, coherence: float) -> Tuple[float, float, bool]:
+        return (
+            round(coherence, 3),
+            round(coherence * 100, 1),
+            coherence >= self.config.convergence_threshold,
+        )
+
+    def _residual(self, coherence: float) -> float:
+        return max(0.0, self.config.convergence_threshold - coherence)
+
     def _reset_state(self) -> None:
         self._coherence = 1.0
         self._path = []
 
     def _resonate(self, state: str) -> str:
-        align = max(0.0, self.config.resonance_alignment)
-        self._coherence *= align
+        self._coherence, align = _resonance(self.config, self._coherence)
         message = f"ρ({state}): Aligned sonic moral θ={align:.2f}"
         self._path.append(message)
         return message
 
     def _measure(self, state: str) -> str:
-        overlap = max(0.0, self.config.measurement_overlap)
-        self._coherence *= overlap
+        self._coherence, overlap = _measurement(self.config, self._coherence)
         message = f"μ({state}): Measured sonic-moral I={overlap:.2f}"
         self._path.append(message)
         return message
 
     def _adapt(self, state: str) -> str:
-        error = max(0.0, self.config.adaptation_error)
-        self._coherence = min(1.0, self._coherence + error * 0.1)
+        self._coherence, error = _adaptation(self.config, self._coherence)
         message = f"α({state}): Adapted ε={error:.2f}"
         self._path.append(message)
         return message
 
     def _audit(self, state: str) -> str:
-        error = min(max(self.config.audit_error, 0.0), 1.0)
-        self._coherence *= 1.0 - error
+        self._coherence, error = _auditing(self.config, self._coherence)
         message = f"ψ({state}): Audited ethical errors={error:.2f}"
         self._path.append(message)
         return message
+
+
+def _check_time_budget(time_budget: Optional[float]) -> None:
+    if time_budget is not None and time_budget < 0:
+        raise ValueError(f"time_budget must be non-negative; received {time_budget}")
+
+
+def _check_lengths(expected: int, columns: Sequence[Sequence[object]]) -> None:
+    for column in columns:
+        if len(column) != expected:
+            raise ValueError(f"batch columns must share one length; got {len(column)} and {expected}")
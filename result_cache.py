@@ -0,0 +1,373 @@
+"""Persistent result cache shared across runs and processes.
+
+`ResultCache` stores batch lane outcomes in an SQLite database (write-ahead
+logging, busy timeout), so the cache survives restarts and can be shared by
+concurrent worker processes. Each entry is keyed by a SHA-256 fingerprint of
+the cache format version, the source code of the modules that compute the
+result, the solver configuration, the precision and the lane inputs; editing
+a solver or strategy module therefore invalidates its entries automatically.
+
+Pass a cache to `MentorshipSolver` or `PhononomicsSolver` through their
+``cache`` argument and batch solves (including `grid_experiments` and the
+sharded sweep workers) look up every lane in one query, solve only the misses
+and insert them in one transaction::
+
+    cache = ResultCache("~/.cache/terminomics/results.sqlite", max_bytes=512 << 20)
+    solver = MentorshipSolver(cache=cache)
+    solver.grid_experiments()  # solved
+    solver.grid_experiments()  # served from the cache
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from compact_precision import rounding
+from mentorship_solver import BUNDLE_SLOTS, bundle_fingerprint
+
+# Bump when the key derivation or the stored value layout changes.
+CACHE_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+# Stay below SQLite's default limit on bound parameters per statement.
+_QUERY_CHUNK = 500
+
+
+@functools.lru_cache(maxsize=None)
+def _module_digest(module_name: str) -> str:
+    module = sys.modules.get(module_name)
+    try:
+        source = inspect.getsource(module) if module is not None else ""
+    except (OSError, TypeError):
+        source = ""
+    return hashlib.sha256(f"{module_name}\0{source}".encode("utf-8")).hexdigest()
+
+
+def code_fingerprint(*objects: Any) -> str:
+    """Fingerprint the source of the modules defining `objects` (or their types).
+
+    Modules whose source cannot be read contribute only their name.
+    """
+
+    names = set()
+    for obj in objects:
+        target = obj if inspect.isclass(obj) or inspect.isfunction(obj) else type(obj)
+        names.add(target.__module__)
+    return hashlib.sha256("".join(_module_digest(name) for name in sorted(names)).encode("ascii")).hexdigest()
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def mentorship_prefix(solver: Any, dtype: str) -> str:
+    """Key prefix for lanes of one `MentorshipSolver` configuration."""
+
+    strategies = (getattr(solver.operators, slot) for slot in BUNDLE_SLOTS)
+    code = code_fingerprint(type(solver), rounding, *strategies)
+    return _digest(
+        CACHE_VERSION,
+        "mentorship",
+        code,
+        bundle_fingerprint(solver.operators),
+        float(solver.converge_threshold),
+        int(solver.max_iterations),
+        dtype,
+    )
+
+
+def phononomics_prefix(solver: Any, dtype: str) -> str:
+    """Key prefix for lanes of one `PhononomicsSolver` configuration.
+
+    Batch outcomes do not depend on the scenario name, so it is not part of
+    the key and lanes are shared across scenarios.
+    """
+
+    return _digest(
+        CACHE_VERSION,
+        "phononomics",
+        code_fingerprint(type(solver), rounding),
+        sorted(asdict(solver.config).items()),
+        dtype,
+    )
+
+
+def lane_key(prefix: str, *inputs: Any) -> str:
+    """Cache key of one lane, given its configuration prefix and inputs."""
+
+    return _digest(prefix, *inputs)
+
+
+class ResultCache:
+    """SQLite-backed cache of batch lane outcomes with LRU eviction.
+
+    Each process and thread opens its own connection on first use; the
+    database itself is safe to share between processes. Pickled copies (for
+    example in solvers sent to worker processes) reopen the same database.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            path: Database file; created, with its directory, if missing.
+            max_entries: Evict least recently used entries beyond this count.
+            max_bytes: Evict least recently used entries once stored values
+                exceed this many bytes.
+            timeout: Seconds to wait for another process's write lock.
+        """
+
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection()
+
+    def __reduce__(self) -> Tuple[Any, Tuple]:
+        return ResultCache, (self.path, self.max_entries, self.max_bytes, self.timeout)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(_SCHEMA)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def close(self) -> None:
+        """Close this thread's connection (it is reopened on next use)."""
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        """Total size of the stored values."""
+
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up many keys at once, returning the entries that are present."""
+
+        connection = self._connection()
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(unique), _QUERY_CHUNK):
+            chunk = unique[start:start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for key, value in connection.execute(
+                f"SELECT key, value FROM results WHERE key IN ({placeholders})", chunk
+            ):
+                found[key] = json.loads(value)
+        if found:
+            now = time.time()
+            self._write(
+                lambda c: c.executemany(
+                    "UPDATE results SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+            )
+        return found
+
+    def put_many(self, entries: Mapping[str, Mapping[str, Any]]) -> None:
+        """Insert or replace many entries in one transaction, then evict."""
+
+        if not entries:
+            return
+        now = time.time()
+        rows = []
+        for key, value in entries.items():
+            encoded = json.dumps(dict(value), separators=(",", ":"))
+            rows.append((key, encoded, len(encoded), now))
+
+        def insert(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)", rows
+            )
+            self._evict(connection)
+
+        self._write(insert)
+
+    def clear(self) -> None:
+        self._write(lambda c: c.execute("DELETE FROM results"))
+
+    def _write(self, operation: Callable[[sqlite3.Connection], Any]) -> None:
+        connection = self._connection()
+        # Take the write lock up front so concurrent writers queue on the busy
+        # timeout instead of failing to upgrade a read lock.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            operation(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self.max_entries is not None:
+            (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+            if count > self.max_entries:
+                connection.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_used, key LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+        if self.max_bytes is not None:
+            (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                doomed = []
+                for key, size in connection.execute("SELECT key, size FROM results ORDER BY last_used, key"):
+                    doomed.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                connection.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def mentorship_keys(
+        self,
+        solver: Any,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str,
+    ) -> List[str]:
+        """Cache keys of `MentorshipSolver.solve_batch` lanes."""
+
+        names = sorted(params)
+        prefixes: Dict[Tuple, str] = {}
+        keys = []
+        for lane in range(len(coherence)):
+            overrides = tuple(params[name][lane] for name in names)
+            prefix = prefixes.get(overrides)
+            if prefix is None:
+                prefix = prefixes[overrides] = mentorship_prefix(
+                    solver.with_overrides(dict(zip(names, overrides))), dtype
+                )
+            keys.append(lane_key(prefix, float(coherence[lane]), int(depth[lane]), float(ethics_level[lane])))
+        return keys
+
+    def phononomics_keys(
+        self,
+        solver: Any,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str,
+    ) -> List[str]:
+        """Cache keys of `PhononomicsSolver.solve_batch` lanes."""
+
+        names = sorted(params)
+        prefixes: Dict[Tuple, str] = {}
+        keys = []
+        for lane in range(len(ethics_levels)):
+            overrides = tuple(params[name][lane] for name in names)
+            prefix = prefixes.get(overrides)
+            if prefix is None:
+                prefix = prefixes[overrides] = phononomics_prefix(
+                    solver.with_overrides(dict(zip(names, overrides))), dtype
+                )
+            keys.append(lane_key(prefix, float(ethics_levels[lane]), int(depths[lane])))
+        return keys
+
+    def fetch_or_solve(
+        self,
+        keys: Sequence[str],
+        columns: Sequence[str],
+        solve: Callable[[List[int]], Mapping[str, Sequence[Any]]],
+    ) -> Tuple[Dict[str, List[Any]], int]:
+        """Serve lanes from the cache and solve the rest.
+
+        Args:
+            keys: Cache key of each lane.
+            columns: Names of the result columns to cache and return.
+            solve: Called with the indices of the missing lanes; returns their
+                result columns in the same order.
+
+        Returns:
+            The result columns of every lane and the number of cache hits.
+        """
+
+        cached = self.get_many(keys)
+        missing = [lane for lane, key in enumerate(keys) if key not in cached]
+        if missing:
+            solved = solve(missing)
+            fresh = {
+                keys[lane]: {name: solved[name][position] for name in columns}
+                for position, lane in enumerate(missing)
+            }
+            self.put_many(fresh)
+            cached.update(fresh)
+        results = {name: [cached[key][name] for key in keys] for name in columns}
+        return results, len(keys) - len(missing)
+
+    def serve_batch(
+        self,
+        solver: Any,
+        kind: str,
+        keys: Sequence[str],
+        columns: Sequence[str],
+        solve_lanes: Callable[[Any, List[int]], Mapping[str, Sequence[Any]]],
+    ) -> Dict[str, List[Any]]:
+        """Serve a solver's batch from the cache, solving only the misses.
+
+        Args:
+            solver: Solver whose ``solve_batch`` is being served; its metrics,
+                if any, record the hits and misses under ``kind``.
+            kind: Solver label for metrics, e.g. ``"mentorship"``.
+            keys: Cache key of each lane.
+            columns: Names of the result columns to cache and return.
+            solve_lanes: Called with a copy of ``solver`` that does not
+                consult the cache and the indices of the missing lanes; returns
+                their result columns in the same order.
+
+        Returns:
+            The result columns of every lane.
+        """
+
+        # Lookups and inserts happen here; the misses are solved (possibly in
+        # worker processes) by a copy that does not consult the cache again.
+        uncached = copy.copy(solver)
+        uncached.cache = None
+        results, hits = self.fetch_or_solve(keys, columns, lambda lanes: solve_lanes(uncached, lanes))
+        if solver.metrics is not None:
+            solver.metrics.record_cache(kind, hits, len(keys) - hits)
+        return results
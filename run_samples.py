@@ -4,11 +4,21 @@ Run samples script for MentorshipSolver v4.0
 
 This script executes sample_07_run and grid_experiments to demonstrate
 the MentorshipSolver functionality.
+
+With ``--profile [DIR]`` each phase runs under ``solver_profiling.profile_run``
+and its reports are written to DIR (``profiles`` by default);
+``--profile-only PHASE`` profiles just one phase.
 """
 
 from mentorship_solver import create_default_solver, MentorshipSolver
+from solver_profiling import profile_run
+from sweep_aggregation import SweepAggregator
+import argparse
+import contextlib
 import json
 
+PHASES = ("sample", "grid", "custom")
+
 
 def print_separator(title: str = ""):
     """Print a formatted separator line."""
@@ -68,17 +78,29 @@ def run_grid_experiments():
     
     # Summary statistics
     print_separator()
-    converged_count = sum(1 for r in results if r['converged'])
-    valid_count = sum(1 for r in results if r['audit_valid'])
-    avg_iterations = sum(r['iterations'] for r in results) / len(results)
-    avg_final_coherence = sum(r['final_coherence'] for r in results) / len(results)
+    aggregator = SweepAggregator(group_by=('depth',))
+    aggregator.add_batch(results)
+    overall = aggregator.overall()
+    converged_count = overall.true_counts['converged']
+    valid_count = overall.true_counts['audit_valid']
     
     print("Summary Statistics:")
-    print(f"  Total Experiments: {len(results)}")
-    print(f"  Converged: {converged_count} ({100*converged_count/len(results):.1f}%)")
-    print(f"  Audit Valid: {valid_count} ({100*valid_count/len(results):.1f}%)")
-    print(f"  Average Iterations: {avg_iterations:.2f}")
-    print(f"  Average Final Coherence: {avg_final_coherence:.4f}")
+    print(f"  Total Experiments: {overall.count}")
+    print(f"  Converged: {converged_count} ({100*converged_count/overall.count:.1f}%)")
+    print(f"  Audit Valid: {valid_count} ({100*valid_count/overall.count:.1f}%)")
+    print(f"  Average Iterations: {overall.stats['iterations'].mean:.2f}")
+    print(f"  Average Final Coherence: {overall.stats['final_coherence'].mean:.4f}")
+    
+    print("\nPer-Depth Summary:")
+    print(f"  {'Depth':<8} {'Conv %':<8} {'Valid %':<8} {'Avg Iters':<10} {'Max Iters':<10}")
+    for row in aggregator.report():
+        print(
+            f"  {row['depth']:<8} "
+            f"{100*row['converged_rate']:<8.1f} "
+            f"{100*row['audit_valid_rate']:<8.1f} "
+            f"{row['iterations_mean']:<10.2f} "
+            f"{row['iterations_max']:<10}"
+        )
     
     return results
 
@@ -129,26 +151,79 @@ def run_custom_configuration():
     return final_state
 
 
-def main():
+def parse_args(argv=None):
+    """Parse the command-line options."""
+    parser = argparse.ArgumentParser(description="Run the MentorshipSolver samples.")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="profile each phase and write the reports to DIR (default: profiles)"
+    )
+    parser.add_argument(
+        "--profile-only",
+        choices=PHASES,
+        help="profile only this phase; implies --profile"
+    )
+    args = parser.parse_args(argv)
+    if args.profile_only is not None and args.profile is None:
+        args.profile = "profiles"
+    return args
+
+
+@contextlib.contextmanager
+def profiled(phase, args, reports):
+    """Profile a phase if the options ask for it, collecting its report."""
+    if args.profile is None or args.profile_only not in (None, phase):
+        yield
+        return
+    with profile_run(args.profile, label=phase) as report:
+        yield
+    reports.append(report)
+
+
+def print_profile_reports(reports):
+    """Print where each phase's profile reports were written."""
+    print_separator("Profiles")
+    for report in reports:
+        print(f"{report.label} ({report.seconds:.3f} s):")
+        print(f"  Hot functions: {report.hot_functions}")
+        print(f"  Collapsed stacks: {report.collapsed_stacks}")
+        print(f"  Allocation sites: {report.allocations}")
+        print(f"  Raw profile: {report.profile}")
+    print()
+
+
+def main(argv=None):
     """Main execution function."""
+    args = parse_args(argv)
+    reports = []
+    
     print("\n" + "=" * 70)
     print("  MentorshipSolver v4.0 - Sample Executions")
     print("  Terminomics Framework - Coherence Architecture")
     print("=" * 70)
     
     # Run sample 07
-    sample_results = run_sample_07()
+    with profiled("sample", args, reports):
+        sample_results = run_sample_07()
     
     # Run grid experiments
-    grid_results = run_grid_experiments()
+    with profiled("grid", args, reports):
+        grid_results = run_grid_experiments()
     
     # Run custom configuration
-    custom_results = run_custom_configuration()
+    with profiled("custom", args, reports):
+        custom_results = run_custom_configuration()
     
     print_separator("Execution Complete")
     print("All samples and experiments completed successfully.")
     print(f"Total experiments run: {1 + len(grid_results) + 1}")
     print()
+    
+    if reports:
+        print_profile_reports(reports)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,309 @@
+"""Shared-memory execution backend for multi-process batch solves.
+
+Batch inputs and outputs are packed as typed columns into
+`multiprocessing.shared_memory` segments. Worker processes attach to the
+segments once, receive only ``(start, stop)`` lane ranges, and write their
+results in place, so no per-lane dictionaries cross process boundaries.
+
+The backend plugs into `MentorshipSolver.solve_batch` (and therefore
+`MentorshipSolver.grid_experiments`) and `PhononomicsSolver.solve_batch`
+through their ``backend`` argument.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from compact_precision import FLOAT64, float_typecode
+
+Layout = Tuple[Tuple[str, str], ...]
+
+MENTORSHIP_INPUTS: Layout = (("coherence", "d"), ("depth", "q"), ("ethics_level", "d"))
+MENTORSHIP_OUTPUTS: Layout = (
+    ("final_coherence", "d"),
+    ("iterations", "q"),
+    ("converged", "b"),
+    ("audit_valid", "b"),
+    ("audit_score", "d"),
+    ("measured_coherence", "d"),
+)
+PHONONOMICS_INPUTS: Layout = (("ethics_level", "d"), ("depth", "q"))
+PHONONOMICS_OUTPUTS: Layout = (
+    ("final_coherence", "d"),
+    ("sonic_score", "d"),
+    ("converged", "b"),
+    ("drift_exit", "b"),
+)
+
+_ALIGNMENT = 8
+
+
+class ColumnBlock:
+    """Typed, equal-length columns packed into one shared-memory segment."""
+
+    def __init__(self, segment: shared_memory.SharedMemory, layout: Layout, length: int, owner: bool) -> None:
+        self.segment = segment
+        self.layout = layout
+        self.length = length
+        self.owner = owner
+        self._columns: Dict[str, memoryview] = {}
+        offset = 0
+        for name, code in layout:
+            size = array.array(code).itemsize * length
+            self._columns[name] = segment.buf[offset:offset + size].cast(code)
+            offset += -(-size // _ALIGNMENT) * _ALIGNMENT
+
+    @staticmethod
+    def nbytes(layout: Layout, length: int) -> int:
+        """Segment size needed to hold `layout` for `length` lanes."""
+
+        total = sum(-(-array.array(code).itemsize * length // _ALIGNMENT) * _ALIGNMENT for _, code in layout)
+        return max(total, 1)
+
+    @classmethod
+    def create(cls, layout: Layout, length: int) -> "ColumnBlock":
+        segment = shared_memory.SharedMemory(create=True, size=cls.nbytes(layout, length))
+        return cls(segment, layout, length, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, layout: Layout, length: int) -> "ColumnBlock":
+        return cls(shared_memory.SharedMemory(name=name), layout, length, owner=False)
+
+    @property
+    def spec(self) -> Tuple[str, Layout, int]:
+        """Picklable description used by workers to attach to this block."""
+
+        return self.segment.name, self.layout, self.length
+
+    def column(self, name: str) -> memoryview:
+        return self._columns[name]
+
+    def write(self, name: str, values: Sequence[Any], start: int = 0) -> None:
+        view = self._columns[name]
+        view[start:start + len(values)] = array.array(view.format, values)
+
+    def to_lists(self) -> Dict[str, List[Any]]:
+        """Copy every column out of shared memory as Python lists."""
+
+        columns: Dict[str, List[Any]] = {}
+        for name, code in self.layout:
+            values = self._columns[name].tolist()
+            columns[name] = [bool(value) for value in values] if code == "b" else values
+        return columns
+
+    def release(self) -> None:
+        """Drop column views, close the segment and unlink it if owned."""
+
+        for view in self._columns.values():
+            view.release()
+        self._columns.clear()
+        self.segment.close()
+        if self.owner:
+            try:
+                self.segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_worker: Dict[str, Any] = {}
+
+
+def _with_precision(layout: Layout, dtype: str) -> Layout:
+    """Store floating-point columns of `layout` at the precision of `dtype`."""
+
+    code = float_typecode(dtype)
+    return tuple((name, code if kind == "d" else kind) for name, kind in layout)
+
+
+def _init_worker(
+    kind: str, solver: Any, scenario: Optional[str], dtype: str, inputs: Tuple, outputs: Tuple
+) -> None:
+    # Interrupts are handled by the parent, which cancels outstanding ranges.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Close the attached segments when the worker exits; otherwise the
+    # interpreter tears down the mappings while column views still export them.
+    multiprocessing.util.Finalize(None, _release_worker, exitpriority=10)
+    _worker.update(kind=kind, solver=solver, scenario=scenario, dtype=dtype)
+    _worker["inputs"] = ColumnBlock.attach(*inputs)
+    _worker["outputs"] = ColumnBlock.attach(*outputs)
+
+
+def _release_worker() -> None:
+    for name in ("inputs", "outputs"):
+        block = _worker.pop(name, None)
+        if block is not None:
+            block.release()
+
+
+def _run_range(bounds: Tuple[int, int]) -> int:
+    start, stop = bounds
+    inputs: ColumnBlock = _worker["inputs"]
+    outputs: ColumnBlock = _worker["outputs"]
+    solver = _worker["solver"]
+    base = {name for name, _ in (MENTORSHIP_INPUTS if _worker["kind"] == "mentorship" else PHONONOMICS_INPUTS)}
+    params = {
+        name: inputs.column(name)[start:stop].tolist()
+        for name, _ in inputs.layout
+        if name not in base
+    }
+
+    if _worker["kind"] == "mentorship":
+        columns = solver.solve_batch(
+            inputs.column("coherence")[start:stop].tolist(),
+            inputs.column("depth")[start:stop].tolist(),
+            inputs.column("ethics_level")[start:stop].tolist(),
+            params=params,
+            dtype=_worker["dtype"],
+        )
+    else:
+        columns = solver.solve_batch(
+            _worker["scenario"],
+            inputs.column("ethics_level")[start:stop].tolist(),
+            inputs.column("depth")[start:stop].tolist(),
+            params=params,
+            dtype=_worker["dtype"],
+        )
+
+    for name, _ in outputs.layout:
+        outputs.write(name, columns[name], start)
+    return stop - start
+
+
+def _stop_workers(executor: ProcessPoolExecutor) -> None:
+    """Cancel outstanding ranges and terminate the workers without waiting."""
+
+    # shutdown(wait=False) forgets the worker processes, so collect them first.
+    processes = list((executor._processes or {}).values())  # type: ignore[attr-defined]
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(timeout=1.0)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+class SharedMemoryBackend:
+    """Batch execution backend that shares columns with worker processes.
+
+    Segments are unlinked when a run finishes, fails, or is interrupted. On an
+    exception outstanding ranges are cancelled and in-flight ones finish before
+    the segments are released. On ``KeyboardInterrupt`` the run does not wait
+    for in-flight ranges: the workers are terminated and joined, and only then
+    are the segments unlinked, so Ctrl-C returns promptly. A worker that fails to
+    start (for example, because the solver cannot be unpickled) breaks the
+    pool, and the run raises ``BrokenProcessPool`` instead of restarting it.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            processes: Number of worker processes (defaults to the CPU count).
+            chunk_size: Lanes per task (defaults to about four tasks per worker).
+            mp_context: Multiprocessing start method, e.g. ``"spawn"``.
+        """
+
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+
+    def run_mentorship(
+        self,
+        solver: Any,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str = FLOAT64,
+    ) -> Dict[str, List[Any]]:
+        """Run `MentorshipSolver.solve_batch` lanes across worker processes."""
+
+        inputs = MENTORSHIP_INPUTS + tuple((name, "d") for name in sorted(params))
+        values = {"coherence": coherence, "depth": depth, "ethics_level": ethics_level, **params}
+        return self._run("mentorship", solver, None, inputs, MENTORSHIP_OUTPUTS, values, len(coherence), dtype)
+
+    def run_phononomics(
+        self,
+        solver: Any,
+        scenario: str,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str = FLOAT64,
+    ) -> Dict[str, List[Any]]:
+        """Run `PhononomicsSolver.solve_batch` lanes across worker processes."""
+
+        inputs = PHONONOMICS_INPUTS + tuple((name, "d") for name in sorted(params))
+        values = {"ethics_level": ethics_levels, "depth": depths, **params}
+        return self._run(
+            "phononomics", solver, scenario, inputs, PHONONOMICS_OUTPUTS, values, len(ethics_levels), dtype
+        )
+
+    def _chunks(self, length: int) -> List[Tuple[int, int]]:
+        size = self.chunk_size or max(1, math.ceil(length / (self.processes * 4)))
+        return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+    def _run(
+        self,
+        kind: str,
+        solver: Any,
+        scenario: Optional[str],
+        input_layout: Layout,
+        output_layout: Layout,
+        values: Mapping[str, Sequence[Any]],
+        length: int,
+        dtype: str,
+    ) -> Dict[str, List[Any]]:
+        if length == 0:
+            return {name: [] for name, _ in output_layout}
+
+        # Parameter columns stay float64; the coherence and ethics inputs and
+        # all float outputs follow the requested precision.
+        base = len(MENTORSHIP_INPUTS if kind == "mentorship" else PHONONOMICS_INPUTS)
+        input_layout = _with_precision(input_layout[:base], dtype) + input_layout[base:]
+        output_layout = _with_precision(output_layout, dtype)
+
+        context = multiprocessing.get_context(self.mp_context)
+        inputs = ColumnBlock.create(input_layout, length)
+        try:
+            outputs = ColumnBlock.create(output_layout, length)
+            try:
+                for name, _ in input_layout:
+                    inputs.write(name, values[name])
+
+                executor = ProcessPoolExecutor(
+                    max_workers=min(self.processes, length),
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(kind, solver, scenario, dtype, inputs.spec, outputs.spec),
+                )
+                try:
+                    for _ in executor.map(_run_range, self._chunks(length)):
+                        pass
+                except KeyboardInterrupt:
+                    _stop_workers(executor)
+                    raise
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+                executor.shutdown(wait=True)
+
+                return outputs.to_lists()
+            finally:
+                outputs.release()
+        finally:
+            inputs.release()
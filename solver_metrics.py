@@ -0,0 +1,496 @@
+"""Prometheus-style metrics for solvers embedded in long-running processes.
+
+`MetricsRegistry` holds counters, gauges and fixed-bucket histograms and
+renders them in the Prometheus text exposition format (`render_text`), which
+`start_http_server` can serve from a background thread. Counters and
+histograms accumulate into preallocated per-thread shards, so recording never
+takes a lock; shards are only summed when the metrics are rendered.
+
+`SolverMetrics` defines the solver metrics (latency, iterations, convergence
+and audit outcomes, Phononomics drift-floor exits, batch sizes, cache hits and
+queue depth). Pass one to `MentorshipSolver`, `PhononomicsSolver` or
+`ScheduledBackend` through their ``metrics`` argument::
+
+    metrics = SolverMetrics()
+    solver = MentorshipSolver(metrics=metrics)
+    server = start_http_server(metrics.registry, port=9108)
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, 1.0,
+)
+ITERATION_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100, 250, 1000)
+BATCH_SIZE_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+class _ThreadToken:
+    """Per-thread sentinel whose collection signals that the thread ended."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Shards:
+    """Fixed-size number slots accumulated separately by each thread.
+
+    A thread's slots are folded into a retired row when the thread ends, so
+    the live shards track the live threads rather than every thread that
+    ever recorded.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[List[float]] = []
+        self._retired: List[float] = [0] * size
+        self._lock = threading.Lock()
+
+    def local(self) -> List[float]:
+        """The calling thread's slots, allocated on first use."""
+
+        try:
+            return self._local.slots
+        except AttributeError:
+            slots = [0] * self._size
+            with self._lock:
+                self._shards.append(slots)
+            # The thread-local attributes, and with them the token, are
+            # released when the thread exits.
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, self._retire, slots)
+            self._local.slots = slots
+            return slots
+
+    def _retire(self, slots: List[float]) -> None:
+        with self._lock:
+            for index, shard in enumerate(self._shards):
+                if shard is slots:
+                    del self._shards[index]
+                    break
+            self._retired = [total + value for total, value in zip(self._retired, slots)]
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            shards = [self._retired, *self._shards]
+        return [sum(column) for column in zip(*shards)]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """Return the child metric for one combination of label values.
+
+        Resolve children once and keep them to avoid the lookup per record.
+
+        Raises:
+            ValueError: If the number of values does not match the label names.
+        """
+
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}; received {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _unlabelled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self.labels()
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        raise NotImplementedError
+
+    def _children_items(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = sorted(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        self._shards.local()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._children_items():
+            yield self.name, labels, child.value
+
+
+class _GaugeChild:
+    # A gauge holds one current value, so it is stored directly rather than
+    # sharded; ``inc``/``dec`` take a lock to stay consistent across threads.
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, such as a queue depth."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._unlabelled().dec(amount)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._children_items():
+            yield self.name, labels, child.value
+
+
+class _HistogramChild:
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One slot per bucket, one for +Inf, and one for the running sum.
+        self._shards = _Shards(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        slots = self._shards.local()
+        slots[bisect.bisect_left(self.bounds, value)] += 1
+        slots[-1] += value
+
+    def observe_many(self, values: Iterable[float]) -> None:
+        slots = self._shards.local()
+        bounds = self.bounds
+        for value in values:
+            slots[bisect.bisect_left(bounds, value)] += 1
+            slots[-1] += value
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """Return (cumulative bucket counts including +Inf, sum, count)."""
+
+        totals = self._shards.totals()
+        cumulative = []
+        running = 0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-1], running
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed, preallocated buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        bounds = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+        if not bounds:
+            raise ValueError(f"{name} needs at least one finite bucket")
+        super().__init__(name, documentation, labelnames)
+        self.bounds = bounds
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._children_items():
+            cumulative, total, count = child.snapshot()
+            for bound, value in zip(self.bounds + (math.inf,), cumulative):
+                yield f"{self.name}_bucket", {**labels, "le": _format(bound)}, value
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric {metric.name} is already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, buckets: Sequence[float], labelnames: Sequence[str] = ()
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, buckets, labelnames))
+
+    def metrics(self) -> List[_Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_text(registry: MetricsRegistry) -> str:
+    """Render every metric of `registry` in the Prometheus text format."""
+
+    lines = []
+    for metric in registry.metrics():
+        documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {metric.name} {documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric._samples():
+            if labels:
+                rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+                lines.append(f"{name}{{{rendered}}} {_format(value)}")
+            else:
+                lines.append(f"{name} {_format(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def start_http_server(registry: MetricsRegistry, port: int = 0, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``GET /metrics`` for `registry` from a daemon thread.
+
+    Args:
+        registry: Metrics to expose.
+        port: Port to listen on; 0 picks a free port (see
+            ``server.server_address``).
+        addr: Address to bind.
+
+    Returns:
+        The running server; call ``shutdown()`` and ``server_close()`` to stop it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render_text(registry).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+class _SolverChildren:
+    """Metric children of one solver label, resolved once."""
+
+    def __init__(self, metrics: "SolverMetrics", solver: str) -> None:
+        self.seconds = metrics.solve_seconds.labels(solver)
+        self.iterations = metrics.iterations.labels(solver)
+        self.solves = metrics.solves.labels(solver)
+        self.converged = metrics.converged.labels(solver)
+        self.audit_valid = metrics.audit_valid.labels(solver)
+        self.drift_exits = metrics.drift_exits.labels(solver)
+        self.batch_size = metrics.batch_size.labels(solver)
+        self.batch_seconds = metrics.batch_seconds.labels(solver)
+        self.cache_hits = metrics.cache_requests.labels(solver, "hit")
+        self.cache_misses = metrics.cache_requests.labels(solver, "miss")
+
+
+class SolverMetrics:
+    """Solver metrics recorded into a `MetricsRegistry`.
+
+    Solvers label their samples ``solver="mentorship"`` or
+    ``solver="phononomics"``. Convergence and audit rates are the
+    ``converged_total`` and ``audit_valid_total`` counters divided by
+    ``solves_total``. For Phononomics, "iterations" are operator steps.
+
+    Copies pickled to worker processes (e.g. by `SharedMemoryBackend`) start
+    detached and empty; the solver records batch outcomes in the parent from
+    the returned columns instead.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, namespace: str = "terminomics") -> None:
+        self.registry = registry or MetricsRegistry()
+        self.namespace = namespace
+        prefix = f"{namespace}_" if namespace else ""
+        labels = ("solver",)
+        self.solve_seconds = self.registry.histogram(
+            f"{prefix}solve_seconds", "Latency of single solves.", LATENCY_BUCKETS, labels
+        )
+        self.iterations = self.registry.histogram(
+            f"{prefix}solve_iterations", "Iterations (operator steps) per solve.", ITERATION_BUCKETS, labels
+        )
+        self.solves = self.registry.counter(f"{prefix}solves_total", "Completed solves.", labels)
+        self.converged = self.registry.counter(f"{prefix}converged_total", "Solves that converged.", labels)
+        self.audit_valid = self.registry.counter(
+            f"{prefix}audit_valid_total", "Solves whose final audit passed.", labels
+        )
+        self.drift_exits = self.registry.counter(
+            f"{prefix}drift_floor_exits_total", "Phononomics cycles halted early at the drift floor.", labels
+        )
+        self.batch_size = self.registry.histogram(
+            f"{prefix}batch_size", "Lanes per batch solve.", BATCH_SIZE_BUCKETS, labels
+        )
+        self.batch_seconds = self.registry.histogram(
+            f"{prefix}batch_seconds", "Latency of batch solves.", LATENCY_BUCKETS, labels
+        )
+        self.cache_requests = self.registry.counter(
+            f"{prefix}cache_requests_total", "Result cache lookups by outcome.", ("solver", "result")
+        )
+        self.queue_depth = self.registry.gauge(
+            f"{prefix}queue_depth", "Chunks waiting in scheduler queues.", ("backend",)
+        )
+        self._children: Dict[str, _SolverChildren] = {}
+
+    def __reduce__(self) -> Tuple[Any, Tuple]:
+        return SolverMetrics, (None, self.namespace)
+
+    def _for(self, solver: str) -> _SolverChildren:
+        children = self._children.get(solver)
+        if children is None:
+            children = self._children.setdefault(solver, _SolverChildren(self, solver))
+        return children
+
+    def record_solve(
+        self,
+        solver: str,
+        seconds: Optional[float],
+        iterations: int,
+        converged: bool,
+        audit_valid: bool = False,
+        drift_exit: bool = False,
+    ) -> None:
+        """Record one solve; `seconds` may be None when latency is unknown."""
+
+        children = self._for(solver)
+        if seconds is not None:
+            children.seconds.observe(seconds)
+        children.iterations.observe(iterations)
+        children.solves.inc()
+        if converged:
+            children.converged.inc()
+        if audit_valid:
+            children.audit_valid.inc()
+        if drift_exit:
+            children.drift_exits.inc()
+
+    def record_outcomes(
+        self,
+        solver: str,
+        converged: Sequence[bool],
+        iterations: Optional[Sequence[int]] = None,
+        audit_valid: Optional[Sequence[bool]] = None,
+        drift_exits: int = 0,
+    ) -> None:
+        """Record the per-lane outcomes of a batch in one pass (no latency)."""
+
+        children = self._for(solver)
+        if iterations is not None:
+            children.iterations.observe_many(iterations)
+        children.solves.inc(len(converged))
+        children.converged.inc(sum(1 for flag in converged if flag))
+        if audit_valid is not None:
+            children.audit_valid.inc(sum(1 for flag in audit_valid if flag))
+        if drift_exits:
+            children.drift_exits.inc(drift_exits)
+
+    def record_batch(self, solver: str, size: int, seconds: Optional[float] = None) -> None:
+        children = self._for(solver)
+        children.batch_size.observe(size)
+        if seconds is not None:
+            children.batch_seconds.observe(seconds)
+
+    def record_cache(self, solver: str, hits: int, misses: int) -> None:
+        children = self._for(solver)
+        if hits:
+            children.cache_hits.inc(hits)
+        if misses:
+            children.cache_misses.inc(misses)
+
+    def set_queue_depth(self, backend: str, depth: int) -> None:
+        self.queue_depth.labels(backend).set(depth)
+
+    def render(self) -> str:
+        return render_text(self.registry)
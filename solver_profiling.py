@@ -0,0 +1,252 @@
+"""Deterministic profiles and allocation snapshots of solver runs.
+
+`profile_run` wraps any block of solver work, such as a
+`MentorshipSolver.solve`, a `MentorshipSolver.grid_experiments` sweep or a
+`PhononomicsSolver` run, in `cProfile` and `tracemalloc`. On exit it writes
+four files named after the run's label into the output directory:
+
+* ``<label>.prof``: the raw profile, loadable with `pstats` or snakeviz,
+* ``<label>-hot.txt``: functions sorted by self time (``tottime``), so time
+  spent in strategy ``apply`` calls, dict copies, trace formatting or result
+  printing shows up directly,
+* ``<label>.collapsed``: ``frame;frame;frame microseconds`` lines, ready for
+  ``flamegraph.pl`` or speedscope, and
+* ``<label>-alloc.txt``: the source lines that allocated the most memory
+  during the run.
+
+Example::
+
+    with profile_run("profiles", label="grid") as report:
+        MentorshipSolver().grid_experiments(range(0, 8))
+    print(report.hot_functions)
+
+Profiles cannot be nested, because only one `cProfile` profiler can be
+active at a time.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# pstats function key: (filename, line number, function name)
+_Function = Tuple[str, int, str]
+
+_active = False
+
+
+@dataclass
+class ProfileReport:
+    """Files written by one `profile_run`.
+
+    The paths are filled in when the profiled block exits.
+
+    Attributes:
+        label: Label the files are named after.
+        seconds: Wall-clock duration of the profiled block.
+        profile: Path of the raw `pstats` profile.
+        hot_functions: Path of the sorted hot-function report.
+        collapsed_stacks: Path of the collapsed-stack file.
+        allocations: Path of the top allocation sites, or None if
+            allocations were not traced.
+    """
+
+    label: str
+    seconds: float = 0.0
+    profile: Optional[str] = None
+    hot_functions: Optional[str] = None
+    collapsed_stacks: Optional[str] = None
+    allocations: Optional[str] = None
+
+
+@contextmanager
+def profile_run(
+    output_dir: str,
+    label: str = "run",
+    sort: str = "tottime",
+    top: int = 40,
+    trace_allocations: bool = True,
+    allocation_sites: int = 25,
+) -> Iterator[ProfileReport]:
+    """Profile the enclosed block and write its reports to `output_dir`.
+
+    Args:
+        output_dir: Directory for the report files; created if missing.
+        label: Prefix of the report file names.
+        sort: `pstats` sort key of the hot-function report.
+        top: Number of functions in the hot-function report.
+        trace_allocations: Whether to trace allocations with `tracemalloc`,
+            which slows the block down considerably more than `cProfile`.
+        allocation_sites: Number of source lines in the allocation report.
+
+    Yields:
+        A `ProfileReport` whose fields are filled in on exit.
+
+    Raises:
+        RuntimeError: If another `profile_run` is already active.
+    """
+
+    global _active
+    if _active:
+        raise RuntimeError("profile_run cannot be nested")
+    os.makedirs(output_dir, exist_ok=True)
+    report = ProfileReport(label=label)
+    profiler = cProfile.Profile()
+    started_tracing = False
+    profiled = False
+    baseline = snapshot = None
+    _active = True
+    try:
+        if trace_allocations:
+            # Allocations made before the block are subtracted out, so an
+            # already running trace is reused and left running.
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            baseline = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+        profiler.enable()
+        profiled = True
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            report.seconds = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot() if trace_allocations else None
+    finally:
+        # Reset even if setup failed, so later runs are not refused as nested
+        # and a trace started here does not keep running.
+        if started_tracing:
+            tracemalloc.stop()
+        _active = False
+        if profiled:
+            _write_reports(report, profiler, snapshot, baseline, output_dir, sort, top, allocation_sites)
+
+
+def _write_reports(
+    report: ProfileReport,
+    profiler: cProfile.Profile,
+    snapshot: Optional[tracemalloc.Snapshot],
+    baseline: Optional[tracemalloc.Snapshot],
+    output_dir: str,
+    sort: str,
+    top: int,
+    allocation_sites: int,
+) -> None:
+    label = report.label
+    base = os.path.join(output_dir, label)
+    stats = pstats.Stats(profiler)
+    report.profile = base + ".prof"
+    stats.dump_stats(report.profile)
+    report.hot_functions = base + "-hot.txt"
+    with open(report.hot_functions, "w", encoding="utf-8") as handle:
+        handle.write(f"# {label}: {report.seconds:.6f} s wall clock, sorted by {sort}\n")
+        stats.stream = handle
+        stats.sort_stats(sort).print_stats(top)
+    report.collapsed_stacks = base + ".collapsed"
+    with open(report.collapsed_stacks, "w", encoding="utf-8") as handle:
+        for stack, microseconds in collapsed_stacks(stats).items():
+            handle.write(f"{stack} {microseconds}\n")
+    if snapshot is not None:
+        report.allocations = base + "-alloc.txt"
+        with open(report.allocations, "w", encoding="utf-8") as handle:
+            handle.write(f"# {label}: top {allocation_sites} allocation sites\n")
+            for line in allocation_report(snapshot, baseline, allocation_sites):
+                handle.write(line + "\n")
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> Dict[str, int]:
+    """Fold a profile into collapsed stacks weighted by self time.
+
+    `cProfile` records caller/callee pairs rather than whole stacks, so each
+    function's time is split across its callers in proportion to the time it
+    spent when called from each of them. Recursive calls are cut at their
+    first repetition, and stacks below a microsecond are not followed.
+
+    Args:
+        stats: Profile to fold.
+        max_depth: Stacks deeper than this are truncated.
+
+    Returns:
+        Mapping of ``;``-joined stacks, outermost frame first, to self time
+        in whole microseconds; stacks rounding to zero are left out.
+    """
+
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: Dict[_Function, List[Tuple[_Function, float]]] = defaultdict(list)
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller].append((function, edge[3]))
+    roots = [function for function, entry in entries.items() if not entry[4]]
+
+    folded: Dict[str, float] = defaultdict(float)
+    # (function, share of its time on this stack, frames above it)
+    pending: List[Tuple[_Function, float, Tuple[_Function, ...]]] = [
+        (function, 1.0, ()) for function in roots
+    ]
+    while pending:
+        function, share, above = pending.pop()
+        stack = above + (function,)
+        _, _, self_time, total_time, _ = entries[function]
+        folded[";".join(_frame_name(frame) for frame in stack)] += self_time * share
+        if len(stack) >= max_depth or not total_time:
+            continue
+        for callee, edge_time in callees.get(function, ()):
+            callee_total = entries[callee][3]
+            if callee in stack or share * edge_time < 5e-7:
+                continue
+            pending.append((callee, share * edge_time / callee_total, stack))
+
+    return {
+        stack: round(seconds * 1e6)
+        for stack, seconds in sorted(folded.items())
+        if round(seconds * 1e6) > 0
+    }
+
+
+def allocation_report(
+    snapshot: tracemalloc.Snapshot,
+    baseline: Optional[tracemalloc.Snapshot] = None,
+    limit: int = 25,
+) -> List[str]:
+    """Describe the source lines that allocated the most memory.
+
+    Args:
+        snapshot: Snapshot taken after the profiled work.
+        baseline: Snapshot taken before it; its allocations are subtracted.
+        limit: Number of lines to report.
+
+    Returns:
+        One line per allocation site, largest first.
+    """
+
+    ignored = (
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    )
+    snapshot = snapshot.filter_traces(ignored)
+    if baseline is None:
+        return [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+    differences = snapshot.compare_to(baseline.filter_traces(ignored), "lineno")
+    grown = sorted((stat for stat in differences if stat.size_diff > 0), key=lambda stat: -stat.size_diff)
+    return [str(stat) for stat in grown[:limit]]
+
+
+def _frame_name(function: _Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        # Built-ins such as "<method 'copy' of 'dict' objects>"
+        frame = name
+    else:
+        frame = f"{os.path.basename(filename)}:{name}:{line}"
+    # ";" separates frames and the last space separates the weight.
+    return frame.replace(";", ",")
@@ -0,0 +1,227 @@
+"""Streaming solves for entities whose ``ethics_level`` evolves over time.
+
+A `StreamingSolver` keeps the last fixed point of every monitored entity.
+Each `StreamingSolver.update` takes one tick of ``(entity, ethics_level)``
+updates as columns and
+
+* skips entities whose ethics level moved by at most ``tolerance`` since
+  they were last solved (so slow drift still triggers a re-solve once it adds
+  up, and repeated values are always skipped),
+* re-solves the rest in one ``solve_batch`` call, warm-started from each
+  entity's previous fixed point (new entities start from
+  ``initial_coherence``), and
+* returns results only for the re-solved entities.
+
+Work per tick is proportional to the number of updates received, not to the
+number of entities tracked. Entities not updated for ``ttl`` ticks expire,
+and ``max_entities`` bounds memory by evicting the least recently updated::
+
+    stream = StreamingSolver(MentorshipSolver(), depth=3, tolerance=1e-3, ttl=100)
+    for tick in feed:
+        changed = stream.update(tick.entity_ids, tick.ethics_levels)
+        publish(changed)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+from compact_precision import FLOAT64, check_dtype
+from mentorship_solver import BATCH_COLUMNS, MentorshipSolver
+
+
+@dataclass
+class EntityState:
+    """Last solve of one entity."""
+
+    ethics_level: float
+    depth: int
+    coherence: float
+    last_tick: int
+    result: Dict[str, Any]
+
+
+@dataclass
+class TickReport:
+    """What one `StreamingSolver.update` call did."""
+
+    tick: int
+    updates: int = 0
+    solved: int = 0
+    warm_started: int = 0
+    skipped: int = 0
+    expired: int = 0
+    iterations: int = 0
+
+
+class StreamingSolver:
+    """Incremental `MentorshipSolver` solves over a stream of entity updates."""
+
+    def __init__(
+        self,
+        solver: Optional[MentorshipSolver] = None,
+        depth: int = 3,
+        tolerance: float = 0.0,
+        initial_coherence: float = 0.4,
+        ttl: Optional[int] = None,
+        max_entities: Optional[int] = None,
+        backend: Optional[Any] = None,
+        dtype: str = FLOAT64,
+    ) -> None:
+        """
+        Args:
+            solver: Solver used for every tick (a default solver if None).
+            depth: Depth of entities whose updates do not carry one.
+            tolerance: Ethics-level changes no larger than this, measured
+                from the level an entity was last solved at, are skipped; the
+                default skips only exact repeats.
+            initial_coherence: Starting coherence of entities seen for the
+                first time.
+            ttl: Expire entities not updated for this many ticks.
+            max_entities: Evict the least recently updated entities beyond
+                this count.
+            backend: Optional execution backend for each tick's batch solve.
+            dtype: ``"float64"`` or ``"float32"``.
+
+        Raises:
+            ValueError: If tolerance is negative, ttl or max_entities is below
+                1, or dtype is unknown.
+        """
+
+        check_dtype(dtype)
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be non-negative; received {tolerance}")
+        if ttl is not None and ttl < 1:
+            raise ValueError(f"ttl must be at least 1; received {ttl}")
+        if max_entities is not None and max_entities < 1:
+            raise ValueError(f"max_entities must be at least 1; received {max_entities}")
+        self.solver = solver or MentorshipSolver()
+        self.depth = depth
+        self.tolerance = tolerance
+        self.initial_coherence = initial_coherence
+        self.ttl = ttl
+        self.max_entities = max_entities
+        self.backend = backend
+        self.dtype = dtype
+        self.tick = 0
+        self.last_report: Optional[TickReport] = None
+        # Least recently updated first, so expiry only inspects the front.
+        self._entities: "OrderedDict[Hashable, EntityState]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity: Hashable) -> bool:
+        return entity in self._entities
+
+    def get(self, entity: Hashable) -> Optional[Dict[str, Any]]:
+        """Latest result of an entity, or None if it is not tracked."""
+
+        state = self._entities.get(entity)
+        return None if state is None else dict(state.result)
+
+    def forget(self, entity: Hashable) -> None:
+        """Stop tracking an entity."""
+
+        self._entities.pop(entity, None)
+
+    def update(
+        self,
+        entities: Sequence[Hashable],
+        ethics_levels: Sequence[float],
+        depths: Optional[Sequence[int]] = None,
+    ) -> Dict[str, List[Any]]:
+        """Apply one tick of updates and re-solve the entities that changed.
+
+        Args:
+            entities: Entity identifiers; a later update of the same entity
+                within the tick supersedes an earlier one.
+            ethics_levels: New ethics level of each entity.
+            depths: Optional depth of each entity (``depth`` if None); a
+                depth change always triggers a re-solve.
+
+        Returns:
+            Columns for the re-solved entities only: ``entity``, the
+            ``BATCH_COLUMNS`` of `MentorshipSolver.solve_batch` and
+            ``warm_started``.
+
+        Raises:
+            ValueError: If column lengths differ or an ethics level is out of
+                bounds [0.0, 1.0].
+        """
+
+        if len(ethics_levels) != len(entities) or (depths is not None and len(depths) != len(entities)):
+            raise ValueError("entities, ethics_levels and depths must share one length")
+        for ethics_level in ethics_levels:
+            if not (0.0 <= ethics_level <= 1.0):
+                raise ValueError(f"ethics_level must be in [0.0, 1.0], got {ethics_level}")
+        self.tick += 1
+        report = TickReport(tick=self.tick, updates=len(entities))
+        self.last_report = report
+
+        latest: Dict[Hashable, int] = {}
+        for lane, entity in enumerate(entities):
+            latest[entity] = lane
+
+        solve_entities: List[Hashable] = []
+        coherence: List[float] = []
+        depth_column: List[int] = []
+        ethics_column: List[float] = []
+        warm: List[bool] = []
+        for entity, lane in latest.items():
+            ethics_level = ethics_levels[lane]
+            depth = self.depth if depths is None else depths[lane]
+            state = self._entities.get(entity)
+            if state is not None:
+                state.last_tick = self.tick
+                self._entities.move_to_end(entity)
+                if depth == state.depth and abs(ethics_level - state.ethics_level) <= self.tolerance:
+                    report.skipped += 1
+                    continue
+            solve_entities.append(entity)
+            coherence.append(self.initial_coherence if state is None else state.coherence)
+            depth_column.append(depth)
+            ethics_column.append(ethics_level)
+            warm.append(state is not None)
+
+        batch = self.solver.solve_batch(
+            coherence, depth_column, ethics_column, backend=self.backend, dtype=self.dtype
+        )
+
+        for lane, entity in enumerate(solve_entities):
+            result = {name: batch[name][lane] for name in BATCH_COLUMNS}
+            result["warm_started"] = warm[lane]
+            self._entities[entity] = EntityState(
+                ethics_level=ethics_column[lane],
+                depth=depth_column[lane],
+                coherence=result["final_coherence"],
+                last_tick=self.tick,
+                result=result,
+            )
+            self._entities.move_to_end(entity)
+        report.solved = len(solve_entities)
+        report.warm_started = sum(warm)
+        report.iterations = sum(batch["iterations"])
+        report.expired = self._expire()
+
+        changed: Dict[str, List[Any]] = {"entity": solve_entities}
+        changed.update(batch)
+        changed["warm_started"] = warm
+        return changed
+
+    def _expire(self) -> int:
+        expired = 0
+        if self.ttl is not None:
+            while self._entities:
+                entity, state = next(iter(self._entities.items()))
+                if self.tick - state.last_tick < self.ttl:
+                    break
+                del self._entities[entity]
+                expired += 1
+        if self.max_entities is not None:
+            while len(self._entities) > self.max_entities:
+                self._entities.popitem(last=False)
+                expired += 1
+        return expired
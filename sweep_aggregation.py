@@ -0,0 +1,210 @@
+"""Streaming group-by aggregation of sweep and batch results.
+
+`SweepAggregator` consumes result rows (or column batches) from any sweep or
+batch API and keeps running statistics per group, using one-pass updates
+(Welford) that merge exactly across workers (Chan et al.). Memory use is
+proportional to the number of groups, not the number of results.
+
+Example::
+
+    aggregator = SweepAggregator(group_by=("depth",))
+    aggregator.add_batch(solver.grid_experiments())
+    for row in aggregator.report():
+        print(row["depth"], row["converged_rate"], row["iterations_mean"])
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+DEFAULT_STAT_FIELDS = ("iterations", "final_coherence")
+DEFAULT_RATE_FIELDS = ("converged", "audit_valid")
+DEFAULT_HISTOGRAM_FIELD = "iterations"
+
+
+@dataclass
+class RunningStats:
+    """Count, mean, variance, minimum and maximum of a stream of numbers."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than two values)."""
+
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class GroupStats:
+    """Running statistics of the results in one group.
+
+    Attributes:
+        count: Number of results.
+        stats: Running statistics per numeric field.
+        true_counts: Number of results with each rate field set.
+        present_counts: Number of results carrying each rate field.
+        histogram: Counts of each value of the histogram field.
+    """
+
+    count: int = 0
+    stats: Dict[str, RunningStats] = field(default_factory=dict)
+    true_counts: Counter = field(default_factory=Counter)
+    present_counts: Counter = field(default_factory=Counter)
+    histogram: Counter = field(default_factory=Counter)
+
+    def rate(self, name: str) -> float:
+        present = self.present_counts[name]
+        return self.true_counts[name] / present if present else math.nan
+
+    def merge(self, other: "GroupStats") -> None:
+        self.count += other.count
+        for name, stats in other.stats.items():
+            self.stats.setdefault(name, RunningStats()).merge(stats)
+        self.true_counts.update(other.true_counts)
+        self.present_counts.update(other.present_counts)
+        self.histogram.update(other.histogram)
+
+
+class SweepAggregator:
+    """Group-by aggregator for sweep and batch results."""
+
+    def __init__(
+        self,
+        group_by: Sequence[str] = (),
+        stat_fields: Sequence[str] = DEFAULT_STAT_FIELDS,
+        rate_fields: Sequence[str] = DEFAULT_RATE_FIELDS,
+        histogram_field: Optional[str] = DEFAULT_HISTOGRAM_FIELD,
+    ) -> None:
+        """
+        Args:
+            group_by: Result fields (e.g. ``depth``, ``ethics_level`` or any
+                parameter column) whose values define a group; an empty
+                sequence aggregates globally.
+            stat_fields: Numeric fields tracked with mean/variance/min/max.
+            rate_fields: Boolean fields tracked as rates.
+            histogram_field: Integer field tracked as an exact histogram.
+        """
+
+        self.group_by = tuple(group_by)
+        self.stat_fields = tuple(stat_fields)
+        self.rate_fields = tuple(rate_fields)
+        self.histogram_field = histogram_field
+        self._groups: Dict[Tuple[Any, ...], GroupStats] = {}
+
+    def add(self, result: Mapping[str, Any]) -> None:
+        """Fold one result row into its group."""
+
+        key = tuple(result.get(name) for name in self.group_by)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = GroupStats()
+        group.count += 1
+        for name in self.stat_fields:
+            value = result.get(name)
+            if value is not None and not (isinstance(value, float) and math.isnan(value)):
+                stats = group.stats.get(name)
+                if stats is None:
+                    stats = group.stats[name] = RunningStats()
+                stats.add(value)
+        for name in self.rate_fields:
+            if name in result:
+                group.present_counts[name] += 1
+                if result[name]:
+                    group.true_counts[name] += 1
+        if self.histogram_field is not None and result.get(self.histogram_field) is not None:
+            group.histogram[result[self.histogram_field]] += 1
+
+    def add_batch(self, results: Union[Iterable[Mapping[str, Any]], Mapping[str, Sequence[Any]]]) -> None:
+        """Fold many results, given as rows or as a dictionary of columns."""
+
+        if isinstance(results, Mapping):
+            names = list(results)
+            for values in zip(*(results[name] for name in names)):
+                self.add(dict(zip(names, values)))
+        else:
+            for result in results:
+                self.add(result)
+
+    def merge(self, other: "SweepAggregator") -> "SweepAggregator":
+        """Fold another aggregator's partial results into this one.
+
+        Raises:
+            ValueError: If the aggregators group or track different fields.
+        """
+
+        if (other.group_by, other.stat_fields, other.rate_fields, other.histogram_field) != (
+            self.group_by, self.stat_fields, self.rate_fields, self.histogram_field
+        ):
+            raise ValueError("cannot merge aggregators with different configurations")
+        for key, group in other._groups.items():
+            self._groups.setdefault(key, GroupStats()).merge(group)
+        return self
+
+    def groups(self) -> Dict[Tuple[Any, ...], GroupStats]:
+        return dict(self._groups)
+
+    def overall(self) -> GroupStats:
+        """Statistics over all groups combined."""
+
+        total = GroupStats()
+        for group in self._groups.values():
+            total.merge(group)
+        return total
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Return one summary row per group, ordered by group key."""
+
+        rows = []
+        for key in sorted(self._groups, key=lambda k: tuple((v is None, v) for v in k)):
+            group = self._groups[key]
+            row: Dict[str, Any] = dict(zip(self.group_by, key))
+            row["count"] = group.count
+            for name in self.rate_fields:
+                row[f"{name}_rate"] = group.rate(name)
+            for name in self.stat_fields:
+                stats = group.stats.get(name, RunningStats())
+                row[f"{name}_mean"] = stats.mean if stats.count else math.nan
+                row[f"{name}_std"] = stats.std
+                row[f"{name}_min"] = stats.minimum if stats.count else math.nan
+                row[f"{name}_max"] = stats.maximum if stats.count else math.nan
+            if self.histogram_field is not None:
+                row[f"{self.histogram_field}_histogram"] = dict(sorted(group.histogram.items()))
+            rows.append(row)
+        return rows
@@ -0,0 +1,345 @@
+"""Columnar storage and post-hoc re-audit of sweep results.
+
+Sweep and batch results can be held as a list of row dictionaries (as
+returned by `MentorshipSolver.grid_experiments`) or as a dictionary of
+columns (as returned by `MentorshipSolver.solve_batch`). This module converts
+between the two, persists results to a compact binary column file together
+with the provenance of the operator bundle that produced them, and recomputes
+the audit and measurement columns under new strategy settings without
+re-running the sweep.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import math
+import os
+import struct
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from compact_precision import FLOAT64, float_typecode
+from mentorship_solver import (
+    BUNDLE_SLOTS,
+    AuditStrategy,
+    MeasureStrategy,
+    OperatorBundle,
+    build_execution_plan,
+    declared_dependencies,
+)
+
+MAGIC = b"TRMRES\x01\n"
+_HEADER_SIZE = struct.Struct("<I")
+
+Rows = List[Dict[str, Any]]
+Columns = Dict[str, List[Any]]
+
+# Typecodes of the columns produced by the solvers; other columns are inferred.
+COLUMN_TYPES: Dict[str, str] = {
+    "depth": "q",
+    "ethics_level": "d",
+    "initial_coherence": "d",
+    "final_coherence": "d",
+    "iterations": "q",
+    "converged": "b",
+    "audit_valid": "b",
+    "audit_score": "d",
+    "measured_coherence": "d",
+    "warm_started": "b",
+    "iterations_saved": "q",
+    "drift_exit": "b",
+}
+
+
+class ReauditError(ValueError):
+    """Raised when stored results cannot be re-audited without a re-solve."""
+
+
+@dataclass
+class StoredResults:
+    """Columns loaded from, or destined for, a result file.
+
+    Attributes:
+        columns: Result columns, one list per field.
+        provenance: Description of the operator bundle that produced the
+            results (see `describe_bundle`), or None if unknown.
+    """
+
+    columns: Columns
+    provenance: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def rows(self) -> Rows:
+        return to_rows(self.columns)
+
+
+def to_columns(rows: Sequence[Mapping[str, Any]]) -> Columns:
+    """Convert row dictionaries to columns; missing fields become None."""
+
+    names: Dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def to_rows(columns: Mapping[str, Sequence[Any]]) -> Rows:
+    """Convert columns to row dictionaries."""
+
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
+
+
+def _describe_strategy(strategy: Any) -> Dict[str, Any]:
+    params = (
+        {f.name: getattr(strategy, f.name) for f in fields(strategy)}
+        if is_dataclass(strategy)
+        else dict(getattr(strategy, "__dict__", {}))
+    )
+    return {"strategy": type(strategy).__name__, "params": params}
+
+
+def describe_bundle(operators: OperatorBundle) -> Dict[str, Any]:
+    """Describe a bundle's strategies and which of them are observation-only."""
+
+    plan = build_execution_plan(operators)
+    description: Dict[str, Any] = {
+        slot: _describe_strategy(getattr(operators, slot)) for slot in BUNDLE_SLOTS
+    }
+    description["observation_only"] = [
+        slot for slot in BUNDLE_SLOTS if any(getattr(operators, slot) is s for s in plan.deferred)
+    ]
+    return description
+
+
+def _typecode(name: str, values: Sequence[Any], dtype: str) -> str:
+    if name in COLUMN_TYPES:
+        code = COLUMN_TYPES[name]
+    else:
+        present = [value for value in values if value is not None]
+        if present and all(isinstance(value, bool) for value in present):
+            code = "b"
+        elif present and all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+            code = "q"
+        else:
+            code = "d"
+    return float_typecode(dtype) if code == "d" else code
+
+
+def _encode(code: str, values: Sequence[Any]) -> array.array:
+    if code in ("d", "f"):
+        return array.array(code, (math.nan if value is None else value for value in values))
+    return array.array(code, (0 if value is None else value for value in values))
+
+
+def save_results(
+    path: Union[str, os.PathLike],
+    results: Union[Rows, Mapping[str, Sequence[Any]], StoredResults],
+    operators: Optional[OperatorBundle] = None,
+    dtype: str = FLOAT64,
+) -> None:
+    """Write results to a binary column file.
+
+    Args:
+        path: Destination file.
+        results: Rows, columns or `StoredResults` to write.
+        operators: Bundle that produced the results, recorded as provenance
+            for `reaudit`; defaults to the provenance of `StoredResults`.
+        dtype: ``"float64"`` or ``"float32"``; float32 halves the size of
+            floating-point columns.
+
+    Raises:
+        ValueError: If a column holds non-numeric values or `dtype` is unknown.
+    """
+
+    provenance = describe_bundle(operators) if operators is not None else None
+    if isinstance(results, StoredResults):
+        provenance = provenance or results.provenance
+        columns: Mapping[str, Sequence[Any]] = results.columns
+    elif isinstance(results, Mapping):
+        columns = results
+    else:
+        columns = to_columns(results)
+
+    encoded = []
+    for name, values in columns.items():
+        try:
+            encoded.append((name, _encode(_typecode(name, values, dtype), values)))
+        except TypeError as error:
+            raise ValueError(f"column {name!r} is not numeric") from error
+    lengths = {len(values) for _, values in encoded}
+    if len(lengths) > 1:
+        raise ValueError(f"result columns must share one length; got {sorted(lengths)}")
+
+    header = json.dumps({
+        "length": lengths.pop() if lengths else 0,
+        "byteorder": sys.byteorder,
+        "columns": [[name, values.typecode] for name, values in encoded],
+        "provenance": provenance,
+    }).encode("utf-8")
+
+    with open(path, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(_HEADER_SIZE.pack(len(header)))
+        handle.write(header)
+        for _, values in encoded:
+            handle.write(values.tobytes())
+
+
+def load_results(path: Union[str, os.PathLike]) -> StoredResults:
+    """Read a result file written by `save_results`.
+
+    Raises:
+        ValueError: If the file is not a result file.
+    """
+
+    with open(path, "rb") as handle:
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a sweep result file")
+        (size,) = _HEADER_SIZE.unpack(handle.read(_HEADER_SIZE.size))
+        header = json.loads(handle.read(size).decode("utf-8"))
+
+        columns: Columns = {}
+        for name, code in header["columns"]:
+            values = array.array(code)
+            values.frombytes(handle.read(values.itemsize * header["length"]))
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            columns[name] = [bool(v) for v in values] if code == "b" else values.tolist()
+
+    return StoredResults(columns=columns, provenance=header["provenance"])
+
+
+def _check_observer(strategy: Any, role: str) -> None:
+    # _recompute hands the strategy a state holding only the final coherence.
+    declared = declared_dependencies(strategy)
+    if declared is None or not declared[0] <= {"coherence"} or "coherence" in declared[1]:
+        raise ReauditError(
+            f"new {role} strategy {type(strategy).__name__} must declare reads/writes, "
+            "may read only coherence and must not write coherence"
+        )
+
+
+def _check_provenance(provenance: Optional[Mapping[str, Any]], audit: bool, measure: bool) -> None:
+    if provenance is None:
+        raise ReauditError(
+            "results do not record the bundle that produced them; pass source_operators "
+            "so feedback from its audit and measure strategies can be ruled out"
+        )
+    observation_only = set(provenance["observation_only"])
+    for slot, requested in (("audit", audit), ("measure", measure)):
+        if requested and slot not in observation_only:
+            raise ReauditError(
+                f"results were produced by a bundle whose {slot} strategy feeds back into "
+                "coherence (or does not declare its dependencies); re-run the sweep instead"
+            )
+
+
+def _recompute(
+    columns: Mapping[str, Sequence[Any]],
+    audit: Optional[Any],
+    measure: Optional[Any],
+) -> Columns:
+    for required in ("final_coherence", "ethics_level"):
+        if required not in columns:
+            raise ReauditError(f"results have no {required!r} column")
+
+    coherence = columns["final_coherence"]
+    ethics = columns["ethics_level"]
+    # Lanes that never iterated (depth 0) were never audited or measured.
+    if "iterations" in columns:
+        observed = [iterations > 0 for iterations in columns["iterations"]]
+    else:
+        observed = [depth != 0 for depth in columns.get("depth", [1] * len(coherence))]
+
+    length = len(coherence)
+    updated: Columns = {name: list(values) for name, values in columns.items()}
+    if audit is not None:
+        valid = updated.setdefault("audit_valid", [False] * length)
+        score = updated.setdefault("audit_score", [math.nan] * length)
+    if measure is not None:
+        measured = updated.setdefault("measured_coherence", [math.nan] * length)
+
+    audit_eval = getattr(audit, "evaluate", None) if type(audit) is AuditStrategy else None
+    measure_eval = getattr(measure, "evaluate", None) if type(measure) is MeasureStrategy else None
+
+    for lane in range(length):
+        if not observed[lane]:
+            continue
+        c, e = coherence[lane], ethics[lane]
+        if audit is not None:
+            if audit_eval is not None:
+                valid[lane], score[lane] = audit_eval(c, e)
+            else:
+                state = audit.apply({"coherence": c}, {"ethics_level": e})
+                valid[lane], score[lane] = state.get("audit_valid", False), state.get("audit_score", math.nan)
+        if measure is not None:
+            if measure_eval is not None:
+                measured[lane] = measure_eval(c, e)
+            else:
+                state = measure.apply({"coherence": c}, {"ethics_level": e})
+                measured[lane] = state.get("measured_coherence", math.nan)
+    return updated
+
+
+def reaudit(
+    results: Union[Rows, Mapping[str, Sequence[Any]], StoredResults, str, os.PathLike],
+    audit: Optional[Any] = None,
+    measure: Optional[Any] = None,
+    source_operators: Optional[OperatorBundle] = None,
+) -> Union[Rows, Columns, StoredResults]:
+    """Recompute audit and measurement columns under new strategies.
+
+    ``audit_valid``, ``audit_score`` and ``measured_coherence`` depend only on
+    the final coherence and ``ethics_level`` when the source bundle's audit and
+    measure strategies are observation-only, so they can be recomputed from
+    stored results in one pass over the columns without re-solving.
+
+    Args:
+        results: Rows, columns, `StoredResults`, or the path of a result file.
+        audit: New audit strategy (audit columns are left untouched if None).
+        measure: New measure strategy (``measured_coherence`` is left
+            untouched if None).
+        source_operators: Bundle that produced the results. Required for
+            in-memory results and for stored results without provenance;
+            overrides stored provenance otherwise.
+
+    Returns:
+        Results of the same kind as given (rows, columns, or `StoredResults`
+        for stored inputs) with the derived columns recomputed.
+
+    Raises:
+        ReauditError: If the source bundle is unknown, if its audit or
+            measure strategy feeds back into coherence, if a new strategy is
+            not observation-only, or if required columns are missing.
+        ValueError: If neither `audit` nor `measure` is given.
+    """
+
+    if audit is None and measure is None:
+        raise ValueError("reaudit needs a new audit and/or measure strategy")
+    if audit is not None:
+        _check_observer(audit, "audit")
+    if measure is not None:
+        _check_observer(measure, "measure")
+
+    if isinstance(results, (str, os.PathLike)):
+        results = load_results(results)
+
+    if isinstance(results, StoredResults):
+        provenance = describe_bundle(source_operators) if source_operators is not None else results.provenance
+        _check_provenance(provenance, audit is not None, measure is not None)
+        if provenance is not None:
+            provenance = dict(provenance)
+            for slot, strategy in (("audit", audit), ("measure", measure)):
+                if strategy is not None:
+                    provenance[slot] = _describe_strategy(strategy)
+        return StoredResults(columns=_recompute(results.columns, audit, measure), provenance=provenance)
+
+    provenance = describe_bundle(source_operators) if source_operators is not None else None
+    _check_provenance(provenance, audit is not None, measure is not None)
+    if isinstance(results, Mapping):
+        return _recompute(results, audit, measure)
+    return to_rows(_recompute(to_columns(results), audit, measure))
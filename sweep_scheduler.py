@@ -0,0 +1,476 @@
+"""Cost-model-driven scheduling of heterogeneous batch lanes.
+
+Lane cost varies widely across a sweep: ``depth == 0`` lanes return
+immediately, while low-ethics, high-depth lanes can run to ``max_iterations``.
+`ScheduledBackend` predicts each lane's iteration count with a `CostModel`,
+packs lanes longest-first into chunks of roughly equal predicted cost, deals
+the chunks to per-worker queues, and lets idle workers steal the cheapest
+remaining chunks from the busiest queue to absorb mispredictions.
+
+The backend plugs into `MentorshipSolver.solve_batch` (and therefore
+`MentorshipSolver.grid_experiments`) and `PhononomicsSolver.solve_batch`
+through their ``backend`` argument. Every run records predicted against actual
+iterations in a `ScheduleReport` so the model can be checked on real sweeps.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from compact_precision import FLOAT64
+from mentorship_solver import BATCH_COLUMNS as MENTORSHIP_COLUMNS
+from mentorship_solver import AdaptStrategy, MeasureStrategy, ResonateStrategy, bundle_fingerprint
+from phononomics_solver import BATCH_COLUMNS as PHONONOMICS_COLUMNS
+
+# Fixed per-lane cost, in iterations, so that lanes predicted to take no
+# iterations (depth 0) still count towards a chunk's load.
+LANE_OVERHEAD = 1.0
+
+
+class CostModel:
+    """Predicts the iterations a lane needs before it runs.
+
+    For a fixed depth and ethics level, one pass of the per-iteration
+    strategies maps coherence in ``[0, 1]`` affinely, ``c -> a * c + b``, so
+    successive coherence steps shrink geometrically by ``|a|`` and the
+    iteration at which the step falls below ``converge_threshold`` follows in
+    closed form. For the stock `ResonateStrategy`, `MeasureStrategy` and
+    `AdaptStrategy`, ``a`` and ``b`` come straight from their parameters.
+    Any other loop is probed by applying one pass at two coherences, once
+    per distinct bundle, depth and ethics level, and the fitted map is cached
+    on the model. Every prediction is capped at ``max_iterations``.
+
+    Predictions do not depend on the batch dtype: float32 batches narrow only
+    their inputs and outputs, and the iteration itself runs in float64.
+    """
+
+    def __init__(self) -> None:
+        self._probed: Dict[Tuple, Tuple[float, float]] = {}
+
+    def predict_mentorship(self, solver: Any, coherence: float, depth: int, ethics_level: float) -> int:
+        """Predicted iterations of ``solver.solve`` for one lane."""
+
+        limit = max(solver.max_iterations, 0)
+        if depth == 0:
+            return 0
+        threshold = solver.converge_threshold
+        a, b = self.loop_map(solver, depth, ethics_level)
+        first = abs((a - 1.0) * coherence + b)
+        rate = abs(a)
+        if first < threshold:
+            iterations = 1
+        elif rate == 0.0:
+            iterations = 2
+        elif rate >= 1.0 or threshold <= 0.0:
+            iterations = limit
+        else:
+            # Smallest k with first * rate ** (k - 1) < threshold.
+            iterations = math.floor(math.log(threshold / first) / math.log(rate)) + 2
+        return min(iterations, limit)
+
+    def loop_map(self, solver: Any, depth: int, ethics_level: float) -> Tuple[float, float]:
+        """Return ``(a, b)`` such that one loop pass maps ``c`` to ``a * c + b``."""
+
+        loop = solver.execution_plan().loop
+        composed = _stock_loop_map(loop, depth, ethics_level)
+        if composed is not None:
+            return composed
+        key = (bundle_fingerprint(solver.operators), depth, ethics_level)
+        if key not in self._probed:
+            context = {"depth": depth, "ethics_level": ethics_level}
+            ends = []
+            for coherence in (0.0, 1.0):
+                state: Dict[str, Any] = {"coherence": coherence}
+                for strategy in loop:
+                    state = strategy.apply(state, context)
+                ends.append(state.get("coherence", 0.5))
+            self._probed[key] = (ends[1] - ends[0], ends[0])
+        return self._probed[key]
+
+    def predict_phononomics(self, solver: Any, ethics_level: float, depth: int) -> int:
+        """Predicted operator steps of ``solver.solve`` for one lane.
+
+        Phononomics lanes run one operator per depth step and may only stop
+        earlier at the drift floor, so ``depth`` is an upper bound.
+        """
+
+        return depth
+
+
+def _stock_loop_map(loop: Sequence[Any], depth: int, ethics_level: float) -> Optional[Tuple[float, float]]:
+    """Compose the affine coherence map of a loop of stock strategies.
+
+    Returns None if any strategy is not a stock one, or if its parameters
+    would let coherence leave ``[0, 1]`` and hit a clamp.
+    """
+
+    a, b = 1.0, 0.0
+    for strategy in loop:
+        kind = type(strategy)
+        if kind is MeasureStrategy:
+            continue
+        if kind is ResonateStrategy:
+            pull = strategy.resonance_factor / (1.0 + depth)
+        elif kind is AdaptStrategy:
+            pull = ethics_level * strategy.adaptation_rate / (1.0 + depth)
+        else:
+            return None
+        if not 0.0 <= pull <= 1.0:
+            return None
+        # c -> c + pull * (1 - c) = (1 - pull) * c + pull
+        a, b = (1.0 - pull) * a, (1.0 - pull) * b + pull
+    return a, b
+
+
+@dataclass
+class Chunk:
+    """Lanes dispatched to a worker as one task.
+
+    Attributes:
+        lanes: Indices of the lanes in the batch.
+        predicted: Predicted iterations of the chunk, including lane overhead.
+    """
+
+    lanes: Tuple[int, ...]
+    predicted: float
+
+
+def pack_longest_first(costs: Sequence[float], workers: int, chunks_per_worker: int = 4) -> List[Deque[Chunk]]:
+    """Pack lanes into balanced chunks and deal them to per-worker queues.
+
+    Lanes are taken in decreasing order of cost and grouped until a chunk
+    reaches the target cost of ``total / (workers * chunks_per_worker)``, so
+    expensive lanes form small chunks and cheap lanes are batched together.
+    Each chunk then goes to the least-loaded worker (longest processing time
+    first). Every queue holds its chunks in decreasing order of cost.
+
+    Args:
+        costs: Predicted cost of each lane.
+        workers: Number of worker queues.
+        chunks_per_worker: Average number of chunks per worker.
+
+    Returns:
+        One queue of chunks per worker.
+    """
+
+    queues: List[Deque[Chunk]] = [deque() for _ in range(workers)]
+    if not costs:
+        return queues
+
+    order = sorted(range(len(costs)), key=lambda lane: (-costs[lane], lane))
+    target = sum(costs) / (workers * chunks_per_worker)
+    chunks: List[Chunk] = []
+    lanes: List[int] = []
+    load = 0.0
+    for lane in order:
+        lanes.append(lane)
+        load += costs[lane]
+        if load >= target:
+            chunks.append(Chunk(tuple(lanes), load))
+            lanes, load = [], 0.0
+    if lanes:
+        chunks.append(Chunk(tuple(lanes), load))
+
+    heap = [(0.0, worker) for worker in range(workers)]
+    for chunk in sorted(chunks, key=lambda chunk: -chunk.predicted):
+        assigned, worker = heapq.heappop(heap)
+        queues[worker].append(chunk)
+        heapq.heappush(heap, (assigned + chunk.predicted, worker))
+    return queues
+
+
+@dataclass
+class ChunkRecord:
+    """Execution record of one chunk."""
+
+    worker: int
+    lanes: Tuple[int, ...]
+    predicted: float
+    actual: Optional[float]
+    seconds: float
+    stolen: bool
+
+
+@dataclass
+class ScheduleReport:
+    """Predicted against actual cost of one scheduled batch.
+
+    Attributes:
+        predicted: Predicted iterations per lane.
+        actual: Actual iterations per lane, or None where the solver does not
+            report them (Phononomics lanes).
+        chunks: Execution record of every chunk, in completion order.
+        steals: Number of chunks taken from another worker's queue.
+    """
+
+    predicted: List[int]
+    actual: List[Optional[int]]
+    chunks: List[ChunkRecord] = field(default_factory=list)
+    steals: int = 0
+
+    def _pairs(self) -> List[Tuple[int, int]]:
+        return [(p, a) for p, a in zip(self.predicted, self.actual) if a is not None]
+
+    @property
+    def mean_absolute_error(self) -> float:
+        """Mean absolute difference between predicted and actual iterations."""
+
+        pairs = self._pairs()
+        return sum(abs(p - a) for p, a in pairs) / len(pairs) if pairs else math.nan
+
+    @property
+    def exact_fraction(self) -> float:
+        """Fraction of lanes whose iteration count was predicted exactly."""
+
+        pairs = self._pairs()
+        return sum(p == a for p, a in pairs) / len(pairs) if pairs else math.nan
+
+    def worker_seconds(self) -> Dict[int, float]:
+        """Busy time of each worker, for checking the balance of a run."""
+
+        busy: Dict[int, float] = {}
+        for record in self.chunks:
+            busy[record.worker] = busy.get(record.worker, 0.0) + record.seconds
+        return busy
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Per-lane rows of ``lane``, ``predicted``, ``actual`` and ``error``.
+
+        The rows can be joined with the batch inputs and fed to
+        `sweep_aggregation.SweepAggregator` to break the error down by cell.
+        """
+
+        return [
+            {
+                "lane": lane,
+                "predicted": predicted,
+                "actual": actual,
+                "error": None if actual is None else actual - predicted,
+            }
+            for lane, (predicted, actual) in enumerate(zip(self.predicted, self.actual))
+        ]
+
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(kind: str, solver: Any, scenario: Optional[str], dtype: str) -> None:
+    # Interrupts are handled by the parent, which cancels outstanding chunks.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker.update(kind=kind, solver=solver, scenario=scenario, dtype=dtype)
+
+
+def _solve_chunk(inputs: Dict[str, List[Any]], params: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    solver = _worker["solver"]
+    if _worker["kind"] == "mentorship":
+        return solver.solve_batch(
+            inputs["coherence"], inputs["depth"], inputs["ethics_level"], params=params, dtype=_worker["dtype"]
+        )
+    return solver.solve_batch(
+        _worker["scenario"], inputs["ethics_level"], inputs["depth"], params=params, dtype=_worker["dtype"]
+    )
+
+
+class ScheduledBackend:
+    """Batch execution backend with cost-model scheduling and work stealing.
+
+    Each worker process is fed by a dispatcher thread that owns one queue of
+    chunks. A dispatcher takes its own chunks most-expensive first; once its
+    queue is empty it steals the cheapest chunk of the queue with the most
+    predicted work left. The report of the latest run is kept in
+    `last_report`.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        chunks_per_worker: int = 4,
+        cost_model: Optional[CostModel] = None,
+        mp_context: Optional[str] = None,
+        metrics: Optional[Any] = None,
+    ) -> None:
+        """
+        Args:
+            processes: Number of worker processes (defaults to the CPU count).
+            chunks_per_worker: Average number of chunks per worker; more
+                chunks give finer load balancing at a higher dispatch cost.
+            cost_model: Lane cost predictor (defaults to `CostModel`).
+            mp_context: Multiprocessing start method, e.g. ``"spawn"``.
+            metrics: Optional `solver_metrics.SolverMetrics` whose
+                ``queue_depth`` gauge tracks the chunks still queued.
+        """
+
+        if chunks_per_worker < 1:
+            raise ValueError(f"chunks_per_worker must be positive; received {chunks_per_worker}")
+        self.processes = processes or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.cost_model = cost_model or CostModel()
+        self.mp_context = mp_context
+        self.metrics = metrics
+        self.last_report: Optional[ScheduleReport] = None
+
+    def run_mentorship(
+        self,
+        solver: Any,
+        coherence: Sequence[float],
+        depth: Sequence[int],
+        ethics_level: Sequence[float],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str = FLOAT64,
+    ) -> Dict[str, List[Any]]:
+        """Run `MentorshipSolver.solve_batch` lanes in cost-balanced chunks."""
+
+        names = sorted(params)
+        solvers: Dict[Tuple, Any] = {}
+        predicted = []
+        for lane in range(len(coherence)):
+            key = tuple(params[name][lane] for name in names)
+            lane_solver = solvers.get(key)
+            if lane_solver is None:
+                lane_solver = solvers[key] = solver.with_overrides(dict(zip(names, key)))
+            predicted.append(
+                self.cost_model.predict_mentorship(lane_solver, coherence[lane], depth[lane], ethics_level[lane])
+            )
+        inputs = {"coherence": coherence, "depth": depth, "ethics_level": ethics_level}
+        return self._run("mentorship", solver, None, inputs, params, MENTORSHIP_COLUMNS, predicted, dtype)
+
+    def run_phononomics(
+        self,
+        solver: Any,
+        scenario: str,
+        ethics_levels: Sequence[float],
+        depths: Sequence[int],
+        params: Mapping[str, Sequence[Any]],
+        dtype: str = FLOAT64,
+    ) -> Dict[str, List[Any]]:
+        """Run `PhononomicsSolver.solve_batch` lanes in cost-balanced chunks."""
+
+        predicted = [
+            self.cost_model.predict_phononomics(solver, ethics_level, depth)
+            for ethics_level, depth in zip(ethics_levels, depths)
+        ]
+        inputs = {"ethics_level": ethics_levels, "depth": depths}
+        return self._run("phononomics", solver, scenario, inputs, params, PHONONOMICS_COLUMNS, predicted, dtype)
+
+    def _run(
+        self,
+        kind: str,
+        solver: Any,
+        scenario: Optional[str],
+        inputs: Mapping[str, Sequence[Any]],
+        params: Mapping[str, Sequence[Any]],
+        columns: Sequence[str],
+        predicted: List[int],
+        dtype: str,
+    ) -> Dict[str, List[Any]]:
+        length = len(predicted)
+        outputs: Dict[str, List[Any]] = {name: [None] * length for name in columns}
+        report = ScheduleReport(predicted=predicted, actual=[None] * length)
+        self.last_report = report
+        if length == 0:
+            return outputs
+
+        workers = min(self.processes, length)
+        queues = pack_longest_first(
+            [cost + LANE_OVERHEAD for cost in predicted], workers, self.chunks_per_worker
+        )
+        remaining = [sum(chunk.predicted for chunk in queue) for queue in queues]
+        queued = [sum(len(queue) for queue in queues)]
+        lock = threading.Lock()
+        failures: List[BaseException] = []
+        if self.metrics is not None:
+            self.metrics.set_queue_depth("scheduled", queued[0])
+
+        def take(owner: int, stolen: bool) -> Tuple[Chunk, bool]:
+            chunk = queues[owner].pop() if stolen else queues[owner].popleft()
+            remaining[owner] -= chunk.predicted
+            queued[0] -= 1
+            if self.metrics is not None:
+                self.metrics.set_queue_depth("scheduled", queued[0])
+            return chunk, stolen
+
+        def next_chunk(worker: int) -> Optional[Tuple[Chunk, bool]]:
+            with lock:
+                if failures:
+                    return None
+                if queues[worker]:
+                    return take(worker, stolen=False)
+                victim = max(range(workers), key=lambda other: remaining[other])
+                if not queues[victim]:
+                    return None
+                report.steals += 1
+                return take(victim, stolen=True)
+
+        def dispatch(worker: int, executor: ProcessPoolExecutor) -> None:
+            while True:
+                taken = next_chunk(worker)
+                if taken is None:
+                    return
+                chunk, stolen = taken
+                started = time.perf_counter()
+                try:
+                    result = executor.submit(
+                        _solve_chunk,
+                        {name: [values[lane] for lane in chunk.lanes] for name, values in inputs.items()},
+                        {name: [values[lane] for lane in chunk.lanes] for name, values in params.items()},
+                    ).result()
+                except BaseException as error:
+                    with lock:
+                        failures.append(error)
+                    return
+                seconds = time.perf_counter() - started
+
+                iterations = result.get("iterations")
+                with lock:
+                    for position, lane in enumerate(chunk.lanes):
+                        for name in columns:
+                            outputs[name][lane] = result[name][position]
+                        if iterations is not None:
+                            report.actual[lane] = iterations[position]
+                    report.chunks.append(ChunkRecord(
+                        worker=worker,
+                        lanes=chunk.lanes,
+                        predicted=chunk.predicted,
+                        actual=None if iterations is None else sum(iterations) + LANE_OVERHEAD * len(chunk.lanes),
+                        seconds=seconds,
+                        stolen=stolen,
+                    ))
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.mp_context),
+            initializer=_init_worker,
+            initargs=(kind, solver, scenario, dtype),
+        )
+        try:
+            threads = [
+                threading.Thread(target=dispatch, args=(worker, executor), daemon=True)
+                for worker in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        except BaseException as error:
+            # Stop the dispatchers from taking further chunks.
+            with lock:
+                failures.append(error)
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        if failures:
+            if self.metrics is not None:
+                self.metrics.set_queue_depth("scheduled", 0)
+            raise failures[0]
+        return outputs
@@ -0,0 +1,482 @@
+"""File-based sharded sweep coordinator.
+
+A sweep specification (the depth × ethics grid of
+`MentorshipSolver.grid_experiments` plus solver settings) is partitioned into
+deterministic shards and published to a shared directory that acts as a work
+queue::
+
+    <root>/spec.json                               sweep specification
+    <root>/pending/shard-00003.json                unclaimed shards
+    <root>/claimed/shard-00003@<worker>@<expiry>.json   leased shards
+    <root>/results/shard-00003.json                finished shards
+
+Workers claim a shard by atomically renaming it from ``pending/`` into
+``claimed/``; the new name carries the lease expiry. Expired leases can be
+taken over by another worker, or returned to ``pending/`` by the merge step,
+again by atomic rename, so exactly one claimant wins each race. While
+`run_worker` solves a shard, a heartbeat renews its lease every third of
+``lease_seconds``, so the lease only has to outlast a stalled heartbeat
+rather than the slowest shard. Results are written to a temporary file
+named after the host, process and a random suffix, and moved into place
+with `os.replace`.
+
+Command line usage::
+
+    python sweep_shards.py publish ROOT --depths 0 1 2 3 --ethics 0.2 0.5 0.8
+    python sweep_shards.py worker ROOT --worker-id node-a --cache results.sqlite
+    python sweep_shards.py merge ROOT --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from mentorship_solver import MentorshipSolver
+from result_cache import ResultCache
+
+SPEC_FILE = "spec.json"
+PENDING = "pending"
+CLAIMED = "claimed"
+RESULTS = "results"
+
+
+class IncompleteSweepError(RuntimeError):
+    """Raised by `ShardCoordinator.merge` when shard results are missing."""
+
+    def __init__(self, missing: Sequence[int], reissued: Sequence[int]) -> None:
+        self.missing = list(missing)
+        self.reissued = list(reissued)
+        super().__init__(
+            f"{len(self.missing)} shard(s) missing results: {self.missing}; "
+            f"re-issued stale shard(s): {self.reissued}"
+        )
+
+
+@dataclass
+class GridSweepSpec:
+    """Specification of a depth × ethics sweep over one solver configuration.
+
+    Attributes:
+        depths: Depth values, outer axis of the grid.
+        ethics_levels: Ethics levels, inner axis of the grid.
+        initial_coherence: Starting coherence of every cell.
+        converge_threshold: Solver convergence threshold.
+        max_iterations: Solver iteration cap.
+        overrides: Strategy parameter overrides, keyed as in
+            `MentorshipSolver.with_overrides`.
+    """
+
+    depths: List[int]
+    ethics_levels: List[float]
+    initial_coherence: float = 0.4
+    converge_threshold: float = 0.001
+    max_iterations: int = 100
+    overrides: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def sweep_id(self) -> str:
+        """Stable identifier derived from the specification contents."""
+
+        encoded = json.dumps(asdict(self), sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def cells(self) -> List[Tuple[int, float]]:
+        return [(depth, ethics) for depth in self.depths for ethics in self.ethics_levels]
+
+    def solver(self, cache: Optional[ResultCache] = None) -> MentorshipSolver:
+        return MentorshipSolver(
+            converge_threshold=self.converge_threshold,
+            max_iterations=self.max_iterations,
+            cache=cache,
+        ).with_overrides(self.overrides)
+
+
+def solve_cells(
+    spec: GridSweepSpec,
+    cells: Sequence[Tuple[int, float]],
+    cache: Optional[ResultCache] = None,
+) -> List[Dict[str, Any]]:
+    """Solve grid cells, returning rows shaped like `grid_experiments` results.
+
+    Cells already present in `cache` are not solved again.
+    """
+
+    batch = spec.solver(cache).solve_batch(
+        coherence=[spec.initial_coherence] * len(cells),
+        depth=[depth for depth, _ in cells],
+        ethics_level=[ethics for _, ethics in cells],
+    )
+    return [
+        {
+            "depth": depth,
+            "ethics_level": ethics,
+            "initial_coherence": spec.initial_coherence,
+            "final_coherence": batch["final_coherence"][lane],
+            "iterations": batch["iterations"][lane],
+            "converged": batch["converged"][lane],
+            "audit_valid": batch["audit_valid"][lane],
+        }
+        for lane, (depth, ethics) in enumerate(cells)
+    ]
+
+
+@dataclass
+class Claim:
+    """A leased shard held by a worker."""
+
+    shard: int
+    start: int
+    stop: int
+    path: str
+
+
+def _shard_name(shard: int) -> str:
+    return f"shard-{shard:05d}"
+
+
+def _shard_of(filename: str) -> int:
+    """Shard id of a pending (``shard-N.json``) or claimed file name."""
+
+    return int(filename[: -len(".json")].split("@")[0][len("shard-"):])
+
+
+def _claim_name(shard: int, worker_id: str, expiry: float) -> str:
+    return f"{_shard_name(shard)}@{worker_id}@{expiry:.3f}.json"
+
+
+def _lease_holder(filename: str) -> str:
+    return filename[: -len(".json")].split("@")[1]
+
+
+def _lease_expiry(filename: str) -> float:
+    return float(filename[: -len(".json")].split("@")[2])
+
+
+def _write_json(path: str, payload: Dict[str, Any]) -> None:
+    # Workers on different hosts can share a pid; the suffix keeps their
+    # temporary files apart.
+    tmp = f"{path}.{socket.gethostname()}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    os.replace(tmp, path)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+class ShardCoordinator:
+    """Shared-directory work queue for one sharded sweep."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def _dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def publish(self, spec: GridSweepSpec, shard_size: int) -> int:
+        """Partition `spec` into shards of `shard_size` cells and enqueue them.
+
+        Returns:
+            Number of shards published.
+
+        Raises:
+            ValueError: If `shard_size` is not positive.
+            FileExistsError: If a sweep was already published under `root`.
+        """
+
+        if shard_size <= 0:
+            raise ValueError(f"shard_size must be positive; received {shard_size}")
+        os.makedirs(self.root, exist_ok=True)
+        spec_path = self._dir(SPEC_FILE)
+        if os.path.exists(spec_path):
+            raise FileExistsError(f"a sweep is already published at {self.root}")
+        for name in (PENDING, CLAIMED, RESULTS):
+            os.makedirs(self._dir(name), exist_ok=True)
+
+        total = len(spec.cells())
+        shards = [(start, min(start + shard_size, total)) for start in range(0, total, shard_size)]
+        for shard, (start, stop) in enumerate(shards):
+            _write_json(
+                os.path.join(self._dir(PENDING), f"{_shard_name(shard)}.json"),
+                {"shard": shard, "start": start, "stop": stop},
+            )
+        _write_json(spec_path, {"spec": asdict(spec), "shards": len(shards), "shard_size": shard_size})
+        return len(shards)
+
+    def load(self) -> Tuple[GridSweepSpec, int, int]:
+        """Return the published specification, shard count and shard size."""
+
+        payload = _read_json(self._dir(SPEC_FILE))
+        return GridSweepSpec(**payload["spec"]), payload["shards"], payload["shard_size"]
+
+    def claim(self, worker_id: str, lease_seconds: float = 60.0) -> Optional[Claim]:
+        """Claim a pending shard, or take over one whose lease has expired.
+
+        Returns:
+            The claimed shard, or None if no shard is currently available.
+        """
+
+        worker_id = worker_id.replace("@", "_").replace(os.sep, "_")
+        now = time.time()
+        candidates = [
+            os.path.join(self._dir(PENDING), name)
+            for name in sorted(os.listdir(self._dir(PENDING)))
+            if name.endswith(".json")
+        ]
+        candidates += [path for path, expiry in self._claims() if expiry < now]
+
+        for source in candidates:
+            shard = _shard_of(os.path.basename(source))
+            target = os.path.join(self._dir(CLAIMED), _claim_name(shard, worker_id, now + lease_seconds))
+            try:
+                os.rename(source, target)
+            except FileNotFoundError:
+                continue
+            bounds = _read_json(target)
+            return Claim(shard=shard, start=bounds["start"], stop=bounds["stop"], path=target)
+        return None
+
+    def renew(self, claim: Claim, lease_seconds: float = 60.0) -> bool:
+        """Extend a claim's lease by renaming it with a new expiry.
+
+        Returns:
+            True if the lease was extended (``claim.path`` is updated), False
+            if the shard was taken over or re-issued in the meantime.
+        """
+
+        name = os.path.basename(claim.path)
+        target = os.path.join(
+            self._dir(CLAIMED), _claim_name(claim.shard, _lease_holder(name), time.time() + lease_seconds)
+        )
+        try:
+            os.rename(claim.path, target)
+        except FileNotFoundError:
+            return False
+        claim.path = target
+        return True
+
+    def complete(self, claim: Claim, results: List[Dict[str, Any]]) -> None:
+        """Store a shard's results and release its claim."""
+
+        spec, _, _ = self.load()
+        _write_json(
+            os.path.join(self._dir(RESULTS), f"{_shard_name(claim.shard)}.json"),
+            {"sweep_id": spec.sweep_id, "shard": claim.shard, "results": results},
+        )
+        try:
+            os.remove(claim.path)
+        except FileNotFoundError:
+            # The lease expired and the shard was re-issued; the duplicate
+            # result is identical, so nothing is lost.
+            pass
+
+    def reissue_stale(self) -> List[int]:
+        """Return expired claims to the pending queue; returns their shard ids."""
+
+        now = time.time()
+        reissued = []
+        for path, expiry in self._claims():
+            if expiry >= now:
+                continue
+            shard = _shard_of(os.path.basename(path))
+            try:
+                os.rename(path, os.path.join(self._dir(PENDING), f"{_shard_name(shard)}.json"))
+            except FileNotFoundError:
+                continue
+            reissued.append(shard)
+        return reissued
+
+    def status(self) -> Dict[str, int]:
+        """Count pending, claimed and finished shards."""
+
+        return {
+            PENDING: len([n for n in os.listdir(self._dir(PENDING)) if n.endswith(".json")]),
+            CLAIMED: len(self._claims()),
+            RESULTS: len([n for n in os.listdir(self._dir(RESULTS)) if n.endswith(".json")]),
+        }
+
+    def merge(self) -> List[Dict[str, Any]]:
+        """Validate completeness and return all results in grid order.
+
+        Stale shards are re-issued before completeness is checked.
+
+        Raises:
+            IncompleteSweepError: If any shard has no result yet.
+            ValueError: If a shard result belongs to another sweep or has the
+                wrong number of rows.
+        """
+
+        spec, shards, size = self.load()
+        reissued = self.reissue_stale()
+        cells = spec.cells()
+
+        merged: List[Dict[str, Any]] = []
+        missing = []
+        for shard in range(shards):
+            path = os.path.join(self._dir(RESULTS), f"{_shard_name(shard)}.json")
+            if not os.path.exists(path):
+                missing.append(shard)
+                continue
+            payload = _read_json(path)
+            expected = len(cells[shard * size:(shard + 1) * size])
+            if payload["sweep_id"] != spec.sweep_id:
+                raise ValueError(f"shard {shard} belongs to sweep {payload['sweep_id']}, not {spec.sweep_id}")
+            if len(payload["results"]) != expected:
+                raise ValueError(f"shard {shard} has {len(payload['results'])} rows; expected {expected}")
+            merged.extend(payload["results"])
+
+        if missing:
+            raise IncompleteSweepError(missing, reissued)
+        return merged
+
+    def _claims(self) -> List[Tuple[str, float]]:
+        claims = []
+        for name in sorted(os.listdir(self._dir(CLAIMED))):
+            if name.endswith(".json"):
+                claims.append((os.path.join(self._dir(CLAIMED), name), _lease_expiry(name)))
+        return claims
+
+
+@contextmanager
+def _heartbeat(coordinator: ShardCoordinator, claim: Claim, lease_seconds: float) -> Iterator[None]:
+    """Renew `claim` every third of `lease_seconds` until the block exits."""
+
+    if lease_seconds <= 0:
+        yield
+        return
+    stopped = threading.Event()
+
+    def beat() -> None:
+        while not stopped.wait(lease_seconds / 3) and coordinator.renew(claim, lease_seconds):
+            pass
+
+    thread = threading.Thread(target=beat, name=f"lease-{claim.shard}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def run_worker(
+    root: str,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = 60.0,
+    max_shards: Optional[int] = None,
+    cache_path: Optional[str] = None,
+) -> int:
+    """Claim and solve shards until the queue is empty.
+
+    Args:
+        lease_seconds: Lease length; the lease is renewed while a shard is
+            being solved, so it need only exceed the heartbeat delay.
+        cache_path: Optional `ResultCache` database shared with other workers
+            and with earlier sweeps.
+
+    Returns:
+        Number of shards this worker completed.
+    """
+
+    coordinator = ShardCoordinator(root)
+    cache = ResultCache(cache_path) if cache_path else None
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    spec, _, _ = coordinator.load()
+    cells = spec.cells()
+
+    completed = 0
+    while max_shards is None or completed < max_shards:
+        claim = coordinator.claim(worker_id, lease_seconds)
+        if claim is None:
+            break
+        with _heartbeat(coordinator, claim, lease_seconds):
+            results = solve_cells(spec, cells[claim.start:claim.stop], cache)
+        coordinator.complete(claim, results)
+        completed += 1
+    return completed
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    publish = commands.add_parser("publish", help="partition a sweep and enqueue its shards")
+    publish.add_argument("root")
+    publish.add_argument("--depths", type=int, nargs="+", default=[0, 1, 2, 3])
+    publish.add_argument("--ethics", type=float, nargs="+", default=[0.2, 0.5, 0.8])
+    publish.add_argument("--initial-coherence", type=float, default=0.4)
+    publish.add_argument("--converge-threshold", type=float, default=0.001)
+    publish.add_argument("--max-iterations", type=int, default=100)
+    publish.add_argument(
+        "--override", action="append", default=[], metavar="NAME=VALUE",
+        help="strategy parameter override, e.g. resonate.resonance_factor=0.9",
+    )
+    publish.add_argument("--shard-size", type=int, default=64)
+
+    worker = commands.add_parser("worker", help="claim and solve shards until none remain")
+    worker.add_argument("root")
+    worker.add_argument("--worker-id")
+    worker.add_argument("--lease", type=float, default=60.0)
+    worker.add_argument("--max-shards", type=int)
+    worker.add_argument("--cache", help="result cache database shared across workers and runs")
+
+    merge = commands.add_parser("merge", help="validate and merge shard results")
+    merge.add_argument("root")
+    merge.add_argument("--output", help="write merged results to this JSON file")
+
+    status = commands.add_parser("status", help="show queue counts")
+    status.add_argument("root")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    coordinator = ShardCoordinator(args.root)
+
+    if args.command == "publish":
+        overrides = {}
+        for item in args.override:
+            name, _, value = item.partition("=")
+            overrides[name] = float(value)
+        spec = GridSweepSpec(
+            depths=args.depths,
+            ethics_levels=args.ethics,
+            initial_coherence=args.initial_coherence,
+            converge_threshold=args.converge_threshold,
+            max_iterations=args.max_iterations,
+            overrides=overrides,
+        )
+        print(f"published {coordinator.publish(spec, args.shard_size)} shard(s) for sweep {spec.sweep_id}")
+    elif args.command == "worker":
+        print(f"completed {run_worker(args.root, args.worker_id, args.lease, args.max_shards, args.cache)} shard(s)")
+    elif args.command == "merge":
+        try:
+            results = coordinator.merge()
+        except IncompleteSweepError as error:
+            print(error, file=sys.stderr)
+            return 1
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as handle:
+                json.dump(results, handle, indent=2)
+        print(f"merged {len(results)} result(s)")
+    else:
+        print(json.dumps(coordinator.status()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""N-dimensional parameter sweeps over solver inputs and configuration.
+
+A `SweepSpec` names any number of axes. Input axes vary the lanes of a batch
+(``coherence``, ``depth`` and ``ethics_level`` for `MentorshipSolver`;
+``ethics_level`` and ``depth`` for `PhononomicsSolver`). Parameter axes vary
+the solver: strategy parameters as ``'<slot>.<parameter>'`` (or the bare
+parameter name when it is unambiguous in the bundle), ``converge_threshold``
+and ``max_iterations``, or `PhononomicsConfig` fields.
+
+`SweepSpec.run` enumerates the Cartesian product lazily with parameter axes
+outermost, so the cells sharing one configuration are contiguous: each
+configuration builds its solver (and execution plan) once and its cells are
+solved through ``solve_batch`` in batches of ``batch_size`` lanes, optionally
+on a backend or through a result cache. The `SweepResult` is indexable by axis
+coordinates::
+
+    spec = SweepSpec(
+        axes={"resonance_factor": [0.6, 0.8], "depth": range(1, 5), "ethics_level": [0.2, 0.5, 0.8]},
+    )
+    result = spec.run()
+    result[{"resonance_factor": 0.8, "depth": 3, "ethics_level": 0.5}]["iterations"]
+    result.select(resonance_factor=0.8).rows()
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from compact_precision import FLOAT64
+from mentorship_solver import BATCH_COLUMNS as MENTORSHIP_COLUMNS
+from mentorship_solver import BUNDLE_SLOTS, MentorshipSolver
+from phononomics_solver import BATCH_COLUMNS as PHONONOMICS_COLUMNS
+from phononomics_solver import PhononomicsConfig, PhononomicsSolver
+
+MENTORSHIP = "mentorship"
+PHONONOMICS = "phononomics"
+
+MENTORSHIP_INPUTS = ("coherence", "depth", "ethics_level")
+PHONONOMICS_INPUTS = ("ethics_level", "depth")
+SOLVER_PARAMETERS = ("converge_threshold", "max_iterations")
+
+# Values used for inputs that are neither an axis nor fixed.
+MENTORSHIP_DEFAULTS = {"coherence": 0.4}
+PHONONOMICS_DEFAULTS = {"ethics_level": 0.84, "depth": 3}
+
+
+def _strategy_parameter_names(solver: MentorshipSolver) -> Dict[str, List[str]]:
+    names: Dict[str, List[str]] = {}
+    for slot in BUNDLE_SLOTS:
+        strategy = getattr(solver.operators, slot)
+        parameters = (
+            [f.name for f in fields(strategy)]
+            if hasattr(strategy, "__dataclass_fields__")
+            else list(getattr(strategy, "__dict__", {}))
+        )
+        for parameter in parameters:
+            names.setdefault(parameter, []).append(f"{slot}.{parameter}")
+    return names
+
+
+class SweepResult:
+    """Results of a sweep, laid out densely over its axes.
+
+    Cells are stored in row-major order of the axes as declared (the last axis
+    varies fastest), one list per output column.
+
+    Attributes:
+        axes: Axis values, in declaration order.
+        columns: Output columns, one entry per cell.
+    """
+
+    def __init__(self, axes: Mapping[str, Sequence[Any]], columns: Mapping[str, List[Any]]) -> None:
+        self.axes: Dict[str, List[Any]] = {name: list(values) for name, values in axes.items()}
+        self.columns: Dict[str, List[Any]] = dict(columns)
+        self._positions = {
+            name: {value: position for position, value in enumerate(values)}
+            for name, values in self.axes.items()
+        }
+        self._strides: Dict[str, int] = {}
+        stride = 1
+        for name in reversed(list(self.axes)):
+            self._strides[name] = stride
+            stride *= len(self.axes[name])
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(values) for values in self.axes.values())
+
+    def __len__(self) -> int:
+        return math.prod(self.shape)
+
+    def _position(self, name: str, value: Any) -> int:
+        try:
+            return self._positions[name][value]
+        except KeyError:
+            if name not in self.axes:
+                raise KeyError(f"unknown axis {name!r}; axes are {list(self.axes)}") from None
+            raise KeyError(f"{value!r} is not a coordinate of axis {name!r}") from None
+
+    def index(self, coordinates: Mapping[str, Any]) -> int:
+        """Flat cell index of a full set of axis coordinates.
+
+        Raises:
+            KeyError: If an axis is missing or unknown, or a value is not one
+                of the axis coordinates.
+        """
+
+        missing = [name for name in self.axes if name not in coordinates]
+        if missing or len(coordinates) != len(self.axes):
+            raise KeyError(f"coordinates must name every axis {list(self.axes)}; received {list(coordinates)}")
+        return sum(self._position(name, value) * self._strides[name] for name, value in coordinates.items())
+
+    def __getitem__(self, coordinates: Mapping[str, Any]) -> Dict[str, Any]:
+        """Row of one cell: its coordinates followed by its outputs."""
+
+        lane = self.index(coordinates)
+        row = {name: coordinates[name] for name in self.axes}
+        row.update((name, values[lane]) for name, values in self.columns.items())
+        return row
+
+    def select(self, **coordinates: Any) -> "SweepResult":
+        """Sub-sweep with some axes fixed at one coordinate each."""
+
+        fixed = {name: self._position(name, value) for name, value in coordinates.items()}
+        remaining = {name: values for name, values in self.axes.items() if name not in fixed}
+        lanes = [
+            sum(position * self._strides[name] for name, position in fixed.items())
+            + sum(position * self._strides[name] for name, position in zip(remaining, free))
+            for free in itertools.product(*(range(len(values)) for values in remaining.values()))
+        ]
+        return SweepResult(remaining, {name: [values[lane] for lane in lanes] for name, values in self.columns.items()})
+
+    def coordinates(self) -> Iterator[Dict[str, Any]]:
+        """Coordinates of every cell, in storage order."""
+
+        names = list(self.axes)
+        for values in itertools.product(*self.axes.values()):
+            yield dict(zip(names, values))
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Every cell as a row of coordinates and outputs.
+
+        Rows can be fed to `sweep_aggregation.SweepAggregator` or
+        `sweep_results.save_results`.
+        """
+
+        rows = []
+        for lane, coordinates in enumerate(self.coordinates()):
+            coordinates.update((name, values[lane]) for name, values in self.columns.items())
+            rows.append(coordinates)
+        return rows
+
+
+class SweepSpec:
+    """Named axes over solver inputs and parameters, plus fixed values."""
+
+    def __init__(
+        self,
+        axes: Mapping[str, Sequence[Any]],
+        fixed: Optional[Mapping[str, Any]] = None,
+        solver: str = MENTORSHIP,
+        scenario: str = "sweep",
+    ) -> None:
+        """
+        Args:
+            axes: Axis name to the values it takes, in sweep order.
+            fixed: Values for inputs or parameters that do not vary.
+            solver: ``"mentorship"`` or ``"phononomics"``.
+            scenario: Scenario name passed to Phononomics batch solves.
+
+        Raises:
+            ValueError: If the solver kind is unknown, an axis is empty, or a
+                name is both an axis and fixed.
+        """
+
+        if solver not in (MENTORSHIP, PHONONOMICS):
+            raise ValueError(f"solver must be {MENTORSHIP!r} or {PHONONOMICS!r}; received {solver!r}")
+        self.axes: Dict[str, List[Any]] = {name: list(values) for name, values in axes.items()}
+        self.fixed: Dict[str, Any] = dict(fixed or {})
+        self.solver = solver
+        self.scenario = scenario
+        for name, values in self.axes.items():
+            if not values:
+                raise ValueError(f"axis {name!r} has no values")
+        overlap = set(self.axes) & set(self.fixed)
+        if overlap:
+            raise ValueError(f"names cannot be both axes and fixed: {sorted(overlap)}")
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for values in self.axes.values())
+
+    @property
+    def inputs(self) -> Tuple[str, ...]:
+        return MENTORSHIP_INPUTS if self.solver == MENTORSHIP else PHONONOMICS_INPUTS
+
+    def cells(self) -> Iterator[Dict[str, Any]]:
+        """Lazily enumerate the Cartesian product in declaration order."""
+
+        names = list(self.axes)
+        for values in itertools.product(*self.axes.values()):
+            yield dict(zip(names, values))
+
+    def _resolve(self, solver: Any, name: str) -> str:
+        """Map an axis or fixed name to an input or a ``with_overrides`` key."""
+
+        if name in self.inputs:
+            return name
+        if self.solver == PHONONOMICS:
+            known = [f.name for f in fields(PhononomicsConfig)]
+            if name not in known:
+                raise ValueError(f"unknown Phononomics sweep name {name!r}; expected one of {list(self.inputs) + known}")
+            return name
+        if name in SOLVER_PARAMETERS or "." in name:
+            return name
+        candidates = _strategy_parameter_names(solver).get(name, [])
+        if len(candidates) != 1:
+            problem = "ambiguous" if candidates else "unknown"
+            raise ValueError(
+                f"{problem} sweep name {name!r}; use an input {list(self.inputs)}, "
+                f"{list(SOLVER_PARAMETERS)} or '<slot>.<parameter>'"
+            )
+        return candidates[0]
+
+    def run(
+        self,
+        solver: Optional[Any] = None,
+        backend: Optional[Any] = None,
+        dtype: str = FLOAT64,
+        batch_size: int = 4096,
+    ) -> SweepResult:
+        """Solve every cell.
+
+        Args:
+            solver: Base solver whose configuration the parameter axes
+                override (defaults to a default solver of the spec's kind);
+                its metrics, cache and continuation store are used.
+            backend: Optional execution backend for the batch solves.
+            dtype: ``"float64"`` or ``"float32"``.
+            batch_size: Maximum lanes per ``solve_batch`` call.
+
+        Raises:
+            ValueError: If a name is unknown, or a required input (Mentorship
+                ``depth`` and ``ethics_level``) is neither an axis nor fixed.
+        """
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive; received {batch_size}")
+        if solver is None:
+            solver = MentorshipSolver() if self.solver == MENTORSHIP else PhononomicsSolver()
+
+        resolved = {name: self._resolve(solver, name) for name in [*self.axes, *self.fixed]}
+        input_axes = [name for name in self.axes if resolved[name] in self.inputs]
+        parameter_axes = [name for name in self.axes if resolved[name] not in self.inputs]
+
+        constants = dict(MENTORSHIP_DEFAULTS if self.solver == MENTORSHIP else PHONONOMICS_DEFAULTS)
+        overrides: Dict[str, Any] = {}
+        for name, value in self.fixed.items():
+            if resolved[name] in self.inputs:
+                constants[name] = value
+            else:
+                overrides[resolved[name]] = value
+        missing = [name for name in self.inputs if name not in constants and name not in input_axes]
+        if missing:
+            raise ValueError(f"inputs {missing} must be sweep axes or fixed values")
+
+        names = list(self.axes)
+        strides: Dict[str, int] = {}
+        stride = 1
+        for name in reversed(names):
+            strides[name] = stride
+            stride *= len(self.axes[name])
+        output_names = MENTORSHIP_COLUMNS if self.solver == MENTORSHIP else PHONONOMICS_COLUMNS
+        outputs: Dict[str, List[Any]] = {name: [None] * len(self) for name in output_names}
+
+        for parameter_positions in itertools.product(*(range(len(self.axes[name])) for name in parameter_axes)):
+            configured = solver.with_overrides({
+                **overrides,
+                **{
+                    resolved[name]: self.axes[name][position]
+                    for name, position in zip(parameter_axes, parameter_positions)
+                },
+            })
+            base = sum(strides[name] * position for name, position in zip(parameter_axes, parameter_positions))
+            cells = itertools.product(*(range(len(self.axes[name])) for name in input_axes))
+            while True:
+                chunk = list(itertools.islice(cells, batch_size))
+                if not chunk:
+                    break
+                lanes = {name: [constants[name]] * len(chunk) for name in self.inputs if name in constants}
+                for axis, name in enumerate(input_axes):
+                    lanes[name] = [self.axes[name][positions[axis]] for positions in chunk]
+                batch = self._solve(configured, lanes, backend, dtype)
+                for offset, positions in enumerate(chunk):
+                    lane = base + sum(strides[name] * position for name, position in zip(input_axes, positions))
+                    for name in output_names:
+                        outputs[name][lane] = batch[name][offset]
+
+        return SweepResult(self.axes, outputs)
+
+    def _solve(self, solver: Any, lanes: Mapping[str, List[Any]], backend: Optional[Any], dtype: str) -> Dict[str, List[Any]]:
+        if self.solver == MENTORSHIP:
+            return solver.solve_batch(
+                lanes["coherence"], lanes["depth"], lanes["ethics_level"], backend=backend, dtype=dtype
+            )
+        return solver.solve_batch(self.scenario, lanes["ethics_level"], lanes["depth"], backend=backend, dtype=dtype)
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from compact_precision import (
+    PrecisionWarning,
+    to_float32,
+    validate_float32,
+    validate_phononomics_float32,
+)
+from mentorship_solver import MentorshipSolver, create_default_solver
+from phononomics_solver import PhononomicsSolver
+from shared_memory_backend import SharedMemoryBackend
+from sweep_results import load_results, save_results
+
+
+class TestFloat32Mode:
+    def test_to_float32_rounds(self):
+        assert to_float32(0.1) != 0.1
+        assert to_float32(to_float32(0.1)) == to_float32(0.1)
+        assert to_float32(0.5) == 0.5
+
+    def test_mentorship_batch_float32(self):
+        solver = create_default_solver()
+        args = ([0.3, 0.4], [2, 5], [0.5, 0.9])
+        reference = solver.solve_batch(*args)
+        compact = solver.solve_batch(*args, dtype="float32")
+
+        assert all(to_float32(value) == value for value in compact["final_coherence"])
+        assert compact["final_coherence"] != reference["final_coherence"]
+        for a, b in zip(reference["final_coherence"], compact["final_coherence"]):
+            assert a == pytest.approx(b, abs=1e-6)
+
+    def test_float32_narrows_inputs_and_outputs_only(self):
+        solver = MentorshipSolver(converge_threshold=1e-7)
+        args = ([0.3, 0.4, 0.7], [2, 5, 3], [0.5, 0.9, 0.1])
+        narrowed = ([to_float32(c) for c in args[0]], args[1], [to_float32(e) for e in args[2]])
+        reference = solver.solve_batch(*narrowed)
+        compact = solver.solve_batch(*args, dtype="float32")
+
+        assert compact["iterations"] == reference["iterations"]
+        assert compact["converged"] == reference["converged"]
+        assert compact["final_coherence"] == [to_float32(value) for value in reference["final_coherence"]]
+
+    def test_unknown_dtype_raises(self):
+        with pytest.raises(ValueError, match="dtype must be one of"):
+            create_default_solver().grid_experiments(dtype="float16")
+
+    def test_shared_memory_backend_float32_matches_in_process(self):
+        solver = create_default_solver()
+        backend = SharedMemoryBackend(processes=2)
+
+        assert solver.grid_experiments(dtype="float32", backend=backend) == solver.grid_experiments(dtype="float32")
+
+        phononomics = PhononomicsSolver()
+        args = ("scenario", [0.6, 0.84, 0.95], [2, 3, 6])
+        assert phononomics.solve_batch(*args, dtype="float32", backend=backend) == phononomics.solve_batch(
+            *args, dtype="float32"
+        )
+
+    def test_float32_result_files_are_smaller(self, tmp_path):
+        results = create_default_solver().grid_experiments(depth_range=range(0, 20))
+        save_results(tmp_path / "f64.trm", results)
+        save_results(tmp_path / "f32.trm", results, dtype="float32")
+
+        assert os.path.getsize(tmp_path / "f32.trm") < os.path.getsize(tmp_path / "f64.trm")
+        loaded = load_results(tmp_path / "f32.trm").rows()
+        assert [row["iterations"] for row in loaded] == [row["iterations"] for row in results]
+        assert loaded[-1]["final_coherence"] == to_float32(results[-1]["final_coherence"])
+
+
+class TestValidationHarness:
+    def test_default_solver_is_stable(self):
+        report = validate_float32(MentorshipSolver())
+
+        assert report.lanes > 0
+        assert report.decisions_stable
+        assert 0 < report.max_coherence_deviation < 1e-6
+
+    def test_warns_when_decisions_flip(self):
+        with pytest.warns(PrecisionWarning, match="converged"):
+            report = validate_float32(MentorshipSolver(converge_threshold=1e-7))
+
+        assert report.flips["converged"] > 0
+        assert report.max_iteration_deviation > 0
+
+    def test_phononomics_report(self):
+        report = validate_phononomics_float32(PhononomicsSolver())
+
+        assert report.decisions_stable
+        assert report.max_iteration_deviation == 0
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from interpolation_tables import TableBuildError, build_table, load_table
+from mentorship_solver import AuditStrategy, MentorshipSolver, OperatorBundle, create_default_solver
+
+
+@pytest.fixture(scope="module")
+def table():
+    return build_table(create_default_solver(), depth=3)
+
+
+def random_points(count, seed=7):
+    generator = random.Random(seed)
+    return [(generator.random(), generator.random()) for _ in range(count)]
+
+
+class TestBuild:
+    def test_error_bound_is_within_tolerance(self, table):
+        assert table.error_bound["final_coherence"] <= table.tolerance
+        assert table.error_bound["audit_score"] <= table.tolerance
+        assert table.error_bound["iterations"] <= table.iteration_tolerance
+
+    def test_grid_is_refined_adaptively(self, table):
+        assert len(table.coherence_axis) > 5
+        assert len(table.ethics_axis) > 5
+        assert list(table.ethics_axis) == sorted(table.ethics_axis)
+        assert len(table) == len(table.coherence_axis) * len(table.ethics_axis)
+
+    def test_unreachable_tolerance_raises(self):
+        with pytest.raises(TableBuildError):
+            build_table(create_default_solver(), depth=3, tolerance=1e-9, max_points=40)
+
+    def test_rejects_depth_zero(self):
+        with pytest.raises(ValueError):
+            build_table(create_default_solver(), depth=0)
+
+
+class TestQuery:
+    def test_queries_match_exact_solves_within_tolerance(self, table):
+        solver = create_default_solver()
+        for coherence, ethics in random_points(300):
+            answer = table.query(coherence, ethics)
+            state, iterations = solver.solve({"coherence": coherence}, 3, ethics)
+
+            assert abs(answer["final_coherence"] - state["coherence"]) <= 2 * table.tolerance
+            assert abs(answer["audit_score"] - state["audit_score"]) <= 2 * table.tolerance * state["audit_score"]
+            assert abs(answer["iterations"] - iterations) <= table.iteration_tolerance
+            assert answer["converged"] == state["converged"]
+            assert answer["audit_valid"] == state["audit_valid"]
+
+    def test_grid_nodes_are_exact(self, table):
+        solver = create_default_solver()
+        coherence, ethics = table.coherence_axis[3], table.ethics_axis[4]
+        answer = table.query(coherence, ethics)
+        state, iterations = solver.solve({"coherence": coherence}, 3, ethics)
+
+        assert answer["final_coherence"] == pytest.approx(state["coherence"], abs=1e-12)
+        assert answer["iterations"] == iterations
+        assert answer["exact"] is False
+
+    def test_out_of_range_queries_fall_back_to_exact(self):
+        table = build_table(create_default_solver(), depth=2, coherence_range=(0.2, 0.6))
+        answer = table.query(0.9, 0.5)
+        state, _ = create_default_solver().solve({"coherence": 0.9}, 2, 0.5)
+
+        assert answer["exact"] is True
+        assert answer["final_coherence"] == state["coherence"]
+        assert table.exact_queries == 1
+
+    def test_decision_boundary_cells_fall_back_to_exact(self):
+        solver = MentorshipSolver(OperatorBundle(audit=AuditStrategy(audit_threshold=1.2)))
+        table = build_table(solver, depth=3)
+        answers = table.query_many(*zip(*random_points(2000)))
+
+        assert any(table.boundary_cells)
+        assert any(answers["exact"])
+        for (coherence, ethics), valid in zip(random_points(2000), answers["audit_valid"]):
+            assert valid == solver.solve({"coherence": coherence}, 3, ethics)[0]["audit_valid"]
+
+    def test_query_many_rejects_mismatched_columns(self, table):
+        with pytest.raises(ValueError):
+            table.query_many([0.1, 0.2], [0.5])
+
+
+class TestSerialization:
+    def test_round_trip(self, table, tmp_path):
+        path = tmp_path / "depth3.table"
+        table.save(path)
+        loaded = load_table(path, create_default_solver())
+
+        assert loaded == table
+        assert loaded.query(0.42, 0.61) == table.query(0.42, 0.61)
+
+    def test_rejects_mismatched_solver(self, table, tmp_path):
+        path = tmp_path / "depth3.table"
+        table.save(path)
+
+        with pytest.raises(ValueError, match="configuration"):
+            load_table(path, MentorshipSolver(max_iterations=10))
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a table")
+
+        with pytest.raises(ValueError):
+            load_table(path, create_default_solver())
@@ -9,6 +9,10 @@ Tests cover:
 """
 
 import pytest
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import ClassVar, FrozenSet
+import mentorship_solver
 from mentorship_solver import (
     MentorshipSolver,
     OperatorBundle,
@@ -16,6 +20,10 @@ from mentorship_solver import (
     MeasureStrategy,
     AdaptStrategy,
     AuditStrategy,
+    ContinuationStore,
+    bundle_fingerprint,
+    build_execution_plan,
+    declared_dependencies,
     create_default_solver
 )
 
@@ -338,6 +346,45 @@ class TestSampleAndGridMethods:
         assert ethics_tested == {0.3, 0.6}
 
 
+class TestBatchSolving:
+    """Test solve_batch and parameter overrides."""
+    
+    def test_solve_batch_matches_solve(self):
+        """Test that each batch lane matches an individual solve."""
+        solver = create_default_solver()
+        batch = solver.solve_batch([0.3, 0.6], [1, 3], [0.5, 0.9])
+        
+        for lane, (coherence, depth, ethics) in enumerate([(0.3, 1, 0.5), (0.6, 3, 0.9)]):
+            final_state, iterations = solver.solve({'coherence': coherence}, depth, ethics)
+            assert batch['final_coherence'][lane] == final_state['coherence']
+            assert batch['iterations'][lane] == iterations
+            assert batch['audit_score'][lane] == final_state['audit_score']
+    
+    def test_solve_batch_parameter_columns(self):
+        """Test that per-lane parameter columns override the bundle."""
+        solver = create_default_solver()
+        batch = solver.solve_batch(
+            [0.4, 0.4], [2, 2], [0.5, 0.5],
+            params={'adapt.adaptation_rate': [0.6, 0.9]}
+        )
+        tuned = solver.with_overrides({'adapt.adaptation_rate': 0.9})
+        _, iterations = tuned.solve({'coherence': 0.4}, depth=2, ethics_level=0.5)
+        
+        assert tuned.operators.adapt.adaptation_rate == 0.9
+        assert solver.operators.adapt.adaptation_rate == 0.6
+        assert batch['iterations'][1] == iterations
+    
+    def test_unknown_override_raises_error(self):
+        """Test that overrides must address a known strategy slot."""
+        with pytest.raises(ValueError, match="unknown strategy parameter"):
+            create_default_solver().with_overrides({'reflect.factor': 1.0})
+    
+    def test_solve_batch_validates_ethics_level(self):
+        """Test that out-of-range lanes are rejected."""
+        with pytest.raises(ValueError, match="ethics_level must be in"):
+            create_default_solver().solve_batch([0.4], [1], [1.2])
+
+
 class TestOperatorStrategies:
     """Test individual operator strategies."""
     
@@ -407,3 +454,496 @@ class TestCoherenceBounds:
         state_low = {'coherence': 0.01}
         final_low, _ = solver.solve(state_low, depth=3, ethics_level=0.9)
         assert 0.0 <= final_low['coherence'] <= 1.0
+
+
+class TestContinuationMode:
+    """Test warm-start continuation solving."""
+    
+    def test_bundle_fingerprint_tracks_parameters(self):
+        """Test that fingerprints differ exactly when parameters differ."""
+        assert bundle_fingerprint(OperatorBundle()) == bundle_fingerprint(OperatorBundle())
+        nudged = OperatorBundle(resonate=ResonateStrategy(resonance_factor=0.81))
+        assert bundle_fingerprint(nudged) != bundle_fingerprint(OperatorBundle())
+    
+    def test_first_solve_is_cold_and_recorded(self):
+        """Test that an empty store yields a cold start that is then stored."""
+        store = ContinuationStore()
+        solver = MentorshipSolver(continuation_store=store)
+        
+        final_state, iterations = solver.solve({'coherence': 0.4}, depth=2, ethics_level=0.5)
+        
+        assert final_state['warm_started'] is False
+        assert final_state['iterations_saved'] == 0
+        assert len(store) == 1
+    
+    def test_nudged_parameters_warm_start(self):
+        """Test that a nudged bundle seeds from the nearest stored fixed point."""
+        store = ContinuationStore()
+        MentorshipSolver(continuation_store=store).solve(
+            {'coherence': 0.4}, depth=3, ethics_level=0.5
+        )
+        _, cold_iterations = MentorshipSolver().solve(
+            {'coherence': 0.4}, depth=3, ethics_level=0.5
+        )
+        
+        nudged = MentorshipSolver(
+            operators=OperatorBundle(resonate=ResonateStrategy(resonance_factor=0.82)),
+            continuation_store=store
+        )
+        final_state, iterations = nudged.solve({'coherence': 0.4}, depth=3, ethics_level=0.5)
+        
+        assert final_state['warm_started'] is True
+        assert final_state['converged'] is True
+        assert iterations < cold_iterations
+        assert final_state['iterations_saved'] == cold_iterations - iterations
+        assert store.iterations_saved == final_state['iterations_saved']
+    
+    def test_warm_start_meets_threshold(self):
+        """Test that warm-started results agree with cold solves within threshold."""
+        store = ContinuationStore()
+        MentorshipSolver(continuation_store=store).grid_experiments()
+        
+        ops = OperatorBundle(adapt=AdaptStrategy(adaptation_rate=0.62))
+        warm = MentorshipSolver(operators=ops, continuation_store=store).grid_experiments()
+        cold = MentorshipSolver(operators=ops).grid_experiments()
+        
+        for warm_row, cold_row in zip(warm, cold):
+            assert warm_row['converged'] is True
+            assert abs(warm_row['final_coherence'] - cold_row['final_coherence']) < 0.01
+            if warm_row['depth'] > 0:
+                assert warm_row['warm_started'] is True
+    
+    def test_max_distance_limits_seeding(self):
+        """Test that bundles farther than max_distance are not used as seeds."""
+        store = ContinuationStore(max_distance=0.01)
+        MentorshipSolver(continuation_store=store).solve(
+            {'coherence': 0.4}, depth=1, ethics_level=0.5
+        )
+        far = MentorshipSolver(
+            operators=OperatorBundle(resonate=ResonateStrategy(resonance_factor=0.5)),
+            continuation_store=store
+        )
+        final_state, _ = far.solve({'coherence': 0.4}, depth=1, ethics_level=0.5)
+        
+        assert final_state['warm_started'] is False
+
+
+class TestRecursiveMode:
+    """Test recursive solving seeded by memoized sub-solves."""
+    
+    def test_depth_one_matches_plain_solve(self):
+        """Test that depth-0 mentees leave the depth-1 solve unchanged."""
+        solver = MentorshipSolver()
+        plain, plain_iterations = solver.solve({'coherence': 0.4}, depth=1, ethics_level=0.5)
+        final_state, iterations = solver.solve_recursive({'coherence': 0.4}, depth=1, ethics_level=0.5)
+        
+        assert final_state['coherence'] == plain['coherence']
+        assert iterations == plain_iterations
+    
+    def test_each_level_is_seeded_by_the_level_below(self):
+        """Test that a mentor starts from its mentees' converged coherence."""
+        solver = MentorshipSolver()
+        mentee, _ = solver.solve({'coherence': 0.4}, depth=1, ethics_level=0.6)
+        expected, _ = solver.solve({'coherence': mentee['coherence']}, depth=2, ethics_level=0.6)
+        
+        final_state, _ = solver.solve_recursive({'coherence': 0.4}, depth=2, ethics_level=0.6)
+        
+        assert final_state['coherence'] == expected['coherence']
+        assert final_state['audit_score'] == expected['audit_score']
+    
+    def test_deep_tree_costs_one_solve_per_level(self, monkeypatch):
+        """Test that shared subtrees are solved once."""
+        calls = []
+        original = MentorshipSolver._iterate
+        
+        def counting(self, *args, **kwargs):
+            calls.append(args[1]['depth'])
+            return original(self, *args, **kwargs)
+        
+        monkeypatch.setattr(MentorshipSolver, '_iterate', counting)
+        final_state, _ = MentorshipSolver().solve_recursive(
+            {'coherence': 0.4}, depth=50, ethics_level=0.5, branching=3
+        )
+        
+        assert sorted(calls) == list(range(1, 51))
+        levels = final_state['levels']
+        assert [level.depth for level in levels] == list(range(51))
+        assert all(level.solves == 1 for level in levels)
+        assert all(level.references == 3 for level in levels[:-1])
+        assert final_state['tree_iterations'] == sum(level.iterations for level in levels)
+    
+    def test_ethics_spread_shares_recombining_subtrees(self):
+        """Test that mentees reached along different paths share one solve."""
+        final_state, _ = MentorshipSolver().solve_recursive(
+            {'coherence': 0.4}, depth=20, ethics_level=0.5, branching=2, ethics_spread=0.01
+        )
+        
+        solves = [level.solves for level in final_state['levels']]
+        assert solves[20] == 1
+        assert solves[19] == 2
+        assert solves[18] == 3
+        assert sum(solves) < 300
+    
+    def test_memo_is_reused_across_calls(self):
+        """Test that a shared memo leaves only the root to solve."""
+        solver = MentorshipSolver()
+        memo = {}
+        first, _ = solver.solve_recursive({'coherence': 0.4}, depth=8, ethics_level=0.5, memo=memo)
+        second, _ = solver.solve_recursive({'coherence': 0.4}, depth=8, ethics_level=0.5, memo=memo)
+        
+        assert second['coherence'] == first['coherence']
+        assert [level.solves for level in second['levels']] == [0] * 8 + [1]
+    
+    def test_depth_beyond_recursion_limit(self):
+        """Test that deep trees are evaluated without Python recursion."""
+        final_state, _ = MentorshipSolver().solve_recursive({'coherence': 0.4}, depth=3000)
+        
+        assert final_state['converged'] is True
+        assert len(final_state['levels']) == 3001
+    
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        solver = MentorshipSolver()
+        with pytest.raises(ValueError):
+            solver.solve_recursive({'coherence': 0.4}, depth=2, ethics_level=1.5)
+        with pytest.raises(ValueError):
+            solver.solve_recursive({'coherence': 0.4}, depth=-1)
+        with pytest.raises(ValueError):
+            solver.solve_recursive({'coherence': 0.4}, depth=2, branching=0)
+
+
+class TestMultiThresholdSolving:
+    """Test single-pass solving for several thresholds and iteration caps."""
+    
+    THRESHOLDS = [0.01, 0.001, 0.0001, 1e-6]
+    CAPS = [2, 5, 100]
+    
+    @pytest.mark.parametrize('dtype', ['float64', 'float32'])
+    def test_matches_separate_solves(self, dtype):
+        """Test that every setting equals a separate solve."""
+        solver = MentorshipSolver()
+        for depth in range(0, 4):
+            for ethics_level in (0.2, 0.5, 0.8):
+                results = solver.solve_multi(
+                    {'coherence': 0.3}, self.THRESHOLDS, self.CAPS,
+                    depth=depth, ethics_level=ethics_level, dtype=dtype
+                )
+                
+                assert set(results) == {(t, c) for t in self.THRESHOLDS for c in self.CAPS}
+                for (threshold, cap), outcome in results.items():
+                    separate = MentorshipSolver(converge_threshold=threshold, max_iterations=cap)
+                    assert outcome == separate.solve(
+                        {'coherence': 0.3}, depth=depth, ethics_level=ethics_level, dtype=dtype
+                    )
+    
+    def test_iterates_once(self):
+        """Test that the operator cycle runs once, to the strictest threshold."""
+        resonate = CountingResonateStrategy()
+        solver = MentorshipSolver(operators=OperatorBundle(resonate=resonate))
+        
+        results = solver.solve_multi({'coherence': 0.3}, self.THRESHOLDS, depth=3, ethics_level=0.8)
+        
+        assert resonate.calls == results[(1e-6, 100)][1]
+    
+    def test_default_cap_is_max_iterations(self):
+        """Test that the solver's max_iterations is the default cap."""
+        results = MentorshipSolver(max_iterations=7).solve_multi({'coherence': 0.3}, [1e-12], depth=2)
+        
+        assert results[(1e-12, 7)][0]['converged'] is False
+        assert results[(1e-12, 7)][1] == 7
+    
+    def test_batch_and_grid_forms(self):
+        """Test that batch and grid forms match their single-setting versions."""
+        solver = MentorshipSolver()
+        params = {'resonate.resonance_factor': [0.5, 0.9, 0.9]}
+        batches = solver.solve_batch_multi(
+            [0.3, 0.4, 0.5], [1, 2, 3], [0.2, 0.5, 0.8], self.THRESHOLDS, self.CAPS, params=params
+        )
+        grids = solver.grid_experiments_multi(self.THRESHOLDS, self.CAPS)
+        
+        for threshold, cap in batches:
+            separate = MentorshipSolver(converge_threshold=threshold, max_iterations=cap)
+            assert batches[(threshold, cap)] == separate.solve_batch(
+                [0.3, 0.4, 0.5], [1, 2, 3], [0.2, 0.5, 0.8], params=params
+            )
+            assert grids[(threshold, cap)] == separate.grid_experiments()
+    
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        solver = MentorshipSolver()
+        with pytest.raises(ValueError):
+            solver.solve_multi({'coherence': 0.3}, [], depth=2)
+        with pytest.raises(ValueError):
+            solver.solve_multi({'coherence': 0.3}, [0.01], [-1], depth=2)
+        with pytest.raises(ValueError):
+            solver.solve_multi({'coherence': 0.3}, [0.01], depth=2, ethics_level=2.0)
+
+
+class TestDeadlines:
+    """Test time-budgeted (anytime) solving."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = SteppingClock()
+        monkeypatch.setattr(mentorship_solver, 'time', SimpleNamespace(perf_counter=clock))
+        return clock
+    
+    def test_ample_budget_matches_plain_solves(self):
+        """Test that a budget that is never spent changes no results."""
+        solver = MentorshipSolver()
+        state, iterations = solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8, time_budget=60)
+        plain = solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8)
+        batch = solver.solve_batch([0.3, 0.5, 0.4], [0, 2, 3], [0.5, 0.2, 0.8], time_budget=60)
+        grid = solver.grid_experiments(range(0, 3), (0.2, 0.8), time_budget=60)
+        
+        assert state.pop('deadline_hit') is False
+        assert state.pop('residual') < solver.converge_threshold
+        assert (state, iterations) == plain
+        assert batch.pop('deadline_hit') == [False, False, False]
+        assert batch.pop('residual')[0] == 0.0
+        assert batch == solver.solve_batch([0.3, 0.5, 0.4], [0, 2, 3], [0.5, 0.2, 0.8])
+        for result in grid:
+            assert result.pop('deadline_hit') is False
+            del result['residual']
+        assert grid == solver.grid_experiments(range(0, 3), (0.2, 0.8))
+    
+    def test_deadline_returns_best_so_far(self, clock):
+        """Test that a spent budget returns the last state reached."""
+        solver = MentorshipSolver(converge_threshold=0.0)
+        # Start at t=1, deadline t=3.5; the third clock check (t=4) is late.
+        state, iterations = solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8, time_budget=2.5)
+        
+        assert iterations == 3 * MentorshipSolver.deadline_check_interval == 24
+        assert state['deadline_hit'] is True
+        assert state['converged'] is False
+        assert 'audit_valid' in state
+        before, _ = MentorshipSolver(converge_threshold=0.0, max_iterations=23).solve(
+            {'coherence': 0.3}, depth=3, ethics_level=0.8
+        )
+        after, _ = MentorshipSolver(converge_threshold=0.0, max_iterations=24).solve(
+            {'coherence': 0.3}, depth=3, ethics_level=0.8
+        )
+        assert state['coherence'] == after['coherence']
+        assert state['residual'] == abs(after['coherence'] - before['coherence'])
+    
+    def test_clock_check_interval(self, clock):
+        """Test that the clock is read once per deadline_check_interval iterations."""
+        solver = MentorshipSolver(converge_threshold=0.0, max_iterations=40)
+        solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8, time_budget=1000)
+        
+        # One read for the start, then one after every slice but the last.
+        assert clock.calls == 1 + 40 // 8 - 1
+        
+        solver.deadline_check_interval = 5
+        clock.calls = 0
+        _, iterations = solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8, time_budget=2.5)
+        assert iterations == 15
+    
+    def test_batch_prioritises_lanes_closest_to_convergence(self, clock):
+        """Test that the budget goes to the lane that can still converge."""
+        solver = MentorshipSolver()
+        solver.deadline_check_interval = 4
+        
+        # Six slices fit the budget: one for each lane, then three more for
+        # the lane converging after 16 iterations.
+        batch = solver.solve_batch(
+            [0.4, 0.4, 0.4], [3, 3, 3], [0.8, 0.8, 0.8],
+            params={'converge_threshold': [0.0, 0.0, 0.001]},
+            time_budget=6.5
+        )
+        
+        assert batch['deadline_hit'] == [True, True, False]
+        assert batch['converged'] == [False, False, True]
+        assert batch['iterations'] == [4, 4, 16]
+        assert batch['residual'][2] < 0.001 < batch['residual'][0]
+    
+    def test_lanes_never_reached_keep_their_initial_state(self):
+        """Test that a budget spent before the first slice still returns every lane."""
+        batch = MentorshipSolver().solve_batch([0.3, 0.4], [0, 2], [0.5, 0.5], time_budget=0)
+        
+        assert batch['final_coherence'] == [0.3, 0.4]
+        assert batch['iterations'] == [0, 0]
+        assert batch['converged'] == [True, False]
+        assert batch['deadline_hit'] == [False, True]
+    
+    def test_multi_threshold_deadline(self, clock):
+        """Test that settings still running at the deadline share the cut-off state."""
+        solver = MentorshipSolver()
+        results = solver.solve_multi(
+            {'coherence': 0.3}, [0.01, 1e-12], [5, 100], depth=3, ethics_level=0.8, time_budget=1.5
+        )
+        
+        assert results[(0.01, 5)][0]['deadline_hit'] is False
+        assert results[(1e-12, 5)][0]['deadline_hit'] is False
+        state, iterations = results[(1e-12, 100)]
+        assert (state['deadline_hit'], state['converged'], iterations) == (True, False, 16)
+    
+    def test_recursive_deadline_leaves_memo_untouched(self):
+        """Test that a tree cut off by the deadline is not memoized."""
+        solver = MentorshipSolver()
+        memo = {}
+        state, _ = solver.solve_recursive({'coherence': 0.4}, 4, 0.6, memo=memo, time_budget=0)
+        
+        assert state['deadline_hit'] is True
+        assert memo == {}
+        
+        state, _ = solver.solve_recursive({'coherence': 0.4}, 4, 0.6, memo=memo, time_budget=60)
+        assert state['deadline_hit'] is False
+        assert len(memo) == 4
+    
+    def test_invalid_budgets(self):
+        """Test time_budget validation."""
+        solver = MentorshipSolver()
+        with pytest.raises(ValueError, match="time_budget"):
+            solver.solve({'coherence': 0.3}, depth=2, time_budget=-1)
+        with pytest.raises(ValueError, match="time_budget"):
+            solver.solve_batch([0.3], [2], [0.5], time_budget=-1)
+        with pytest.raises(ValueError, match="backend"):
+            solver.solve_batch([0.3], [2], [0.5], backend=object(), time_budget=1)
+        with pytest.raises(ValueError, match="continuation store"):
+            MentorshipSolver(continuation_store=ContinuationStore()).solve_batch(
+                [0.3], [2], [0.5], time_budget=1
+            )
+
+
+class SteppingClock:
+    """perf_counter stand-in that advances one second per reading."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        return float(self.calls)
+
+
+@dataclass
+class CountingResonateStrategy(ResonateStrategy):
+    """ResonateStrategy that counts how often it is applied."""
+    
+    calls: int = 0
+    
+    def apply(self, state, context):
+        self.calls += 1
+        return super().apply(state, context)
+
+
+@dataclass
+class CountingAuditStrategy(AuditStrategy):
+    """AuditStrategy that counts how often it is applied."""
+    
+    reads: ClassVar[FrozenSet[str]] = AuditStrategy.reads
+    writes: ClassVar[FrozenSet[str]] = AuditStrategy.writes
+    
+    calls: int = 0
+    
+    def apply(self, state, context):
+        self.calls += 1
+        return super().apply(state, context)
+
+
+@dataclass
+class FeedbackAuditStrategy(AuditStrategy):
+    """AuditStrategy subclass that feeds back into coherence without redeclaring."""
+    
+    def apply(self, state, context):
+        state = super().apply(state, context)
+        return {**state, 'coherence': state['coherence'] * 0.9}
+
+
+@dataclass
+class ObservingAdaptStrategy(AdaptStrategy):
+    """Adapt strategy that leaves coherence alone."""
+    
+    reads: ClassVar[FrozenSet[str]] = frozenset({'coherence'})
+    writes: ClassVar[FrozenSet[str]] = frozenset({'adaptation_applied'})
+    
+    def apply(self, state, context):
+        return {**state, 'adaptation_applied': True}
+
+
+class UndeclaredMeasureStrategy:
+    """Measure strategy without reads/writes declarations."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def apply(self, state, context):
+        self.calls += 1
+        return {**state, 'measured_coherence': state['coherence']}
+
+
+class TestExecutionPlan:
+    """Test dependency-aware scheduling of observation-only strategies."""
+    
+    def test_default_plan_defers_audit(self):
+        """Test that Audit is observation-only and Measure keeps its position."""
+        ops = OperatorBundle()
+        plan = build_execution_plan(ops)
+        
+        assert plan.loop == (ops.resonate, ops.measure, ops.adapt)
+        assert plan.deferred == (ops.audit,)
+    
+    def test_measure_sees_coherence_before_adapt(self):
+        """Test that measured_coherence keeps its every-iteration value."""
+        final_state, _ = MentorshipSolver().solve({'coherence': 0.4}, depth=1, ethics_level=0.2)
+        
+        assert final_state['measured_coherence'] == pytest.approx(0.5693317047, abs=1e-10)
+    
+    def test_measure_is_deferred_when_nothing_later_writes_its_reads(self):
+        """Test that Measure is deferred once Adapt no longer writes coherence."""
+        ops = OperatorBundle(adapt=ObservingAdaptStrategy())
+        
+        assert build_execution_plan(ops).loop == (ops.resonate,)
+    
+    def test_subclass_overriding_apply_is_undeclared(self):
+        """Test that inherited declarations do not describe an overridden apply."""
+        ops = OperatorBundle(audit=FeedbackAuditStrategy())
+        
+        assert declared_dependencies(ops.audit) is None
+        assert build_execution_plan(ops).deferred == ()
+    
+    def test_observers_run_once_on_final_state(self):
+        """Test that deferred strategies run once and see the final coherence."""
+        audit = CountingAuditStrategy()
+        solver = MentorshipSolver(operators=OperatorBundle(audit=audit))
+        
+        final_state, iterations = solver.solve({'coherence': 0.3}, depth=3, ethics_level=0.8)
+        expected = AuditStrategy().apply(final_state, {'ethics_level': 0.8})
+        
+        assert iterations > 1
+        assert audit.calls == 1
+        assert final_state['audit_score'] == expected['audit_score']
+        assert final_state['audit_valid'] == expected['audit_valid']
+    
+    def test_undeclared_strategy_keeps_every_iteration_behaviour(self):
+        """Test that undeclared strategies force every strategy into the loop."""
+        measure = UndeclaredMeasureStrategy()
+        audit = CountingAuditStrategy()
+        solver = MentorshipSolver(operators=OperatorBundle(measure=measure, audit=audit))
+        
+        _, iterations = solver.solve({'coherence': 0.3}, depth=2, ethics_level=0.5)
+        
+        assert solver.execution_plan().deferred == ()
+        assert measure.calls == iterations
+        assert audit.calls == iterations
+    
+    def test_checkpoints_record_observations(self):
+        """Test that requested checkpoints capture observed fields."""
+        solver = MentorshipSolver()
+        final_state, iterations = solver.solve(
+            {'coherence': 0.3}, depth=2, ethics_level=0.5, checkpoints=[1, 2, 10_000]
+        )
+        
+        assert set(final_state['checkpoints']) == {1, 2}
+        first = final_state['checkpoints'][1]
+        assert set(first) == {'audit_applied', 'audit_valid', 'audit_score'}
+        assert first['audit_score'] < final_state['audit_score']
+    
+    def test_replacing_a_strategy_rebuilds_the_plan(self):
+        """Test that the cached plan follows bundle changes."""
+        solver = MentorshipSolver()
+        assert len(solver.execution_plan().deferred) == 1
+        
+        solver.operators.measure = UndeclaredMeasureStrategy()
+        assert solver.execution_plan().deferred == ()
@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
 import pytest
 
+import phononomics_solver
 from phononomics_solver import PhononomicsConfig, PhononomicsSolver
 
 
@@ -48,3 +51,94 @@ class TestPhononomicsSolver:
         solver = PhononomicsSolver()
         with pytest.raises(ValueError):
             solver.solve("invalid", depth=-1)
+
+    def test_solve_batch_matches_solve(self):
+        solver = PhononomicsSolver()
+        batch = solver.solve_batch(
+            "scenario", [0.84, 0.95], [3, 5], params={"audit_error": [0.10, 0.0]}
+        )
+
+        tuned = PhononomicsSolver(PhononomicsConfig(audit_error=0.0)).solve("scenario", ethics_level=0.95, depth=5)
+        assert batch["final_coherence"] == [0.634, tuned["final_coherence"]]
+        assert batch["converged"] == [False, tuned["converged"]]
+
+    def test_solve_batch_rejects_ragged_columns(self):
+        with pytest.raises(ValueError):
+            PhononomicsSolver().solve_batch("scenario", [0.5, 0.6], [1])
+
+
+class SteppingClock:
+    """perf_counter stand-in that advances one second per reading."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return float(self.calls)
+
+
+class TestDeadlines:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = SteppingClock()
+        monkeypatch.setattr(phononomics_solver, "time", SimpleNamespace(perf_counter=clock))
+        return clock
+
+    def test_ample_budget_matches_plain_runs(self):
+        solver = PhononomicsSolver()
+        result = solver.solve("scenario", ethics_level=0.95, depth=5, time_budget=60)
+        batch = solver.solve_batch("scenario", [0.84, 0.95], [3, 5], time_budget=60)
+
+        assert result.pop("deadline_hit") is False
+        assert result.pop("residual") == pytest.approx(0.8 - result["final_coherence"], abs=1e-3)
+        assert result == solver.solve("scenario", ethics_level=0.95, depth=5)
+        assert batch.pop("deadline_hit") == [False, False]
+        assert len(batch.pop("residual")) == 2
+        assert batch == solver.solve_batch("scenario", [0.84, 0.95], [3, 5])
+
+    def test_deadline_returns_best_so_far(self, clock):
+        config = PhononomicsConfig(drift_floor=0.0, convergence_threshold=0.0)
+        solver = PhononomicsSolver(config)
+        # Start at t=1, deadline t=2.5; the check after 128 steps (t=3) is late.
+        result = solver.solve("scenario", ethics_level=0.9, depth=1000, time_budget=1.5)
+
+        assert result["deadline_hit"] is True
+        assert result["converged"] is False
+        assert result["residual"] == 0.0
+        assert len(result["path"]) == 1 + 2 * PhononomicsSolver.deadline_check_interval
+        cut = solver.solve("scenario", ethics_level=0.9, depth=128)
+        assert result["final_coherence"] == cut["final_coherence"]
+
+    def test_clock_check_interval(self, clock):
+        solver = PhononomicsSolver(PhononomicsConfig(drift_floor=0.0))
+        solver.deadline_check_interval = 10
+        solver.solve("scenario", ethics_level=0.9, depth=100, time_budget=1000)
+
+        # One read for the start, then one before every tenth step but the first.
+        assert clock.calls == 1 + 9
+
+    def test_batch_finishes_the_shortest_lanes_first(self, clock):
+        config = PhononomicsConfig(drift_floor=0.0, convergence_threshold=0.0)
+        solver = PhononomicsSolver(config)
+        solver.deadline_check_interval = 64
+
+        # Three slices fit the budget: the 10-step lane, then two for the
+        # 100-step lane.
+        batch = solver.solve_batch("scenario", [0.9, 0.9, 0.9, 0.9], [300, 10, 100, 0], time_budget=3.5)
+
+        assert batch["deadline_hit"] == [True, False, False, False]
+        assert batch["converged"] == [False, True, True, True]
+        assert batch["final_coherence"] == [
+            0.9,
+            solver.solve("scenario", ethics_level=0.9, depth=10)["final_coherence"],
+            solver.solve("scenario", ethics_level=0.9, depth=100)["final_coherence"],
+            0.9,
+        ]
+
+    def test_invalid_budgets(self):
+        solver = PhononomicsSolver()
+        with pytest.raises(ValueError, match="time_budget"):
+            solver.solve("scenario", time_budget=-1)
+        with pytest.raises(ValueError, match="backend"):
+            solver.solve_batch("scenario", [0.5], [1], backend=object(), time_budget=1)
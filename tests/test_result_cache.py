@@ -0,0 +1,202 @@
+import math
+import multiprocessing
+
+from mentorship_solver import ContinuationStore, MentorshipSolver, create_default_solver
+from phononomics_solver import PhononomicsConfig, PhononomicsSolver
+from result_cache import ResultCache, code_fingerprint
+from shared_memory_backend import SharedMemoryBackend
+from solver_metrics import SolverMetrics
+from sweep_shards import GridSweepSpec, ShardCoordinator, run_worker
+
+
+def count_solves(monkeypatch, cls):
+    lanes = []
+    original = cls._solve_lanes
+
+    def counting(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        lanes.append(len(next(iter(result.values()))))
+        return result
+
+    monkeypatch.setattr(cls, "_solve_lanes", counting)
+    return lanes
+
+
+def solve_grid_with_cache(path):
+    solver = MentorshipSolver(cache=ResultCache(path))
+    return solver.grid_experiments(range(0, 6), (0.1, 0.3, 0.5, 0.7, 0.9))
+
+
+def assert_columns_equal(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name in expected:
+        for a, b in zip(actual[name], expected[name]):
+            assert a == b or (math.isnan(a) and math.isnan(b))
+
+
+class TestMentorshipCache:
+    def test_second_run_is_served_from_cache(self, tmp_path, monkeypatch):
+        solved = count_solves(monkeypatch, MentorshipSolver)
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        solver = MentorshipSolver(cache=cache)
+
+        first = solver.grid_experiments()
+        second = solver.grid_experiments()
+
+        assert solved == [12]
+        assert first == second == create_default_solver().grid_experiments()
+        assert len(cache) == 12
+
+    def test_cache_persists_across_instances(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.sqlite"
+        MentorshipSolver(cache=ResultCache(path)).grid_experiments()
+        solved = count_solves(monkeypatch, MentorshipSolver)
+
+        MentorshipSolver(cache=ResultCache(path)).grid_experiments()
+
+        assert solved == []
+
+    def test_only_missing_lanes_are_solved(self, tmp_path, monkeypatch):
+        solver = MentorshipSolver(cache=ResultCache(tmp_path / "cache.sqlite"))
+        solver.solve_batch([0.4, 0.4], [1, 2], [0.5, 0.5])
+        solved = count_solves(monkeypatch, MentorshipSolver)
+
+        batch = solver.solve_batch([0.4, 0.4, 0.4], [1, 2, 3], [0.5, 0.5, 0.5])
+
+        assert solved == [1]
+        assert_columns_equal(batch, MentorshipSolver().solve_batch([0.4, 0.4, 0.4], [1, 2, 3], [0.5, 0.5, 0.5]))
+
+    def test_configuration_and_parameters_are_part_of_the_key(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        args = ([0.3, 0.3], [2, 2], [0.6, 0.6])
+        params = {"resonate.resonance_factor": [0.5, 0.9]}
+
+        MentorshipSolver(cache=cache).solve_batch(*args)
+        MentorshipSolver(cache=cache, max_iterations=3).solve_batch(*args)
+        cached = MentorshipSolver(cache=cache).solve_batch(*args, params=params)
+
+        # Identical lanes share one entry.
+        assert len(cache) == 4
+        assert_columns_equal(cached, MentorshipSolver().solve_batch(*args, params=params))
+
+    def test_dtype_is_part_of_the_key(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        solver = MentorshipSolver(cache=cache)
+
+        solver.solve_batch([0.4], [2], [0.5])
+        compact = solver.solve_batch([0.4], [2], [0.5], dtype="float32")
+
+        assert len(cache) == 2
+        assert compact == MentorshipSolver().solve_batch([0.4], [2], [0.5], dtype="float32")
+
+    def test_continuation_runs_bypass_the_cache(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        solver = MentorshipSolver(cache=cache, continuation_store=ContinuationStore())
+
+        batch = solver.solve_batch([0.4], [2], [0.5])
+
+        assert "warm_started" in batch
+        assert len(cache) == 0
+
+    def test_backend_solves_only_misses(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        solver = MentorshipSolver(cache=cache)
+
+        shared = solver.grid_experiments(backend=SharedMemoryBackend(processes=2))
+
+        assert shared == create_default_solver().grid_experiments()
+        assert len(cache) == 12
+
+    def test_metrics_count_hits_and_misses(self, tmp_path):
+        metrics = SolverMetrics()
+        solver = MentorshipSolver(cache=ResultCache(tmp_path / "cache.sqlite"), metrics=metrics)
+
+        solver.solve_batch([0.4, 0.4], [1, 2], [0.5, 0.5])
+        solver.solve_batch([0.4, 0.4, 0.4], [1, 2, 3], [0.5, 0.5, 0.5])
+
+        children = metrics._for("mentorship")
+        assert children.cache_hits.value == 2
+        assert children.cache_misses.value == 3
+
+    def test_concurrent_processes_share_one_database(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        with multiprocessing.get_context().Pool(3) as pool:
+            results = pool.map(solve_grid_with_cache, [path] * 3)
+
+        assert results[0] == results[1] == results[2]
+        assert len(ResultCache(path)) == 30
+
+
+class TestPhononomicsCache:
+    def test_second_run_is_served_from_cache(self, tmp_path, monkeypatch):
+        solved = count_solves(monkeypatch, PhononomicsSolver)
+        solver = PhononomicsSolver(cache=ResultCache(tmp_path / "cache.sqlite"))
+        ethics, depths = [0.2, 0.84, 0.95], [3, 6, 9]
+
+        first = solver.solve_batch("nightly", ethics, depths)
+        second = solver.solve_batch("renamed", ethics, depths)
+
+        assert solved == [3]
+        assert first == second == PhononomicsSolver().solve_batch("nightly", ethics, depths)
+
+    def test_config_is_part_of_the_key(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+
+        PhononomicsSolver(cache=cache).solve_batch("s", [0.9], [4])
+        strict = PhononomicsSolver(PhononomicsConfig(convergence_threshold=0.99), cache=cache)
+
+        assert strict.solve_batch("s", [0.9], [4])["converged"] == [False]
+        assert len(cache) == 2
+
+
+class TestEviction:
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite", max_entries=2)
+        cache.put_many({"a": {"v": 1}})
+        cache.put_many({"b": {"v": 2}})
+        cache.get_many(["a"])
+        cache.put_many({"c": {"v": 3}})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_max_bytes_bounds_stored_size(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite", max_bytes=200)
+        for index in range(20):
+            cache.put_many({f"key-{index}": {"payload": "x" * 40}})
+
+        assert cache.size_bytes() <= 200
+        assert "key-19" in cache.get_many(["key-19"])
+
+    def test_clear(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        cache.put_many({"a": {"v": 1}})
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestKeys:
+    def test_code_fingerprint_depends_on_modules(self):
+        assert code_fingerprint(MentorshipSolver) == code_fingerprint(MentorshipSolver())
+        assert code_fingerprint(MentorshipSolver) != code_fingerprint(PhononomicsSolver)
+
+    def test_bulk_lookup_handles_many_keys(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.sqlite")
+        entries = {f"k{index}": {"v": index} for index in range(1200)}
+        cache.put_many(entries)
+
+        assert cache.get_many(list(entries)) == entries
+
+
+def test_sweep_workers_reuse_cache(tmp_path, monkeypatch):
+    spec = GridSweepSpec(depths=[0, 1, 2, 3], ethics_levels=[0.2, 0.5, 0.8])
+    cache_path = str(tmp_path / "cache.sqlite")
+    for run in ("first", "second"):
+        coordinator = ShardCoordinator(str(tmp_path / run))
+        coordinator.publish(spec, shard_size=4)
+        if run == "second":
+            solved = count_solves(monkeypatch, MentorshipSolver)
+        run_worker(str(tmp_path / run), "w", cache_path=cache_path)
+
+    assert solved == []
+    assert ShardCoordinator(str(tmp_path / "second")).merge() == create_default_solver().grid_experiments()
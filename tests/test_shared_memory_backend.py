@@ -0,0 +1,153 @@
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+
+from mentorship_solver import MentorshipSolver, OperatorBundle, create_default_solver
+from phononomics_solver import PhononomicsSolver
+from shared_memory_backend import ColumnBlock, SharedMemoryBackend
+
+
+@dataclass
+class ExplodingAdaptStrategy:
+    limit: float = 0.5
+
+    def apply(self, state, context):
+        if context["ethics_level"] > self.limit:
+            raise RuntimeError("adaptation failed")
+        return state
+
+
+@dataclass
+class SlowMeasureStrategy:
+    delay: float = 0.05
+
+    def apply(self, state, context):
+        time.sleep(self.delay)
+        return state
+
+
+def refuse_unpickling():
+    raise RuntimeError("cannot rebuild solver in worker")
+
+
+class UnpicklableInWorker(MentorshipSolver):
+    """Solver that pickles in the parent but fails to load in a worker."""
+
+    def __reduce__(self):
+        return refuse_unpickling, ()
+
+
+@pytest.fixture
+def created_segments(monkeypatch):
+    names = []
+    original = ColumnBlock.create.__func__
+
+    def tracking_create(cls, layout, length):
+        block = original(cls, layout, length)
+        names.append(block.segment.name)
+        return block
+
+    monkeypatch.setattr(ColumnBlock, "create", classmethod(tracking_create))
+    return names
+
+
+def assert_unlinked(names):
+    assert names
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class TestSharedMemoryBackend:
+    def test_grid_experiments_match_in_process(self, created_segments):
+        solver = create_default_solver()
+        backend = SharedMemoryBackend(processes=2, chunk_size=4)
+
+        assert solver.grid_experiments(backend=backend) == solver.grid_experiments()
+        assert_unlinked(created_segments)
+
+    def test_mentorship_parameter_columns(self):
+        solver = MentorshipSolver()
+        params = {"resonate.resonance_factor": [0.5, 0.9, 0.5], "max_iterations": [2, 100, 100]}
+        args = ([0.3, 0.3, 0.3], [2, 2, 2], [0.6, 0.6, 0.6])
+
+        shared = solver.solve_batch(*args, params=params, backend=SharedMemoryBackend(processes=2))
+        local = solver.solve_batch(*args, params=params)
+
+        assert shared == {name: local[name] for name in shared}
+        assert shared["iterations"][0] == 2
+        assert shared["converged"][0] is False
+
+    def test_phononomics_batch_matches_solve(self):
+        solver = PhononomicsSolver()
+        ethics_levels = [0.6, 0.84, 0.95, 1.0]
+        depths = [1, 3, 5, 8]
+
+        batch = solver.solve_batch(
+            "pilot", ethics_levels, depths, backend=SharedMemoryBackend(processes=2, chunk_size=1)
+        )
+
+        for lane, (ethics_level, depth) in enumerate(zip(ethics_levels, depths)):
+            single = solver.solve("pilot", ethics_level=ethics_level, depth=depth)
+            assert batch["final_coherence"][lane] == single["final_coherence"]
+            assert batch["sonic_score"][lane] == single["sonic_score"]
+            assert batch["converged"][lane] is single["converged"]
+
+    def test_worker_failure_releases_segments(self, created_segments):
+        solver = MentorshipSolver(operators=OperatorBundle(adapt=ExplodingAdaptStrategy()))
+
+        with pytest.raises(RuntimeError, match="adaptation failed"):
+            solver.solve_batch(
+                [0.4] * 4, [1] * 4, [0.2, 0.4, 0.6, 0.8], backend=SharedMemoryBackend(processes=2, chunk_size=1)
+            )
+        assert_unlinked(created_segments)
+
+    def test_interrupt_stops_in_flight_ranges_promptly(self, created_segments):
+        solver = MentorshipSolver(
+            converge_threshold=0.0, max_iterations=100, operators=OperatorBundle(measure=SlowMeasureStrategy())
+        )
+        backend = SharedMemoryBackend(processes=2, chunk_size=4)
+        before = set(os.listdir("/dev/shm"))
+        interrupted = []
+
+        def interrupt():
+            interrupted.append(time.perf_counter())
+            signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+
+        # Each four-lane range sleeps for about 20 seconds.
+        timer = threading.Timer(1.0, interrupt)
+        timer.start()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                solver.solve_batch([0.4] * 8, [1] * 8, [0.5] * 8, backend=backend)
+        finally:
+            timer.cancel()
+
+        assert time.perf_counter() - interrupted[0] < 5.0
+        assert_unlinked(created_segments)
+        assert set(os.listdir("/dev/shm")) <= before
+
+    def test_worker_start_failure_breaks_the_pool(self, created_segments):
+        backend = SharedMemoryBackend(processes=2, mp_context="spawn")
+
+        with pytest.raises(BrokenProcessPool):
+            UnpicklableInWorker().solve_batch([0.4] * 4, [1] * 4, [0.5] * 4, backend=backend)
+        assert_unlinked(created_segments)
+
+    def test_spawned_workers_release_their_blocks(self, capfd):
+        backend = SharedMemoryBackend(processes=2, mp_context="spawn")
+
+        batch = MentorshipSolver().solve_batch([0.4] * 4, [1, 2, 3, 4], [0.5] * 4, backend=backend)
+
+        assert batch == MentorshipSolver().solve_batch([0.4] * 4, [1, 2, 3, 4], [0.5] * 4)
+        assert "BufferError" not in capfd.readouterr().err
+
+    def test_empty_batch(self):
+        batch = MentorshipSolver().solve_batch([], [], [], backend=SharedMemoryBackend(processes=2))
+        assert batch["final_coherence"] == []
@@ -0,0 +1,218 @@
+import threading
+import urllib.request
+
+import pytest
+
+from mentorship_solver import MentorshipSolver, create_default_solver
+from phononomics_solver import PhononomicsConfig, PhononomicsSolver
+from shared_memory_backend import SharedMemoryBackend
+from solver_metrics import CONTENT_TYPE, MetricsRegistry, SolverMetrics, render_text, start_http_server
+from sweep_scheduler import ScheduledBackend
+
+
+def sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {line_prefix!r} in\n{text}")
+
+
+class TestRegistry:
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run.", ("kind",))
+        gauge = registry.gauge("depth", "Queue depth.")
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        counter.labels('b"x').inc()
+        gauge.set(5)
+        gauge.dec(2)
+
+        text = render_text(registry)
+
+        assert "# TYPE jobs_total counter" in text
+        assert sample(text, 'jobs_total{kind="a"}') == 3
+        assert sample(text, 'jobs_total{kind="b\\"x"}') == 1
+        assert sample(text, "depth") == 3
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency.", (1, 5, 10))
+        for value in (0.5, 1, 3, 7, 20):
+            histogram.observe(value)
+
+        text = render_text(registry)
+
+        assert sample(text, 'latency_bucket{le="1"}') == 2
+        assert sample(text, 'latency_bucket{le="5"}') == 3
+        assert sample(text, 'latency_bucket{le="10"}') == 4
+        assert sample(text, 'latency_bucket{le="+Inf"}') == 5
+        assert sample(text, "latency_count") == 5
+        assert sample(text, "latency_sum") == 31.5
+
+    def test_thread_shards_are_summed(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits.")
+        histogram = registry.histogram("sizes", "Sizes.", (10,))
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+                histogram.observe(3)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        text = render_text(registry)
+        assert sample(text, "hits_total") == 4000
+        assert sample(text, "sizes_count") == 4000
+
+    def test_finished_threads_fold_into_retired_totals(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits.")
+        histogram = registry.histogram("sizes", "Sizes.", (10,))
+        counter.inc(5)
+
+        def work():
+            counter.inc()
+            histogram.observe(3)
+            histogram.observe(30)
+
+        for _ in range(50):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(counter.labels()._shards._shards) <= 5
+            assert len(histogram.labels()._shards._shards) <= 4
+
+        text = render_text(registry)
+        assert sample(text, "hits_total") == 205
+        assert sample(text, "sizes_count") == 400
+        assert sample(text, 'sizes_bucket{le="10"}') == 200
+        assert len(counter.labels()._shards._shards) == 1
+        assert len(histogram.labels()._shards._shards) == 0
+
+    def test_re_registration_returns_the_same_metric(self):
+        registry = MetricsRegistry()
+
+        assert registry.counter("a_total", "A.") is registry.counter("a_total", "A.")
+        with pytest.raises(ValueError):
+            registry.gauge("a_total", "A.")
+
+    def test_counters_reject_negative_increments(self):
+        with pytest.raises(ValueError):
+            MetricsRegistry().counter("a_total", "A.").inc(-1)
+
+    def test_labels_must_match(self):
+        counter = MetricsRegistry().counter("a_total", "A.", ("solver",))
+
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.labels("x", "y")
+
+
+class TestSolverMetrics:
+    def test_mentorship_solves_are_recorded(self):
+        metrics = SolverMetrics()
+        solver = create_default_solver()
+        solver.metrics = metrics
+
+        results = solver.grid_experiments()
+        text = metrics.render()
+
+        label = '{solver="mentorship"}'
+        assert sample(text, f"terminomics_solves_total{label}") == len(results)
+        assert sample(text, f"terminomics_converged_total{label}") == sum(r["converged"] for r in results)
+        assert sample(text, f"terminomics_audit_valid_total{label}") == sum(r["audit_valid"] for r in results)
+        assert sample(text, f"terminomics_solve_iterations_sum{label}") == sum(r["iterations"] for r in results)
+        assert sample(text, f"terminomics_solve_seconds_count{label}") == len(results)
+        assert sample(text, f'terminomics_batch_size_bucket{{solver="mentorship",le="100"}}') == 1
+
+    def test_overridden_lanes_share_metrics(self):
+        metrics = SolverMetrics()
+        solver = MentorshipSolver(metrics=metrics)
+
+        solver.solve_batch([0.3, 0.3], [2, 2], [0.5, 0.5], params={"max_iterations": [2, 100]})
+
+        assert sample(metrics.render(), 'terminomics_solves_total{solver="mentorship"}') == 2
+
+    def test_backend_lanes_are_recorded_in_parent(self):
+        metrics = SolverMetrics()
+        solver = MentorshipSolver(metrics=metrics)
+
+        batch = solver.solve_batch([0.4] * 6, [0, 1, 2, 3, 4, 5], [0.5] * 6, backend=SharedMemoryBackend(processes=2))
+        text = metrics.render()
+
+        label = '{solver="mentorship"}'
+        assert sample(text, f"terminomics_solves_total{label}") == 6
+        assert sample(text, f"terminomics_solve_iterations_sum{label}") == sum(batch["iterations"])
+        assert sample(text, f"terminomics_solve_seconds_count{label}") == 0
+
+    def test_phononomics_drift_floor_exits(self):
+        metrics = SolverMetrics()
+        solver = PhononomicsSolver(PhononomicsConfig(drift_floor=0.6), metrics=metrics)
+
+        solver.solve("calm", ethics_level=0.95, depth=2)
+        solver.solve("drifting", ethics_level=0.65, depth=8)
+        batch = solver.solve_batch("batch", [0.65, 0.95], [8, 2])
+        text = metrics.render()
+
+        label = '{solver="phononomics"}'
+        assert sample(text, f"terminomics_solves_total{label}") == 4
+        assert sample(text, f"terminomics_drift_floor_exits_total{label}") == 2
+        assert sample(text, f"terminomics_converged_total{label}") == 2 * sum(batch["converged"])
+        assert sample(text, f"terminomics_solve_seconds_count{label}") == 2
+        assert sample(text, f"terminomics_batch_seconds_count{label}") == 1
+
+    def test_drift_exit_on_the_last_step_and_on_backends(self):
+        metrics = SolverMetrics()
+        solver = PhononomicsSolver(PhononomicsConfig(drift_floor=0.6), metrics=metrics)
+
+        # The first step already drops 0.65 below the floor.
+        solver.solve("last-step", ethics_level=0.65, depth=1)
+        in_process = solver.solve_batch("batch", [0.65, 0.95], [1, 1])
+        shared = solver.solve_batch("shared", [0.65, 0.95], [1, 1], backend=SharedMemoryBackend(processes=2))
+
+        assert in_process["drift_exit"] == shared["drift_exit"] == [True, False]
+        label = '{solver="phononomics"}'
+        assert sample(metrics.render(), f"terminomics_drift_floor_exits_total{label}") == 3
+
+    def test_scheduler_queue_depth_drains(self):
+        metrics = SolverMetrics()
+        backend = ScheduledBackend(processes=2, metrics=metrics)
+
+        create_default_solver().solve_batch([0.4] * 8, list(range(8)), [0.5] * 8, backend=backend)
+
+        assert sample(metrics.render(), 'terminomics_queue_depth{backend="scheduled"}') == 0
+
+    def test_cache_counters(self):
+        metrics = SolverMetrics()
+        metrics.record_cache("mentorship", hits=3, misses=1)
+        text = metrics.render()
+
+        assert sample(text, 'terminomics_cache_requests_total{solver="mentorship",result="hit"}') == 3
+        assert sample(text, 'terminomics_cache_requests_total{solver="mentorship",result="miss"}') == 1
+
+
+class TestHttpEndpoint:
+    def test_serves_metrics(self):
+        metrics = SolverMetrics()
+        MentorshipSolver(metrics=metrics).solve({"coherence": 0.4}, depth=2, ethics_level=0.5)
+        server = start_http_server(metrics.registry)
+        try:
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert content_type == CONTENT_TYPE
+        assert sample(body, 'terminomics_solves_total{solver="mentorship"}') == 1
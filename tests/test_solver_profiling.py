@@ -0,0 +1,129 @@
+import cProfile
+import os
+import pstats
+import tracemalloc
+
+import pytest
+
+import run_samples
+import solver_profiling
+from mentorship_solver import MentorshipSolver
+from phononomics_solver import PhononomicsSolver
+from solver_profiling import collapsed_stacks, profile_run
+
+
+class UnavailableProfile(cProfile.Profile):
+    """Profiler that cannot start, as when another tool already profiles the process."""
+
+    def enable(self, *args, **kwargs):
+        raise ValueError("Another profiling tool is already active")
+
+
+def read(path):
+    with open(path, encoding="utf-8") as handle:
+        return handle.read()
+
+
+class TestProfileRun:
+    def test_reports_are_written(self, tmp_path):
+        with profile_run(str(tmp_path), label="solve") as report:
+            MentorshipSolver().grid_experiments(range(0, 4))
+            PhononomicsSolver().solve("scenario", ethics_level=0.9, depth=20)
+
+        assert sorted(os.listdir(tmp_path)) == [
+            "solve-alloc.txt", "solve-hot.txt", "solve.collapsed", "solve.prof"
+        ]
+        assert report.seconds > 0
+        hot = read(report.hot_functions)
+        assert "sorted by tottime" in hot
+        assert "(apply)" in hot
+        assert "(_resonate)" in hot
+        assert "mentorship_solver.py" in read(report.allocations)
+        assert pstats.Stats(report.profile).total_calls > 0
+
+    def test_collapsed_stacks_nest_callers_before_callees(self, tmp_path):
+        with profile_run(str(tmp_path), trace_allocations=False) as report:
+            MentorshipSolver().solve({"coherence": 0.3}, depth=3, ethics_level=0.8)
+
+        assert report.allocations is None
+        lines = read(report.collapsed_stacks).splitlines()
+        assert lines
+        stacks = {}
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            stacks[stack] = int(weight)
+            assert stacks[stack] > 0
+        frames = [stack.split(";") for stack in stacks]
+        assert any(
+            stack[0].startswith("mentorship_solver.py:solve:")
+            and stack[-1].startswith("mentorship_solver.py:apply:")
+            for stack in frames
+        )
+
+    def test_collapsed_stack_time_matches_the_profile(self, tmp_path):
+        with profile_run(str(tmp_path), trace_allocations=False) as report:
+            MentorshipSolver().grid_experiments(range(0, 6))
+
+        stats = pstats.Stats(report.profile)
+        total = sum(collapsed_stacks(stats).values())
+
+        assert total == pytest.approx(stats.total_tt * 1e6, rel=0.05)
+
+    def test_profiles_cannot_be_nested(self, tmp_path):
+        with profile_run(str(tmp_path), label="outer", trace_allocations=False):
+            with pytest.raises(RuntimeError, match="nested"):
+                with profile_run(str(tmp_path), label="inner"):
+                    pass
+
+        with profile_run(str(tmp_path), label="again", trace_allocations=False):
+            pass
+
+    def test_existing_allocation_trace_is_left_running(self, tmp_path):
+        tracemalloc.start()
+        try:
+            with profile_run(str(tmp_path)):
+                MentorshipSolver().solve({"coherence": 0.3}, depth=2)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        with profile_run(str(tmp_path)):
+            pass
+        assert not tracemalloc.is_tracing()
+
+    def test_failed_start_leaves_no_state_behind(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(solver_profiling.cProfile, "Profile", UnavailableProfile)
+
+        with pytest.raises(ValueError, match="already active"):
+            with profile_run(str(tmp_path / "failed")):
+                pass
+
+        assert not tracemalloc.is_tracing()
+        assert os.listdir(tmp_path / "failed") == []
+        monkeypatch.undo()
+        with profile_run(str(tmp_path / "again")) as report:
+            pass
+        assert report.profile is not None
+
+
+class TestRunSamplesProfiling:
+    def test_profile_only_limits_profiling_to_one_phase(self, tmp_path, capsys):
+        run_samples.main(["--profile", str(tmp_path), "--profile-only", "grid"])
+
+        assert sorted(os.listdir(tmp_path)) == [
+            "grid-alloc.txt", "grid-hot.txt", "grid.collapsed", "grid.prof"
+        ]
+        assert "(grid_experiments)" in read(tmp_path / "grid-hot.txt")
+        assert "Hot functions" in capsys.readouterr().out
+
+    def test_profile_covers_every_phase(self, tmp_path, capsys):
+        run_samples.main(["--profile", str(tmp_path)])
+
+        assert {name.split(".")[0].split("-")[0] for name in os.listdir(tmp_path)} == set(run_samples.PHASES)
+
+    def test_no_profile_by_default(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        run_samples.main([])
+
+        assert os.listdir(tmp_path) == []
+        assert "Profiles" not in capsys.readouterr().out
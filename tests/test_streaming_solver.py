@@ -0,0 +1,109 @@
+import pytest
+
+from mentorship_solver import MentorshipSolver
+from streaming_solver import StreamingSolver
+
+
+class TestUpdates:
+    def test_first_tick_solves_cold(self):
+        stream = StreamingSolver(depth=3)
+
+        changed = stream.update(["a", "b"], [0.3, 0.7])
+        expected = MentorshipSolver().solve_batch([0.4, 0.4], [3, 3], [0.3, 0.7])
+
+        assert changed["entity"] == ["a", "b"]
+        assert changed["warm_started"] == [False, False]
+        for name, values in expected.items():
+            assert changed[name] == values
+        assert stream.get("a")["final_coherence"] == expected["final_coherence"][0]
+
+    def test_warm_start_converges_faster_to_the_same_fixed_point(self):
+        stream = StreamingSolver(depth=3)
+        stream.update(["a"], [0.3])
+
+        changed = stream.update(["a"], [0.35])
+        cold = MentorshipSolver().solve_batch([0.4], [3], [0.35])
+
+        assert changed["warm_started"] == [True]
+        assert changed["converged"] == [True]
+        assert changed["iterations"][0] < cold["iterations"][0]
+        assert changed["final_coherence"][0] == pytest.approx(cold["final_coherence"][0], abs=0.01)
+
+    def test_only_changed_entities_are_emitted(self):
+        stream = StreamingSolver(tolerance=0.01)
+        stream.update(["a", "b", "c"], [0.3, 0.5, 0.7])
+
+        changed = stream.update(["a", "b", "c"], [0.305, 0.6, 0.7])
+
+        assert changed["entity"] == ["b"]
+        assert stream.last_report.skipped == 2
+        assert stream.last_report.solved == 1
+
+    def test_repeated_values_are_skipped_by_default(self):
+        stream = StreamingSolver()
+        stream.update(["a", "b"], [0.3, 0.5])
+
+        changed = stream.update(["a", "b"], [0.3, 0.51])
+
+        assert changed["entity"] == ["b"]
+        assert (stream.last_report.solved, stream.last_report.skipped) == (1, 1)
+
+    def test_drift_accumulates_until_it_exceeds_tolerance(self):
+        stream = StreamingSolver(tolerance=0.01)
+        stream.update(["a"], [0.5])
+
+        emitted = [stream.update(["a"], [0.5 + 0.004 * step])["entity"] for step in range(1, 4)]
+
+        assert emitted == [[], [], ["a"]]
+
+    def test_later_update_in_a_tick_wins(self):
+        stream = StreamingSolver()
+
+        changed = stream.update(["a", "a"], [0.2, 0.8])
+
+        assert changed["entity"] == ["a"]
+        assert stream._entities["a"].ethics_level == 0.8
+
+    def test_depth_change_forces_a_solve(self):
+        stream = StreamingSolver(tolerance=0.5)
+        stream.update(["a"], [0.5], depths=[2])
+
+        assert stream.update(["a"], [0.5], depths=[4])["entity"] == ["a"]
+
+    def test_validation(self):
+        stream = StreamingSolver()
+
+        with pytest.raises(ValueError):
+            stream.update(["a"], [1.5])
+        with pytest.raises(ValueError):
+            stream.update(["a", "b"], [0.5])
+        with pytest.raises(ValueError):
+            StreamingSolver(tolerance=-1)
+        assert len(stream) == 0
+
+
+class TestMemoryBounds:
+    def test_ttl_expires_idle_entities(self):
+        stream = StreamingSolver(ttl=2)
+        stream.update(["a", "b"], [0.3, 0.5])
+        stream.update(["b"], [0.5])
+        stream.update(["b"], [0.5])
+
+        assert "a" not in stream
+        assert "b" in stream
+        assert stream.last_report.expired == 1
+
+    def test_max_entities_evicts_least_recently_updated(self):
+        stream = StreamingSolver(max_entities=2)
+        stream.update(["a", "b"], [0.3, 0.5])
+        stream.update(["a"], [0.3])
+        stream.update(["c"], [0.7])
+
+        assert set(stream._entities) == {"a", "c"}
+
+    def test_expired_entities_restart_cold(self):
+        stream = StreamingSolver(ttl=1)
+        stream.update(["a"], [0.3])
+        stream.update(["b"], [0.3])
+
+        assert stream.update(["a"], [0.3])["warm_started"] == [False]
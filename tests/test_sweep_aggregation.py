@@ -0,0 +1,89 @@
+import math
+import statistics
+
+import pytest
+
+from mentorship_solver import create_default_solver
+from phononomics_solver import PhononomicsSolver
+from sweep_aggregation import RunningStats, SweepAggregator
+
+
+@pytest.fixture
+def grid():
+    return create_default_solver().grid_experiments(depth_range=range(0, 6), ethics_range=(0.1, 0.4, 0.7, 1.0))
+
+
+class TestRunningStats:
+    def test_matches_statistics_module(self):
+        values = [1e9 + x for x in (4.0, 7.0, 13.0, 16.0)]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.variance == pytest.approx(statistics.pvariance(values))
+        assert (stats.minimum, stats.maximum) == (min(values), max(values))
+
+    def test_merge_equals_single_stream(self):
+        values = [0.1 * i * i for i in range(50)]
+        whole, left, right = RunningStats(), RunningStats(), RunningStats()
+        for index, value in enumerate(values):
+            whole.add(value)
+            (left if index % 3 else right).add(value)
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.mean == pytest.approx(whole.mean)
+        assert left.variance == pytest.approx(whole.variance)
+        assert (left.minimum, left.maximum) == (whole.minimum, whole.maximum)
+
+
+class TestSweepAggregator:
+    def test_global_summary_matches_naive_passes(self, grid):
+        aggregator = SweepAggregator()
+        aggregator.add_batch(grid)
+        (row,) = aggregator.report()
+
+        assert row["count"] == len(grid)
+        assert row["converged_rate"] == sum(r["converged"] for r in grid) / len(grid)
+        assert row["audit_valid_rate"] == sum(r["audit_valid"] for r in grid) / len(grid)
+        assert row["iterations_mean"] == pytest.approx(sum(r["iterations"] for r in grid) / len(grid))
+        assert sum(row["iterations_histogram"].values()) == len(grid)
+
+    def test_group_by_depth(self, grid):
+        aggregator = SweepAggregator(group_by=("depth",))
+        aggregator.add_batch(grid)
+        report = aggregator.report()
+
+        assert [row["depth"] for row in report] == list(range(6))
+        assert report[0]["iterations_histogram"] == {0: 4}
+        assert all(row["count"] == 4 for row in report)
+
+    def test_partial_aggregates_merge(self, grid):
+        whole = SweepAggregator(group_by=("ethics_level",))
+        whole.add_batch(grid)
+        parts = [SweepAggregator(group_by=("ethics_level",)) for _ in range(3)]
+        for index, row in enumerate(grid):
+            parts[index % 3].add(row)
+        merged = parts[0].merge(parts[1]).merge(parts[2])
+
+        for expected, actual in zip(whole.report(), merged.report()):
+            assert actual["count"] == expected["count"]
+            assert actual["iterations_histogram"] == expected["iterations_histogram"]
+            assert actual["final_coherence_mean"] == pytest.approx(expected["final_coherence_mean"])
+            assert actual["final_coherence_std"] == pytest.approx(expected["final_coherence_std"])
+
+    def test_merge_rejects_mismatched_configuration(self):
+        with pytest.raises(ValueError):
+            SweepAggregator(group_by=("depth",)).merge(SweepAggregator())
+
+    def test_column_batches_and_missing_fields(self):
+        batch = PhononomicsSolver().solve_batch("scenario", [0.6, 0.9, 1.0], [1, 2, 3])
+        aggregator = SweepAggregator(rate_fields=("converged", "audit_valid"))
+        aggregator.add_batch(batch)
+        (row,) = aggregator.report()
+
+        assert row["count"] == 3
+        assert math.isnan(row["audit_valid_rate"])
+        assert math.isnan(row["iterations_mean"])
+        assert row["final_coherence_max"] == max(batch["final_coherence"])
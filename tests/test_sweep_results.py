@@ -0,0 +1,177 @@
+import math
+
+import pytest
+
+from mentorship_solver import (
+    AdaptStrategy,
+    AuditStrategy,
+    MeasureStrategy,
+    MentorshipSolver,
+    OperatorBundle,
+    create_default_solver,
+    declared_dependencies,
+)
+from sweep_results import (
+    ReauditError,
+    StoredResults,
+    load_results,
+    reaudit,
+    save_results,
+    to_columns,
+    to_rows,
+)
+
+
+class CoherenceAuditStrategy(AuditStrategy):
+    """Audit strategy that penalises coherence, i.e. feeds back into the loop."""
+
+    writes = AuditStrategy.writes | {"coherence"}
+
+    def apply(self, state, context):
+        state = super().apply(state, context)
+        return {**state, "coherence": state["coherence"] * 0.99}
+
+
+class UndeclaredFeedbackAuditStrategy(AuditStrategy):
+    """Audit subclass that feeds back into coherence but inherits the base declarations."""
+
+    def apply(self, state, context):
+        state = super().apply(state, context)
+        return {**state, "coherence": state["coherence"] * 0.9}
+
+
+class TrendAuditStrategy(AuditStrategy):
+    """Audit strategy that also reads the measured coherence, which results do not carry per iteration."""
+
+    reads = AuditStrategy.reads | {"measured_coherence"}
+    writes = AuditStrategy.writes
+
+    def apply(self, state, context):
+        state = super().apply(state, context)
+        return {**state, "audit_valid": state["audit_valid"] and state["measured_coherence"] > 0.5}
+
+
+class ObservingAdaptStrategy(AdaptStrategy):
+    """Adapt strategy that leaves coherence alone, so Measure sees the final value."""
+
+    reads = frozenset({"coherence"})
+    writes = frozenset({"adaptation_applied"})
+
+    def apply(self, state, context):
+        return {**state, "adaptation_applied": True}
+
+
+@pytest.fixture
+def grid():
+    return create_default_solver().grid_experiments()
+
+
+class TestResultStorage:
+    def test_rows_and_columns_round_trip(self, grid):
+        assert to_rows(to_columns(grid)) == grid
+
+    def test_save_and_load_round_trip(self, tmp_path, grid):
+        path = tmp_path / "grid.trm"
+        save_results(path, grid, operators=OperatorBundle())
+        stored = load_results(path)
+
+        assert stored.rows() == grid
+        assert stored.provenance["observation_only"] == ["audit"]
+        assert stored.provenance["audit"]["params"] == {"audit_threshold": 0.7}
+
+    def test_batch_columns_round_trip(self, tmp_path):
+        batch = MentorshipSolver().solve_batch([0.3, 0.5], [1, 2], [0.4, 0.9])
+        save_results(tmp_path / "batch.trm", batch)
+
+        assert load_results(tmp_path / "batch.trm").columns == batch
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        with pytest.raises(ValueError, match="not a sweep result file"):
+            load_results(path)
+
+
+class TestReaudit:
+    def test_reaudit_matches_fresh_sweep(self, grid):
+        new_ops = OperatorBundle(audit=AuditStrategy(audit_threshold=1.4))
+        fresh = MentorshipSolver(operators=new_ops).grid_experiments()
+
+        updated = reaudit(grid, audit=new_ops.audit, source_operators=OperatorBundle())
+
+        assert [row["audit_valid"] for row in updated] == [row["audit_valid"] for row in fresh]
+        assert any(row["audit_valid"] != old["audit_valid"] for row, old in zip(updated, grid))
+        assert [row["final_coherence"] for row in updated] == [row["final_coherence"] for row in grid]
+
+    def test_reaudit_batch_columns(self):
+        source = OperatorBundle(adapt=ObservingAdaptStrategy())
+        solver = MentorshipSolver(operators=source)
+        batch = {**solver.solve_batch([0.3, 0.3], [2, 0], [0.5, 0.5]), "ethics_level": [0.5, 0.5]}
+        measure = MeasureStrategy(precision=0.5)
+        audit = AuditStrategy(audit_threshold=0.65)
+
+        updated = reaudit(batch, audit=audit, measure=measure, source_operators=source)
+        fresh = MentorshipSolver(
+            operators=OperatorBundle(adapt=ObservingAdaptStrategy(), measure=measure, audit=audit)
+        ).solve_batch([0.3, 0.3], [2, 0], [0.5, 0.5])
+
+        assert updated["audit_score"][0] == fresh["audit_score"][0]
+        assert updated["measured_coherence"][0] == fresh["measured_coherence"][0]
+        # depth 0 lanes are never audited
+        assert updated["audit_valid"][1] is False
+        assert math.isnan(updated["measured_coherence"][1])
+
+    def test_reaudit_result_file(self, tmp_path, grid):
+        path = tmp_path / "grid.trm"
+        save_results(path, grid, operators=OperatorBundle())
+
+        updated = reaudit(str(path), audit=AuditStrategy(audit_threshold=0.65))
+
+        assert isinstance(updated, StoredResults)
+        assert updated.provenance["audit"]["params"] == {"audit_threshold": 0.65}
+        assert len(updated) == len(grid)
+
+    def test_refuses_feedback_bundle(self, tmp_path):
+        ops = OperatorBundle(audit=CoherenceAuditStrategy())
+        results = MentorshipSolver(operators=ops).grid_experiments()
+        save_results(tmp_path / "feedback.trm", results, operators=ops)
+
+        with pytest.raises(ReauditError, match="feeds back into coherence"):
+            reaudit(tmp_path / "feedback.trm", audit=AuditStrategy(audit_threshold=0.65))
+        with pytest.raises(ReauditError, match="feeds back into coherence"):
+            reaudit(results, audit=AuditStrategy(), source_operators=ops)
+
+    def test_refuses_measure_of_default_bundle(self, grid):
+        with pytest.raises(ReauditError, match="measure strategy"):
+            reaudit(grid, measure=MeasureStrategy(precision=0.5), source_operators=OperatorBundle())
+
+    def test_refuses_unknown_provenance(self, tmp_path, grid):
+        save_results(tmp_path / "grid.trm", grid)
+
+        with pytest.raises(ReauditError, match="source_operators"):
+            reaudit(grid, audit=AuditStrategy(audit_threshold=0.65))
+        with pytest.raises(ReauditError, match="source_operators"):
+            reaudit(tmp_path / "grid.trm", audit=AuditStrategy(audit_threshold=0.65))
+        assert len(reaudit(tmp_path / "grid.trm", audit=AuditStrategy(), source_operators=OperatorBundle())) == len(grid)
+
+    def test_refuses_subclass_feedback_without_declarations(self, grid):
+        ops = OperatorBundle(audit=UndeclaredFeedbackAuditStrategy())
+        results = MentorshipSolver(operators=ops).grid_experiments()
+
+        with pytest.raises(ReauditError, match="feeds back into coherence"):
+            reaudit(results, audit=AuditStrategy(), source_operators=ops)
+        with pytest.raises(ReauditError, match="must declare"):
+            reaudit(grid, audit=UndeclaredFeedbackAuditStrategy(), source_operators=OperatorBundle())
+
+    def test_refuses_feedback_strategy(self, grid):
+        with pytest.raises(ReauditError, match="must not write coherence"):
+            reaudit(grid, audit=CoherenceAuditStrategy())
+
+    def test_refuses_strategy_reading_more_than_coherence(self, grid):
+        assert declared_dependencies(TrendAuditStrategy()) is not None
+        with pytest.raises(ReauditError, match="may read only coherence"):
+            reaudit(grid, audit=TrendAuditStrategy(), source_operators=OperatorBundle())
+
+    def test_requires_a_strategy(self, grid):
+        with pytest.raises(ValueError):
+            reaudit(grid)
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+
+import pytest
+
+from mentorship_solver import MentorshipSolver, OperatorBundle, ResonateStrategy, create_default_solver
+from phononomics_solver import PhononomicsSolver
+from sweep_scheduler import CostModel, ScheduledBackend, pack_longest_first
+
+
+@dataclass
+class ExplodingAdaptStrategy:
+    limit: float = 0.5
+
+    def apply(self, state, context):
+        if context["ethics_level"] > self.limit:
+            raise RuntimeError("adaptation failed")
+        return state
+
+
+class CountingResonateStrategy(ResonateStrategy):
+    calls = 0
+
+    def apply(self, state, context):
+        type(self).calls += 1
+        return super().apply(state, context)
+
+
+class ConstantCostModel(CostModel):
+    """Predicts the same cost for every lane, forcing mispredictions."""
+
+    def predict_mentorship(self, solver, coherence, depth, ethics_level):
+        return 1
+
+
+class TestCostModel:
+    def test_predicts_default_bundle_iterations_exactly(self):
+        solver = create_default_solver()
+        model = CostModel()
+        for coherence in (0.0, 0.4, 0.9):
+            for depth in range(0, 10):
+                for ethics in (0.0, 0.3, 0.7, 1.0):
+                    _, iterations = solver.solve({"coherence": coherence}, depth, ethics)
+                    assert model.predict_mentorship(solver, coherence, depth, ethics) == iterations
+
+    def test_prediction_is_capped_at_max_iterations(self):
+        solver = MentorshipSolver(converge_threshold=1e-12, max_iterations=5)
+
+        assert CostModel().predict_mentorship(solver, 0.1, 8, 0.0) == 5
+
+    def test_every_prediction_respects_max_iterations(self):
+        solver = MentorshipSolver(max_iterations=0)
+        model = CostModel()
+
+        for coherence in (0.0, 0.4, 1.0):
+            assert model.predict_mentorship(solver, coherence, 3, 0.5) == 0
+
+    def test_custom_bundles_are_probed_once_per_depth_and_ethics(self):
+        resonate = CountingResonateStrategy()
+        CountingResonateStrategy.calls = 0
+        solver = MentorshipSolver(operators=OperatorBundle(resonate=resonate))
+        model = CostModel()
+
+        predictions = [model.predict_mentorship(solver, c, 4, 0.7) for c in (0.0, 0.2, 0.4, 0.6, 0.8)]
+        assert resonate.calls == 2
+        model.predict_mentorship(solver, 0.5, 5, 0.7)
+        assert resonate.calls == 4
+
+        actual = [solver.solve({"coherence": c}, 4, 0.7)[1] for c in (0.0, 0.2, 0.4, 0.6, 0.8)]
+        assert predictions == actual
+
+    def test_phononomics_prediction_is_depth(self):
+        assert CostModel().predict_phononomics(PhononomicsSolver(), 0.9, 7) == 7
+
+
+class TestPackLongestFirst:
+    def test_every_lane_is_scheduled_once(self):
+        costs = [1, 50, 3, 3, 20, 1, 1, 8]
+        queues = pack_longest_first(costs, workers=3, chunks_per_worker=2)
+
+        lanes = sorted(lane for queue in queues for chunk in queue for lane in chunk.lanes)
+        assert lanes == list(range(len(costs)))
+
+    def test_expensive_lanes_form_small_chunks(self):
+        costs = [100] + [1] * 100
+        queues = pack_longest_first(costs, workers=2, chunks_per_worker=2)
+
+        chunks = [chunk for queue in queues for chunk in queue]
+        assert any(chunk.lanes == (0,) for chunk in chunks)
+        assert max(len(chunk.lanes) for chunk in chunks) > 1
+
+    def test_queues_are_balanced_and_ordered(self):
+        costs = [float(n % 17 + 1) for n in range(200)]
+        queues = pack_longest_first(costs, workers=4, chunks_per_worker=4)
+
+        loads = [sum(chunk.predicted for chunk in queue) for queue in queues]
+        largest = max(chunk.predicted for queue in queues for chunk in queue)
+        assert max(loads) - min(loads) <= largest
+        for queue in queues:
+            predicted = [chunk.predicted for chunk in queue]
+            assert predicted == sorted(predicted, reverse=True)
+
+    def test_empty_batch(self):
+        assert [list(queue) for queue in pack_longest_first([], workers=2)] == [[], []]
+
+
+class TestScheduledBackend:
+    def test_grid_experiments_match_in_process(self):
+        solver = create_default_solver()
+        backend = ScheduledBackend(processes=2)
+
+        scheduled = solver.grid_experiments(range(0, 8), (0.0, 0.2, 0.5, 0.8), backend=backend)
+
+        assert scheduled == solver.grid_experiments(range(0, 8), (0.0, 0.2, 0.5, 0.8))
+
+    def test_report_records_predicted_and_actual_iterations(self):
+        solver = create_default_solver()
+        backend = ScheduledBackend(processes=2)
+
+        batch = solver.solve_batch([0.4] * 6, [0, 1, 2, 3, 4, 5], [0.2] * 6, backend=backend)
+        report = backend.last_report
+
+        assert report.actual == batch["iterations"]
+        assert report.predicted == batch["iterations"]
+        assert report.mean_absolute_error == 0.0
+        assert report.exact_fraction == 1.0
+        assert sorted(lane for record in report.chunks for lane in record.lanes) == list(range(6))
+        assert [row["error"] for row in report.rows()] == [0] * 6
+
+    def test_mispredictions_are_absorbed(self):
+        solver = create_default_solver()
+        backend = ScheduledBackend(processes=2, chunks_per_worker=8, cost_model=ConstantCostModel())
+        args = ([0.4] * 40, [n % 10 + 1 for n in range(40)], [0.1] * 40)
+
+        assert solver.solve_batch(*args, backend=backend) == solver.solve_batch(*args)
+        assert backend.last_report.mean_absolute_error > 0
+
+    def test_mentorship_parameter_columns(self):
+        solver = MentorshipSolver()
+        params = {"resonate.resonance_factor": [0.5, 0.9, 0.5], "max_iterations": [2, 100, 100]}
+        args = ([0.3, 0.3, 0.3], [2, 2, 2], [0.6, 0.6, 0.6])
+        backend = ScheduledBackend(processes=2)
+
+        assert solver.solve_batch(*args, params=params, backend=backend) == solver.solve_batch(*args, params=params)
+        assert backend.last_report.predicted[0] == 2
+
+    def test_phononomics_match_in_process(self):
+        solver = PhononomicsSolver()
+        ethics = [0.2, 0.5, 0.84, 0.95, 1.0]
+        depths = [0, 3, 6, 9, 12]
+        backend = ScheduledBackend(processes=2)
+
+        scheduled = solver.solve_batch("schedule", ethics, depths, backend=backend)
+
+        assert scheduled == solver.solve_batch("schedule", ethics, depths)
+        assert backend.last_report.predicted == depths
+        assert backend.last_report.actual == [None] * 5
+
+    def test_worker_failure_is_raised(self):
+        solver = MentorshipSolver(OperatorBundle(adapt=ExplodingAdaptStrategy()))
+
+        with pytest.raises(RuntimeError, match="adaptation failed"):
+            solver.solve_batch([0.3] * 4, [2] * 4, [0.2, 0.4, 0.6, 0.8], backend=ScheduledBackend(processes=2))
+
+    def test_empty_batch(self):
+        backend = ScheduledBackend(processes=2)
+
+        assert create_default_solver().solve_batch([], [], [], backend=backend)["iterations"] == []
+
+    def test_rejects_non_positive_chunks_per_worker(self):
+        with pytest.raises(ValueError):
+            ScheduledBackend(chunks_per_worker=0)
@@ -0,0 +1,138 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from mentorship_solver import MentorshipSolver
+import sweep_shards
+from sweep_shards import GridSweepSpec, IncompleteSweepError, ShardCoordinator, run_worker
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def spec():
+    return GridSweepSpec(depths=[0, 1, 2, 3, 4], ethics_levels=[0.2, 0.5, 0.8])
+
+
+class TestShardCoordinator:
+    def test_publish_is_deterministic(self, tmp_path, spec):
+        assert ShardCoordinator(str(tmp_path / "a")).publish(spec, shard_size=4) == 4
+        assert ShardCoordinator(str(tmp_path / "b")).publish(spec, shard_size=4) == 4
+        assert sorted(p.name for p in (tmp_path / "a" / "pending").iterdir()) == sorted(
+            p.name for p in (tmp_path / "b" / "pending").iterdir()
+        )
+
+    def test_publish_twice_raises(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=4)
+        with pytest.raises(FileExistsError):
+            coordinator.publish(spec, shard_size=4)
+
+    def test_local_worker_processes_match_grid_experiments(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=2)
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, str(ROOT / "sweep_shards.py"), "worker", str(tmp_path), "--worker-id", f"node-{i}"],
+                cwd=ROOT,
+                stdout=subprocess.DEVNULL,
+            )
+            for i in range(3)
+        ]
+        assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+        expected = MentorshipSolver().grid_experiments(depth_range=range(0, 5), ethics_range=(0.2, 0.5, 0.8))
+        assert coordinator.merge() == expected
+        assert coordinator.status() == {"pending": 0, "claimed": 0, "results": 8}
+
+    def test_claims_are_exclusive(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        shards = coordinator.publish(spec, shard_size=4)
+
+        claimed = {coordinator.claim("a").shard for _ in range(shards)}
+        assert claimed == set(range(shards))
+        assert coordinator.claim("b") is None
+
+    def test_merge_reissues_stale_shards(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=8)
+        stale = coordinator.claim("crashed-node", lease_seconds=-1.0)
+        run_worker(str(tmp_path), "healthy-node", max_shards=1)
+
+        with pytest.raises(IncompleteSweepError) as excinfo:
+            coordinator.merge()
+        assert excinfo.value.missing == [stale.shard]
+        assert excinfo.value.reissued == [stale.shard]
+
+        assert run_worker(str(tmp_path), "healthy-node") == 1
+        assert len(coordinator.merge()) == 15
+
+    def test_expired_lease_can_be_taken_over(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=15)
+        first = coordinator.claim("slow-node", lease_seconds=-1.0)
+        second = coordinator.claim("fast-node")
+
+        assert second.shard == first.shard
+        assert "fast-node" in second.path
+
+    def test_renewed_lease_is_not_taken_over(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=15)
+        claim = coordinator.claim("slow-node", lease_seconds=-1.0)
+        expired = claim.path
+
+        assert coordinator.renew(claim, lease_seconds=60.0)
+        assert claim.path != expired and "slow-node" in claim.path
+        assert coordinator.claim("fast-node") is None
+
+        assert coordinator.renew(claim, lease_seconds=-1.0)
+        assert coordinator.claim("fast-node") is not None
+        assert not coordinator.renew(claim)
+
+    def test_worker_heartbeat_outlasts_short_leases(self, tmp_path, spec, monkeypatch):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=15)
+        solve_cells = sweep_shards.solve_cells
+        stolen = []
+
+        def slow_solve_cells(*args):
+            time.sleep(0.3)
+            stolen.append(coordinator.claim("thief", lease_seconds=60.0))
+            return solve_cells(*args)
+
+        monkeypatch.setattr(sweep_shards, "solve_cells", slow_solve_cells)
+
+        assert run_worker(str(tmp_path), "slow-node", lease_seconds=0.06) == 1
+        assert stolen == [None]
+        assert len(coordinator.merge()) == 15
+        assert os.listdir(tmp_path / "claimed") == []
+
+    def test_temporary_files_do_not_collide(self, tmp_path, monkeypatch):
+        replaced = []
+
+        def discard(src, dst):
+            replaced.append(src)
+            os.remove(src)
+
+        monkeypatch.setattr(sweep_shards.os, "replace", discard)
+
+        for _ in range(2):
+            sweep_shards._write_json(str(tmp_path / "shard.json"), {})
+
+        assert len(set(replaced)) == 2
+        assert all(sweep_shards.socket.gethostname() in name for name in replaced)
+
+    def test_merge_validates_row_counts(self, tmp_path, spec):
+        coordinator = ShardCoordinator(str(tmp_path))
+        coordinator.publish(spec, shard_size=15)
+        claim = coordinator.claim("node")
+        coordinator.complete(claim, [])
+
+        with pytest.raises(ValueError, match="has 0 rows"):
+            coordinator.merge()
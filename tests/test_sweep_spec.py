@@ -0,0 +1,143 @@
+import pytest
+
+from mentorship_solver import MentorshipSolver
+from phononomics_solver import PhononomicsConfig, PhononomicsSolver
+from shared_memory_backend import SharedMemoryBackend
+from sweep_spec import SweepResult, SweepSpec
+
+
+def count_configurations(monkeypatch, cls):
+    overrides = []
+    original = cls.with_overrides
+
+    def counting(self, values):
+        # Batch solves call ``with_overrides({})`` for lanes without params.
+        if values:
+            overrides.append(dict(values))
+        return original(self, values)
+
+    monkeypatch.setattr(cls, "with_overrides", counting)
+    return overrides
+
+
+class TestMentorshipSweep:
+    def test_cells_match_individual_solves(self):
+        spec = SweepSpec(
+            axes={
+                "resonance_factor": [0.6, 0.9],
+                "coherence": [0.2, 0.5],
+                "depth": [1, 3],
+                "ethics_level": [0.3, 0.8],
+            }
+        )
+
+        result = spec.run()
+
+        assert len(result) == len(spec) == 16
+        assert result.shape == (2, 2, 2, 2)
+        for cell in spec.cells():
+            solver = MentorshipSolver().with_overrides({"resonate.resonance_factor": cell["resonance_factor"]})
+            expected = solver.solve_batch([cell["coherence"]], [cell["depth"]], [cell["ethics_level"]])
+            row = result[cell]
+            for name, values in expected.items():
+                assert row[name] == values[0]
+
+    def test_each_configuration_is_built_once(self, monkeypatch):
+        built = count_configurations(monkeypatch, MentorshipSolver)
+        spec = SweepSpec(
+            axes={
+                "depth": range(0, 4),
+                "adaptation_rate": [0.05, 0.1, 0.2],
+                "ethics_level": [0.2, 0.9],
+                "converge_threshold": [1e-3, 1e-4],
+            },
+            fixed={"coherence": 0.3},
+        )
+
+        spec.run(batch_size=3)
+
+        assert len(built) == 6
+        assert {(o["adapt.adaptation_rate"], o["converge_threshold"]) for o in built} == {
+            (rate, threshold) for rate in (0.05, 0.1, 0.2) for threshold in (1e-3, 1e-4)
+        }
+
+    def test_default_coherence_matches_grid_experiments(self):
+        spec = SweepSpec(axes={"depth": range(0, 6), "ethics_level": [0.1, 0.5, 0.9]})
+
+        rows = spec.run().rows()
+        grid = MentorshipSolver().grid_experiments(range(0, 6), (0.1, 0.5, 0.9))
+
+        assert [(r["depth"], r["ethics_level"], r["final_coherence"], r["iterations"]) for r in rows] == [
+            (g["depth"], g["ethics_level"], g["final_coherence"], g["iterations"]) for g in grid
+        ]
+
+    def test_fixed_parameters_and_backend(self):
+        spec = SweepSpec(
+            axes={"depth": [1, 2, 3, 4], "ethics_level": [0.4, 0.7]},
+            fixed={"audit.audit_threshold": 0.9, "max_iterations": 5},
+        )
+
+        shared = spec.run(backend=SharedMemoryBackend(processes=2))
+        serial = spec.run()
+
+        assert shared.columns == serial.columns
+        assert max(shared.columns["iterations"]) <= 5
+
+    def test_unknown_names_and_missing_inputs(self):
+        with pytest.raises(ValueError, match="unknown"):
+            SweepSpec(axes={"depth": [1], "ethics_level": [0.5], "speed": [1]}).run()
+        with pytest.raises(ValueError, match="inputs"):
+            SweepSpec(axes={"depth": [1]}).run()
+        with pytest.raises(ValueError):
+            SweepSpec(axes={"depth": []})
+        with pytest.raises(ValueError):
+            SweepSpec(axes={"depth": [1]}, fixed={"depth": 2})
+
+
+class TestPhononomicsSweep:
+    def test_config_axes(self, monkeypatch):
+        built = count_configurations(monkeypatch, PhononomicsSolver)
+        spec = SweepSpec(
+            axes={"drift_floor": [0.0, 0.6], "ethics_level": [0.65, 0.95], "depth": [2, 8]},
+            solver="phononomics",
+        )
+
+        result = spec.run()
+
+        assert len(built) == 2
+        for cell in spec.cells():
+            solver = PhononomicsSolver(PhononomicsConfig(drift_floor=cell["drift_floor"]))
+            expected = solver.solve_batch("s", [cell["ethics_level"]], [cell["depth"]])
+            assert result[cell]["sonic_score"] == expected["sonic_score"][0]
+
+    def test_strategy_names_are_rejected(self):
+        with pytest.raises(ValueError, match="Phononomics"):
+            SweepSpec(axes={"resonance_factor": [0.5]}, solver="phononomics").run()
+
+
+class TestSweepResult:
+    @pytest.fixture
+    def result(self):
+        return SweepResult(
+            {"a": [1, 2], "b": ["x", "y", "z"]},
+            {"value": [10, 11, 12, 20, 21, 22]},
+        )
+
+    def test_indexing(self, result):
+        assert result[{"b": "y", "a": 2}] == {"a": 2, "b": "y", "value": 21}
+        with pytest.raises(KeyError):
+            result[{"a": 3, "b": "x"}]
+        with pytest.raises(KeyError):
+            result[{"a": 1}]
+
+    def test_select(self, result):
+        column = result.select(b="z")
+
+        assert column.axes == {"a": [1, 2]}
+        assert column.columns == {"value": [12, 22]}
+        assert result.select(a=1, b="x").rows() == [{"value": 10}]
+
+    def test_rows_follow_declaration_order(self, result):
+        assert [(r["a"], r["b"]) for r in result.rows()] == [
+            (1, "x"), (1, "y"), (1, "z"), (2, "x"), (2, "y"), (2, "z")
+        ]